@@ -0,0 +1,325 @@
+"""
+calc_backends module
+
+This module provides the numeric backends of the calculator.
+
+A backend decides which number type the calculations are done with. The
+operator kernels of calc_kernels module use only Python operators, so the
+same kernels work with every backend:
+
+    - 'float': Binary floating point numbers. The fastest backend, for bulk
+      work which does not need decimal exactness (e.g. 0.1 + 0.2 gives
+      0.30000000000000004).
+    - 'decimal': decimal.Decimal numbers, the default of the calculator.
+    - 'fraction': fractions.Fraction numbers. Exact for the four basic
+      operations and percentages (e.g. 1 / 3 * 3 gives exactly 1).
+
+Every backend bounds the magnitude of its numbers, so that a hostile input
+such as repeated multiplication of large values overflows into an error
+instead of growing without limit: Decimal operations run in a context made
+by make_context() whose Emax traps Overflow, floats overflow into infinity,
+and Fractions are checked against the same bound as Decimal.
+
+Classes:
+    NumberBackend: A class representing a numeric backend.
+
+Functions:
+    make_context: Return a decimal context with bounded exponents.
+    get_backend: Return a backend by name.
+    int_to_decimal: Convert an int to Decimal in the current context.
+    int_to_text: Return all the decimal digits of an int.
+    to_decimal: Convert a number of any backend to Decimal for display.
+
+Imports:
+    decimal: This module provides functionality for precise arithmetic
+      operations using the Decimal data type from the decimal module.
+    fractions: For the exact Fraction backend.
+    math: For the overflow check of floats.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_backends import get_backend
+    >>> backend = get_backend('fraction')
+    >>> backend.convert('1') / backend.convert('3') * 3
+    Fraction(1, 1)
+"""
+
+# Importing required modules
+import math
+from decimal import (MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal,
+                     DivisionByZero, InvalidOperation, Overflow, getcontext,
+                     localcontext)
+from fractions import Fraction
+
+# Name of the backend used when none is given.
+DEFAULT_BACKEND = 'decimal'
+
+# Default precision (significant digits) and exponent limits of the decimal
+# contexts made by make_context().
+PRECISION = 28
+EMAX = 9999
+EMIN = -9999
+
+# Largest binary magnitude of a Fraction, same as 10 ** (EMAX + 1).
+MAX_FRACTION_BITS = math.ceil((EMAX + 1) * math.log2(10))
+
+# Exceptions raised when a result overflows.
+OVERFLOW_ERRORS = (Overflow, OverflowError)
+
+# Extra digits kept by int_to_decimal() before rounding to the context.
+GUARD_DIGITS = 5
+
+# Context of the exact conversions of int_to_text().
+EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+# Size in bits of the ints converted directly by int_to_text().
+SPLIT_BITS = 4096
+
+
+def make_context(precision=PRECISION, emax=EMAX, emin=EMIN):
+    """
+    Return a decimal context with bounded exponents.
+
+    The context traps Overflow along with DivisionByZero and
+    InvalidOperation, so a result whose exponent is above emax raises
+    decimal.Overflow instead of growing without limit.
+
+    Args:
+        precision (int, optional): Number of significant digits. Defaults to
+            PRECISION.
+        emax (int, optional): Largest exponent. Defaults to EMAX.
+        emin (int, optional): Smallest exponent, below which results lose
+            digits and round to zero. Defaults to EMIN.
+
+    Returns:
+        decimal.Context: The context.
+    """
+    return Context(prec=precision, Emax=emax, Emin=emin,
+                   traps=[DivisionByZero, InvalidOperation, Overflow])
+
+
+class NumberBackend:
+    """
+    A class representing a numeric backend.
+
+    Attributes:
+        name (str): Name of the backend.
+        number_type (type): The number type of the backend.
+        convert (function): Function converting a str, int, float or
+            Decimal to a number of the backend. It raises ValueError for
+            strings which are not numbers.
+        zero (object): Zero of the backend.
+        in_range (function): Function number -> bool telling whether a
+            result is within the bounds of the backend, or None if results
+            out of bounds raise one of OVERFLOW_ERRORS by themselves.
+    """
+
+    __slots__ = ('name', 'number_type', 'convert', 'zero', 'in_range')
+
+    def __init__(self, name, number_type, convert, in_range=None):
+        """
+        Initialize the NumberBackend class.
+
+        Args:
+            name (str): Name of the backend.
+            number_type (type): The number type of the backend.
+            convert (function): Function converting a str, int, float or
+                Decimal to a number of the backend.
+            in_range (function, optional): Function number -> bool telling
+                whether a result is within the bounds of the backend.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.number_type = number_type
+        self.convert = convert
+        self.zero = convert('0')
+        self.in_range = in_range
+
+
+def _to_float(value):
+    """
+    Convert a number or a string to float.
+
+    Args:
+        value (str | int | float | Decimal | Fraction): The value to convert.
+
+    Returns:
+        float: The converted value.
+    """
+    return float(value)
+
+
+def _to_exact(number_type):
+    """
+    Return a converter to an exact number type.
+
+    Floats are converted through their shortest string form, so 0.1 becomes
+    0.1 instead of its exact binary value. Strings which are not numbers
+    raise ValueError, also for Decimal which raises InvalidOperation.
+
+    Args:
+        number_type (type): Either Decimal or Fraction.
+
+    Returns:
+        function: The converter.
+    """
+    def convert(value):
+        if isinstance(value, float):
+            return number_type(str(value))
+        try:
+            return number_type(value)
+        except InvalidOperation:
+            raise ValueError(f'Not a number: {value!r}') from None
+
+    return convert
+
+
+def _fraction_in_range(value):
+    """
+    Tell whether the magnitude of a Fraction is below 2 ** MAX_FRACTION_BITS.
+
+    Args:
+        value (Fraction): The value to check.
+
+    Returns:
+        bool: True if the value is in range.
+    """
+    return (value.numerator.bit_length() - value.denominator.bit_length()
+            < MAX_FRACTION_BITS)
+
+
+# Available backends by name. Decimal results are bounded by the context
+# they are computed in (see make_context()).
+BACKENDS = {'float': NumberBackend('float', float, _to_float,
+                                   in_range=math.isfinite),
+            'decimal': NumberBackend('decimal', Decimal, _to_exact(Decimal)),
+            'fraction': NumberBackend('fraction', Fraction,
+                                      _to_exact(Fraction),
+                                      in_range=_fraction_in_range)}
+
+
+def get_backend(backend=None):
+    """
+    Return a backend by name.
+
+    Args:
+        backend (str | NumberBackend, optional): Name of the backend, or a
+            backend which is returned as is. Defaults to DEFAULT_BACKEND.
+
+    Raises:
+        ValueError: If there is no backend of that name.
+
+    Returns:
+        NumberBackend: The backend.
+    """
+    if isinstance(backend, NumberBackend):
+        return backend
+
+    try:
+        return BACKENDS[backend or DEFAULT_BACKEND]
+    except KeyError:
+        raise ValueError(f'Unknown backend: {backend!r} (expected one of '
+                         f'{", ".join(BACKENDS)})') from None
+
+
+def int_to_decimal(num_value):
+    """
+    Convert an int to Decimal in the current context.
+
+    Converting an int to decimal digits takes a time growing faster than its
+    number of digits, so an int with more digits than the context precision
+    is converted from its leading bits only: the bits beyond precision plus
+    GUARD_DIGITS digits are shifted out, and the shift is multiplied back
+    as a power of two in the context. The digits not shown are never
+    computed, e.g. 3000! (9131 digits) is converted in microseconds.
+
+    Args:
+        num_value (int): The int to convert.
+
+    Returns:
+        Decimal: The int rounded to the precision of the context.
+    """
+    context = getcontext()
+    # 3.33 bits per decimal digit, plus a margin.
+    kept_bits = (context.prec + GUARD_DIGITS) * 10 // 3 + 8
+    shift = abs(num_value).bit_length() - kept_bits
+    if shift <= 0:
+        return context.create_decimal(num_value)
+
+    with localcontext() as guard_context:
+        guard_context.prec += GUARD_DIGITS
+        value = Decimal(num_value >> shift if num_value > 0
+                        else -(-num_value >> shift))
+        value *= Decimal(2) ** shift
+    return +value
+
+
+def int_to_text(num_value):
+    """
+    Return all the decimal digits of an int.
+
+    str() of an int takes a time growing with the square of its number of
+    digits (about 20 seconds for a million digits) and refuses ints of more
+    than sys.get_int_max_str_digits() digits. The int is instead split in
+    halves of bits down to SPLIT_BITS bits, which are converted directly,
+    and joined back as hi * 2 ** k + lo by exact Decimal arithmetic, whose
+    multiplication of large numbers is fast, e.g. a million digits take
+    about half a second.
+
+    Args:
+        num_value (int): The int.
+
+    Returns:
+        str: The digits of the int, with a '-' sign if negative.
+    """
+    powers = {}
+
+    def convert(value, bits):
+        if bits <= SPLIT_BITS:
+            return Decimal(value)
+        low_bits = bits // 2
+        high = value >> low_bits
+        if low_bits not in powers:
+            powers[low_bits] = EXACT_CONTEXT.power(2, low_bits)
+        return EXACT_CONTEXT.fma(convert(high, bits - low_bits),
+                                 powers[low_bits],
+                                 convert(value - (high << low_bits), low_bits))
+
+    magnitude = abs(num_value)
+    text = f'{convert(magnitude, magnitude.bit_length()):f}'
+    return '-' + text if num_value < 0 else text
+
+
+def to_decimal(num_value):
+    """
+    Convert a number of any backend to Decimal for display.
+
+    Floats (and numpy float64) are converted through their shortest string
+    form. Fractions are divided out in the current decimal context, so a
+    repeating fraction such as 1/3 gets the precision of the context, and
+    ints are rounded to it with int_to_decimal().
+
+    Args:
+        num_value (Decimal | float | Fraction | int): The number to convert.
+
+    Returns:
+        Decimal: The converted number.
+    """
+    if isinstance(num_value, Decimal):
+        return num_value
+    if isinstance(num_value, Fraction):
+        if num_value.denominator == 1:
+            return int_to_decimal(num_value.numerator)
+        with localcontext() as context:
+            context.prec += GUARD_DIGITS
+            quotient = (int_to_decimal(num_value.numerator)
+                        / int_to_decimal(num_value.denominator))
+        return +quotient
+    if isinstance(num_value, int):
+        return int_to_decimal(num_value)
+    return Decimal(str(num_value))
@@ -0,0 +1,575 @@
+"""
+calc_batch module
+
+This module provides batch evaluation of the calculator's equal (=) and
+percentage (%) semantics over whole arrays of calculations.
+
+Each calculation is an (accumulator, operator, operand) triple, which is
+the state of CalcEngine right before the equal or percentage button is
+pressed. The operators are evaluated with the same operator kernels of
+calc_kernels module as CalcEngine.do_equal():
+
+    - '+', '-', '*', '/': accumulator <operator> operand.
+    - '%': accumulator / 100 (percentage with no previous operation, the
+      operand is ignored).
+    - '+%', '-%': accumulator +/- accumulator * (operand / 100).
+    - '*%': accumulator * (operand / 100).
+    - '/%': accumulator / operand * 100.
+    - Any other kernel of calc_kernels.OPERATORS (e.g. '^', 'mod') and its
+      percent variant.
+
+The calculations are done with one of the numeric backends of
+calc_backends module: 'float' (numpy float64 arrays when numpy is
+installed), 'decimal' (the calculator's arithmetic) or 'fraction' (exact
+rational arithmetic). Decimal calculations run in the bounded context of
+calc_backends.make_context(), and results out of the bounds of the backend
+are error rows whose result is OVERFLOW.
+
+Functions:
+    evaluate_batch: Evaluate arrays of calculations and return per-row
+        results along with a mask for the error rows.
+    format_batch: Format the results of evaluate_batch() the way they are
+        shown in the primary display of the calculator.
+    evaluate_rows: Evaluate and format a chunk of CSV rows.
+    run_csv_job: Evaluate a CSV job file across a pool of worker processes.
+    main: Command line entry point for CSV job files.
+
+Imports:
+    argparse: For parsing the command line arguments.
+    csv: For reading and writing CSV job files.
+    os: For the number of CPUs.
+    sys: For the standard input, output and error streams.
+    collections: For the queue of pending worker tasks.
+    concurrent.futures: For the pool of worker processes.
+    itertools: For splitting the CSV rows into chunks.
+    numpy (optional): For the float64 fast path and the object arrays of
+      the other backends. Without numpy, the calculations are done on plain
+      lists.
+    calc_backends: A custom module providing the numeric backends.
+    calc_engine: A custom module providing the CalcEngine class whose
+        float_to_str() method is used to format the results.
+    calc_kernels: A custom module providing the operator kernels.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_batch import evaluate_batch, format_batch
+    >>> results, errors = evaluate_batch(['1250', '1250', '5'],
+    ...                                  ['*%', '+%', '/'],
+    ...                                  ['10', '10', '0'], exact=True)
+    >>> format_batch(results, errors)
+    ['125', '1375', 'Div. by 0 Error!']
+"""
+
+# Importing required modules
+import argparse
+import csv
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import localcontext
+from itertools import count, islice, repeat
+
+try:
+    import numpy as np
+except ImportError:    # numpy is an optional dependency.
+    np = None
+
+from calc_backends import OVERFLOW_ERRORS, get_backend, make_context
+from calc_engine import CalcEngine
+from calc_kernels import get_operation
+
+# Number of CSV rows evaluated per worker task.
+CHUNK_SIZE = 10000
+
+# Result of the error rows whose result is out of the bounds of the backend.
+OVERFLOW = float('inf')
+
+
+def _operations(operators):
+    """
+    Look up the kernel function of every distinct operator.
+
+    Args:
+        operators (iterable): Distinct operators of the calculations.
+
+    Raises:
+        ValueError: If any operator is not supported.
+
+    Returns:
+        dict: Operator and its (kernel, function, undefined) tuple returned
+        by calc_kernels.get_operation().
+    """
+    operations = {}
+    unknown = []
+    for operator in operators:
+        try:
+            operations[operator] = get_operation(operator)
+        except KeyError:
+            unknown.append(operator)
+
+    if unknown:
+        raise ValueError(f'Unsupported operators: {sorted(unknown)}')
+
+    return operations
+
+
+def _convert_column(backend, column, first_row, ignored=None):
+    """
+    Convert a column of calculations to numbers of a backend.
+
+    Args:
+        backend (NumberBackend): The numeric backend.
+        column (sequence): Accumulator or operand of each calculation.
+        first_row (int): Number of the first calculation, for the error
+            messages.
+        ignored (sequence, optional): True for the calculations whose value
+            is ignored, which are zero instead of converted. Defaults to
+            None (none).
+
+    Raises:
+        ValueError: If a value is not a number, with its row number.
+
+    Returns:
+        list: The converted numbers.
+    """
+    convert = backend.convert
+    zero = backend.zero
+    numbers = []
+    for row, value, skip in zip(count(first_row), column,
+                                ignored if ignored is not None
+                                else repeat(False)):
+        if skip:
+            numbers.append(zero)
+            continue
+        try:
+            numbers.append(convert(value))
+        except (ValueError, TypeError, ArithmeticError) as error:
+            raise ValueError(f'row {row}: {error}') from None
+
+    return numbers
+
+
+def _evaluate_row(kernel, function, backend, acc, value):
+    """
+    Evaluate one calculation of converted operands.
+
+    Args:
+        kernel (OperatorKernel): Kernel of the operator.
+        function (function): The kernel function.
+        backend (NumberBackend): The numeric backend.
+        acc (object): The accumulator.
+        value (object): The operand.
+
+    Returns:
+        tuple: (result, error), where result is None for errors of the
+        kernel and OVERFLOW for results out of the bounds of the backend.
+    """
+    try:
+        result = function(acc, value)
+    except kernel.errors:
+        return None, True
+    except OVERFLOW_ERRORS:
+        return OVERFLOW, True
+
+    if backend.in_range is not None and not backend.in_range(result):
+        return OVERFLOW, True
+    return result, False
+
+
+def _evaluate_numpy(accumulators, operators, operands, backend, first_row):
+    """
+    Evaluate calculations with numpy, one vectorized call per operator.
+
+    Args:
+        accumulators (sequence): Accumulator of each calculation.
+        operators (sequence): Operator of each calculation.
+        operands (sequence): Operand of each calculation.
+        backend (NumberBackend): The numeric backend. The float backend
+            uses float64 arrays, the other backends object arrays.
+        first_row (int): Number of the first calculation, for the error
+            messages.
+
+    Raises:
+        ValueError: If an accumulator or operand is not a number.
+
+    Returns:
+        tuple: (results, errors) numpy arrays.
+    """
+    operators = np.asarray(operators, dtype=object)
+    operations = _operations(np.unique(operators).tolist())
+    exact = backend.name != 'float'
+    # The operand of '%' is ignored, so it is not converted.
+    ignored = operators == '%'
+
+    if exact:
+        acc = np.empty(len(operators), dtype=object)
+        acc[:] = _convert_column(backend, accumulators, first_row)
+        values = np.empty(len(operators), dtype=object)
+        values[:] = _convert_column(backend, operands, first_row, ignored)
+        results = np.empty(len(operators), dtype=object)
+    else:
+        try:
+            acc = np.asarray(accumulators, dtype=np.float64)
+            if ignored.any():
+                values = np.array(operands, dtype=object)
+                values[ignored] = 0
+                values = values.astype(np.float64)
+            else:
+                values = np.asarray(operands, dtype=np.float64)
+        except (ValueError, TypeError):
+            # Convert one value at a time to find out which row is not a
+            # number.
+            _convert_column(backend, accumulators, first_row)
+            _convert_column(backend, operands, first_row, ignored)
+            raise
+        # Zeroed, so the rows masked by undefined are not read as overflow.
+        results = np.zeros(len(operators), dtype=np.float64)
+
+    errors = np.zeros(len(operators), dtype=bool)
+    overflow = np.zeros(len(operators), dtype=bool)
+    with np.errstate(all='ignore'), localcontext(make_context()):
+        for operator, (kernel, function, undefined) in operations.items():
+            rows = operators == operator
+            if undefined is not None:
+                errors[rows] = undefined(acc[rows], values[rows])
+                rows &= ~errors
+            if not rows.any():
+                continue
+            try:
+                results[rows] = function(acc[rows], values[rows])
+            except OVERFLOW_ERRORS:
+                # A row overflowed, evaluate the rows one at a time to find
+                # out which.
+                for row in np.flatnonzero(rows):
+                    results[row], errors[row] = _evaluate_row(
+                        kernel, function, backend, acc[row], values[row])
+
+    if exact:
+        if backend.in_range is not None:
+            in_range = np.frompyfunc(backend.in_range, 1, 1)
+            overflow[~errors] = ~in_range(results[~errors]).astype(bool)
+        else:
+            overflow[errors] = results[errors] == OVERFLOW
+    else:
+        overflow[~errors] = ~np.isfinite(results[~errors])
+        # Rows evaluated one at a time after an OverflowError.
+        overflow[errors] = results[errors] == OVERFLOW
+
+    errors |= overflow
+    results[errors] = None if exact else np.nan
+    results[overflow] = OVERFLOW
+    return results, errors
+
+
+def _evaluate_lists(accumulators, operators, operands, backend, first_row):
+    """
+    Evaluate calculations one row at a time.
+
+    It is the fallback used when numpy is not installed.
+
+    Args:
+        accumulators (sequence): Accumulator of each calculation.
+        operators (sequence): Operator of each calculation.
+        operands (sequence): Operand of each calculation.
+        backend (NumberBackend): The numeric backend.
+        first_row (int): Number of the first calculation, for the error
+            messages.
+
+    Raises:
+        ValueError: If an accumulator or operand is not a number.
+
+    Returns:
+        tuple: (results, errors) lists.
+    """
+    operations = _operations(set(operators))
+    accumulators = _convert_column(backend, accumulators, first_row)
+    # The operand of '%' is ignored, so it is not converted.
+    operands = _convert_column(backend, operands, first_row,
+                               [operator == '%' for operator in operators])
+
+    results = []
+    errors = []
+    with localcontext(make_context()):
+        for acc, operator, value in zip(accumulators, operators, operands):
+            kernel, function, _ = operations[operator]
+            result, error = _evaluate_row(kernel, function, backend,
+                                          acc, value)
+            results.append(result)
+            errors.append(error)
+
+    return results, errors
+
+
+def evaluate_batch(accumulators, operators, operands, exact=False,
+                   backend=None, first_row=1):
+    """
+    Evaluate arrays of (accumulator, operator, operand) calculations.
+
+    With the float backend, the calculations are done on numpy float64
+    arrays. The decimal backend gives same results as the calculator, and
+    the fraction backend exact rational results. Without numpy, they are
+    done on plain lists.
+
+    Args:
+        accumulators (sequence): Accumulator of each calculation.
+        operators (sequence): Operator of each calculation (e.g. '+', '-',
+            '*', '/', '%', '+%', '-%', '*%' or '/%').
+        operands (sequence): Operand of each calculation.
+        exact (bool, optional): Evaluate with the decimal backend instead of
+            the float backend when backend is not given. Defaults to False.
+        backend (str, optional): Numeric backend, one of 'float', 'decimal'
+            or 'fraction'. Defaults to None, which picks by exact.
+        first_row (int, optional): Number of the first calculation, for the
+            error messages. Defaults to 1.
+
+    Raises:
+        ValueError: If the sequences have different length, an operator is
+            not supported, an accumulator or operand is not a number (the
+            message starts with its row number) or the backend is not
+            known.
+
+    Returns:
+        tuple: (results, errors), where results holds the result of each
+        calculation and errors is a boolean mask of the rows raising an
+        error (e.g. division by zero). Results of the error rows are OVERFLOW
+        if the result is out of the bounds of the backend, NaN (float
+        backend) or None (other backends) otherwise. Both are numpy arrays
+        when numpy is installed, lists otherwise.
+    """
+    if not len(accumulators) == len(operators) == len(operands):
+        raise ValueError('accumulators, operators and operands must have '
+                         'same length.')
+
+    backend = get_backend(backend or ('decimal' if exact else 'float'))
+
+    if np is not None:
+        return _evaluate_numpy(accumulators, operators, operands, backend,
+                               first_row)
+
+    return _evaluate_lists(accumulators, operators, operands, backend,
+                           first_row)
+
+
+def format_batch(results, errors, engine=None, operators=None):
+    """
+    Format the results of evaluate_batch() for the primary display.
+
+    Args:
+        results (sequence): Results returned by evaluate_batch().
+        errors (sequence): Error mask returned by evaluate_batch().
+        engine (CalcEngine, optional): The engine whose float_to_str() and
+            error messages are used. Defaults to a new CalcEngine.
+        operators (sequence, optional): Operators passed to
+            evaluate_batch(). When given, error rows show the error message
+            of their operator kernel, otherwise the division by zero error
+            message. Rows which overflowed show the overflow error message
+            in any case. Defaults to None.
+
+    Returns:
+        list: Primary display text of each calculation.
+    """
+    engine = engine or CalcEngine()
+    if operators is None:
+        messages = [engine.error] * len(results)
+    else:
+        operations = _operations(set(operators))
+        messages = [getattr(engine, operations[operator][0].error)
+                    for operator in operators]
+
+    return [(engine.overflow_error if result == OVERFLOW else message)
+            if error else engine.float_to_str(result)
+            for result, error, message in zip(results, errors, messages)]
+
+
+def evaluate_rows(rows, exact=True, backend=None, first_row=1):
+    """
+    Evaluate and format a chunk of (accumulator, operator, operand) rows.
+
+    It is the task run by the worker processes of run_csv_job().
+
+    Args:
+        rows (list): Rows of the CSV job file.
+        exact (bool, optional): Evaluate with the decimal backend instead of
+            the float backend when backend is not given. Defaults to True.
+        backend (str, optional): Numeric backend. Defaults to None, which
+            picks by exact.
+        first_row (int, optional): Number of the first row in the CSV job
+            file, for the error messages. Defaults to 1.
+
+    Raises:
+        ValueError: If a row does not have three columns, an operator is
+            not supported or an accumulator or operand is not a number.
+
+    Returns:
+        list: Primary display text of each row.
+    """
+    if any(len(row) != 3 for row in rows):
+        raise ValueError('Every row must have accumulator, operator and '
+                         'operand columns.')
+
+    accumulators, operators, operands = zip(*rows) if rows else ((), (), ())
+    results, errors = evaluate_batch(accumulators, operators, operands,
+                                     exact=exact, backend=backend,
+                                     first_row=first_row)
+
+    return format_batch(results, errors, operators=operators)
+
+
+def run_csv_job(input_file, output_file, workers=None,
+                chunk_size=CHUNK_SIZE, exact=True, header=False,
+                backend=None):
+    """
+    Evaluate a CSV job file across a pool of worker processes.
+
+    The rows are split into chunks of chunk_size rows, each chunk is
+    evaluated by evaluate_rows() in a worker process, and the rows are
+    written along with their result in input order. At most two chunks per
+    worker are pending at a time, so memory stays bounded on large files.
+
+    Args:
+        input_file (io.TextIOBase): CSV job file opened with newline=''.
+        output_file (io.TextIOBase): File to write the rows along with their
+            result, opened with newline=''.
+        workers (int, optional): Number of worker processes. Defaults to the
+            number of CPUs.
+        chunk_size (int, optional): Number of rows per worker task. Defaults
+            to CHUNK_SIZE.
+        exact (bool, optional): Evaluate with the decimal backend instead of
+            the float backend when backend is not given. Defaults to True.
+        header (bool, optional): Whether the first row is a header, which is
+            copied to the output with an additional 'result' column.
+            Defaults to False.
+        backend (str, optional): Numeric backend. Defaults to None, which
+            picks by exact.
+
+    Raises:
+        ValueError: If chunk_size is less than 1, or if a row is not valid.
+
+    Returns:
+        int: Number of rows evaluated.
+    """
+    # Fail before starting the workers if the arguments are not valid.
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, not {chunk_size}')
+    get_backend(backend or 'decimal')
+    reader = csv.reader(input_file)
+    writer = csv.writer(output_file)
+    n_rows = 0
+    # Number of the first row of the next chunk in the file.
+    first_row = 1
+
+    if header:
+        header_row = next(reader, None)
+        if header_row is not None:
+            writer.writerow(header_row + ['result'])
+            first_row += 1
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if chunk:
+                pending.append((chunk, executor.submit(evaluate_rows, chunk,
+                                                       exact, backend,
+                                                       first_row)))
+                first_row += len(chunk)
+            # Write the oldest chunk once enough chunks are pending or the
+            # input is exhausted, which keeps the output in input order.
+            while pending and (len(pending) >= max_pending or not chunk):
+                rows, future = pending.popleft()
+                writer.writerows(row + [result] for row, result
+                                 in zip(rows, future.result()))
+                n_rows += len(rows)
+            if not chunk:
+                break
+
+    return n_rows
+
+
+def _positive_int(text):
+    """
+    Convert a command line argument to a positive integer.
+
+    Args:
+        text (str): The argument.
+
+    Raises:
+        argparse.ArgumentTypeError: If the argument is not an integer of at
+            least 1.
+
+    Returns:
+        int: The integer.
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            f"invalid positive int value: '{text}'")
+    return value
+
+
+def main(argv=None):
+    """
+    Evaluate a CSV job file given on the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        int: Exit status of the program.
+    """
+    parser = argparse.ArgumentParser(
+        description='Evaluate a CSV file of accumulator,operator,operand '
+                    'rows with the calculator arithmetic.')
+    parser.add_argument('input', help="CSV job file, or '-' for standard "
+                                      "input")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output CSV file, or '-' for standard output "
+                             "(default)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes (default: number '
+                             'of CPUs)')
+    parser.add_argument('-c', '--chunk-size', type=_positive_int,
+                        default=CHUNK_SIZE,
+                        help=f'rows per worker task (default: {CHUNK_SIZE})')
+    parser.add_argument('--backend', choices=('float', 'decimal', 'fraction'),
+                        help='numeric backend (default: decimal)')
+    parser.add_argument('--fast', action='store_true',
+                        help='same as --backend float')
+    parser.add_argument('--header', action='store_true',
+                        help='the first row of the input is a header')
+    args = parser.parse_args(argv)
+
+    input_file = (sys.stdin if args.input == '-'
+                  else open(args.input, newline='', encoding='utf-8'))
+    output_file = (sys.stdout if args.output == '-'
+                   else open(args.output, 'w', newline='', encoding='utf-8'))
+
+    try:
+        run_csv_job(input_file, output_file, workers=args.workers,
+                    chunk_size=args.chunk_size, exact=not args.fast,
+                    header=args.header, backend=args.backend)
+    except ValueError as error:
+        print(f'calc_batch: {error}', file=sys.stderr)
+        return 1
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,795 @@
+"""
+calc_benchmark module
+
+This module contains the benchmark suite for the hot paths of the
+calculator.
+
+The suite covers the engine (str_to_float(), float_to_str() on short, long,
+huge and tiny values and on a result of HUGE_DIGITS digits next to its full
+conversion to a string, value_to_text() of an exact integer of HUGE_DIGITS
+digits next to str(), chains of do_operation()/do_equal(), do_percent(),
+the error toggle of disable_if_error() followed by do_clear(), an undo
+followed by a redo and the is_slow() check of the queued keys), the numeric
+backends (keystrokes and a batch of CSV rows per backend), the scientific
+functions (at 28 digits, with and without the cached constants, and the
+factorial, permutations and combinations of 3000 with the conversion of
+their thousands of digits), the number theory functions (the sieve,
+primality tests and the factorization of 40 digit numbers), the history
+tape (appending a calculation, reopening a full history file of a million
+entries and searching an indexed history) and the GUI
+(Calculator.create_buttons(), calc_type_switch() next to the previous
+destroy and rebuild switch, the error toggle next to the previous per
+button rebinding toggle, 100 division by zero and clear cycles, and pasting
+a 10,000 key sequence).
+GUI benchmarks are skipped when no display is available.
+
+Results can be saved as JSON and compared with a saved baseline, in which
+case benchmarks slower than the baseline by more than a threshold are
+flagged as regressions and the exit status is 1.
+
+It also compares the single pass display formatter, CalcEngine.float_to_str(),
+with the previous formatter (kept here as legacy_float_to_str() for
+reference) and checks that both produce the same output.
+
+Functions:
+    legacy_float_to_str: The previous implementation of float_to_str().
+    bench_float_to_str: Time legacy and current formatter on given values.
+    legacy_calc_type_switch: The previous implementation of
+        Calculator.calc_type_switch().
+    legacy_disable_if_error: The previous implementation of
+        CalcOperations.disable_if_error().
+    legacy_enable_after_error: The previous implementation of
+        CalcOperations.enable_after_error().
+    engine_benchmarks: Return the engine benchmarks.
+    backend_benchmarks: Return the benchmarks comparing the numeric
+        backends.
+    scientific_benchmarks: Return the benchmarks of the scientific
+        functions.
+    number_theory_benchmarks: Return the benchmarks of the number theory
+        functions.
+    history_benchmarks: Return the history tape benchmarks.
+    gui_benchmarks: Return the GUI benchmarks, or {} without a display.
+    run_suite: Time the benchmarks.
+    compare: Compare results with a baseline and return the regressions.
+    main: Command line entry point.
+
+Imports:
+    argparse: For parsing the command line arguments.
+    json: For saving and loading the results.
+    platform: For recording the Python version with the results.
+    statistics: For the median of the timings.
+    sys: For the exit status.
+    tempfile: For the history file of the history benchmarks.
+    time: For the timestamp of the results.
+    timeit: For timing the benchmarks.
+    decimal: This module provides functionality for precise arithmetic
+      operations using the Decimal data type from the decimal module.
+    fractions: For the exact integer of the engine benchmarks.
+    calc_backends: A custom module providing the numeric backends and the
+        int_to_decimal() function.
+    calc_batch: A custom module providing the batch evaluation.
+    calc_history: A custom module providing the History class.
+    calc_history_search: A custom module providing the HistoryIndex class.
+    calc_scientific: A custom module providing the scientific functions.
+    calc_number_theory: A custom module providing the number theory
+        functions.
+    calc_engine: A custom module providing the CalcEngine class and the
+        text_to_keysyms() and value_to_text() functions.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    $ python calc_benchmark.py --save baseline.json
+    $ python calc_benchmark.py --compare baseline.json --threshold 0.15
+"""
+
+# Importing required modules
+import argparse
+import json
+import platform
+import statistics
+import os
+import sys
+import tempfile
+import time
+import timeit
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+from calc_backends import BACKENDS, int_to_decimal, make_context
+from calc_batch import evaluate_batch, evaluate_rows
+from calc_engine import CalcEngine, text_to_keysyms, value_to_text
+from calc_history import History
+from calc_history_search import HistoryIndex
+from calc_number_theory import factorize, is_prime, mod_pow, small_primes
+from calc_scientific import (FUNCTIONS, comb, constants, factorial,
+                             int_factorial, perm)
+
+# Values formatted by the float_to_str() benchmark.
+FORMAT_CASES = {'short': Decimal('1375.5'),
+                'integer': Decimal('123456'),
+                'repeating (1/7)': Decimal(1) / Decimal(7),
+                'repeating (22/7)': Decimal(22) / Decimal(7),
+                'huge': Decimal(2) ** 200,
+                'tiny': Decimal('8E-20')}
+
+# Argument of the factorial, permutations and combinations benchmarks, whose
+# factorial (9131 digits) is close to the largest of the default context.
+BIG_INTEGER = 3000
+
+# Numbers of the number theory benchmarks: a 39 digit prime (2 ** 127 - 1)
+# and a 40 digit product of primes of 12, 12 and 18 digits.
+BIG_PRIME = 2 ** 127 - 1
+BIG_COMPOSITE = (10 ** 11 + 3) * (10 ** 11 + 19) * (10 ** 17 + 3)
+
+# Number of digits of the huge results formatted by the engine benchmarks.
+HUGE_DIGITS = 100000
+
+# Default relative slowdown flagged as a regression by compare().
+THRESHOLD = 0.10
+
+# Number of rows of the batch evaluated by the backend benchmarks.
+BATCH_ROWS = 10000
+
+# Number of entries of the history file reopened by the history benchmarks.
+HISTORY_ENTRIES = 1000000
+
+# Number of entries of the history searched by the history benchmarks.
+SEARCH_ENTRIES = 100000
+
+
+def legacy_float_to_str(num_value, pri_display_width=16):
+    """
+    Convert a number to a string the way float_to_str() did before it was
+    rewritten as a single pass.
+
+    It strips trailing zeros one character at a time and re-formats the
+    string to fit into the primary display.
+
+    Args:
+        num_value (Decimal): The number to convert.
+        pri_display_width (int, optional): Width of primary display.
+            Defaults to 16.
+
+    Returns:
+        str: The converted string representation of the number.
+    """
+    str_value = str(num_value)
+
+    if 'E' in str(num_value):
+        str_value = f'{num_value:f}'
+
+    if '.' in str_value:
+        while str_value[-1] == '0':
+            str_value = str_value[0:-1]
+
+    if str_value[-1] == '.':
+        str_value = str_value[0:-1]
+
+    if len(str_value) > pri_display_width:
+        sci_notation_len = 9 if '-' in str_value else 10
+
+        if '.' in str_value:
+            int_part = str_value.split('.')[0]
+            str_value = Decimal(str_value)
+
+            if int_part == '0':
+                str_value = f"{str_value:.{sci_notation_len}E}"
+            elif len(int_part) > pri_display_width:
+                str_value = f"{str_value:.{sci_notation_len}E}"
+            else:
+                n_digits = pri_display_width - len(int_part) - 1
+                str_value = f"{str_value:.{max(0, n_digits)}f}"
+
+                if len(str_value) > pri_display_width:
+                    str_value = f"{Decimal(str_value):.{sci_notation_len}E}"
+        else:
+            str_value = Decimal(str_value)
+            str_value = f"{str_value:.{sci_notation_len}E}"
+
+    return str_value
+
+
+def bench_float_to_str(cases=None, number=20000):
+    """
+    Time the legacy and the current float_to_str() on the given values.
+
+    Args:
+        cases (dict, optional): Names and values to format. Defaults to
+            FORMAT_CASES.
+        number (int, optional): Number of calls timed per value. Defaults to
+            20000.
+
+    Raises:
+        AssertionError: If both formatters do not produce the same output.
+
+    Returns:
+        list: A (name, legacy_us, current_us, speedup) tuple per value, with
+        times in microseconds per call.
+    """
+    engine = CalcEngine()
+    results = []
+
+    for name, value in (cases or FORMAT_CASES).items():
+        assert legacy_float_to_str(value) == engine.float_to_str(value), name
+
+        legacy = min(timeit.repeat(lambda: legacy_float_to_str(value),
+                                   number=number, repeat=3))
+        current = min(timeit.repeat(lambda: engine.float_to_str(value),
+                                    number=number, repeat=3))
+        results.append((name,
+                        legacy / number * 1e6,
+                        current / number * 1e6,
+                        legacy / current))
+
+    return results
+
+
+def legacy_calc_type_switch(calc, symbol):
+    """
+    Switch the type of calculator the way calc_type_switch() did before the
+    keypads were kept alive.
+
+    It destroys the frame with all its buttons and builds the keypad of the
+    selected calculator again.
+
+    Args:
+        calc (Calculator): The calculator.
+        symbol (str): Either 'stand_calc' or 'sci_calc'.
+
+    Returns:
+        None
+    """
+    from calculator import ScientificCalc, StandardCalc
+
+    calc_class = StandardCalc if symbol == 'stand_calc' else ScientificCalc
+    if not isinstance(calc.calc_type, calc_class):
+        calc.do_clear()
+        calc.frame.destroy()
+        calc.create_frame()
+        calc.create_developer_label()
+        calc.calc_type = calc_class()
+        calc.create_buttons()
+        calc.calc_type.place_buttons(calc)
+
+
+def legacy_disable_if_error(calc):
+    """
+    Enter the error state the way disable_if_error() did before the click
+    dispatcher: every disabled button is configured and unbound in turn.
+
+    Args:
+        calc (Calculator): The calculator.
+
+    Returns:
+        None
+    """
+    import tkinter as tk
+
+    for btn_text in calc.disabled_btn_texts:
+        calc.buttons_dict[btn_text].config(state=tk.DISABLED,
+                                           bg=calc.btn_disabled_bg)
+        calc.buttons_dict[btn_text].unbind('<Button-1>')
+    calc.state.btn_state = tk.DISABLED
+
+
+def legacy_enable_after_error(calc):
+    """
+    Leave the error state the way enable_after_error() did before the click
+    dispatcher: every disabled button is configured and bound again in turn.
+
+    Args:
+        calc (Calculator): The calculator.
+
+    Returns:
+        None
+    """
+    import tkinter as tk
+
+    for btn_text in calc.disabled_btn_texts:
+        if btn_text != '=':
+            calc.buttons_dict[btn_text].config(state=tk.NORMAL,
+                                               bg=calc.btn_operator_bg)
+        else:
+            calc.buttons_dict[btn_text].config(state=tk.NORMAL,
+                                               bg=calc.btn_equal_bg)
+        calc.buttons_dict[btn_text].bind('<Button-1>',
+                                         calc.btn_callbacks[btn_text])
+    calc.state.btn_state = tk.NORMAL
+
+
+def _press(engine, keys):
+    """
+    Press a sequence of keysyms on an engine.
+
+    Args:
+        engine (CalcEngine): The engine.
+        keys (list): Keysyms to press.
+
+    Returns:
+        None
+    """
+    for keysym in keys:
+        engine.press_key(keysym)
+
+
+def engine_benchmarks():
+    """
+    Return the engine benchmarks.
+
+    Returns:
+        dict: Benchmark name and the function to time.
+    """
+    engine = CalcEngine()
+    benchmarks = {
+        'str_to_float': lambda: engine.str_to_float('9876543.21'),
+    }
+
+    for name, value in FORMAT_CASES.items():
+        benchmarks[f'float_to_str[{name}]'] = (
+            lambda value=value: engine.float_to_str(value))
+
+    # A result of an engine as precise as the huge result, whose string
+    # would have HUGE_DIGITS digits.
+    precise_engine = CalcEngine(context=make_context(precision=HUGE_DIGITS))
+    with localcontext(precise_engine.context):
+        huge = Decimal(2).sqrt()
+    huge_int = 7 ** int(HUGE_DIGITS / 0.845)
+    # str() of an int refuses more digits than the limit of the interpreter.
+    set_max_digits = getattr(sys, 'set_int_max_str_digits', None)
+
+    def str_huge_int():
+        if set_max_digits is not None:
+            limit = sys.get_int_max_str_digits()
+            set_max_digits(0)
+        try:
+            return str(huge_int)
+        finally:
+            if set_max_digits is not None:
+                set_max_digits(limit)
+
+    benchmarks.update({
+        f'float_to_str[{HUGE_DIGITS} digits]': lambda: (
+            precise_engine.float_to_str(huge)),
+        f'str[{HUGE_DIGITS} digits] (legacy)': lambda: str(huge),
+        f'value_to_text[{HUGE_DIGITS} digit integer]': lambda: (
+            value_to_text(Fraction(huge_int))),
+        f'str[{HUGE_DIGITS} digit integer] (legacy)': str_huge_int,
+    })
+
+    chain = ('8 9 5 plus 9 4 period 5 minus 4 5 slash 2 asterisk 3 plus 1 0 '
+             'percent Escape').split()
+    equal_chain = '1 2 5 asterisk 8 Return 2 2 slash 7 Return Escape'.split()
+    percent = '1 2 5 0 plus 1 0 percent Escape'.split()
+
+    def error_toggle():
+        engine.disable_if_error()
+        engine.do_clear()
+
+    undo_engine = CalcEngine()
+    _press(undo_engine, '1 2 plus 3 equal'.split())
+
+    # The keys of the input queue are checked by is_slow() before they are
+    # pressed, so its cost adds to every key typed.
+    slow_engine = CalcEngine()
+    _press(slow_engine, '1 2 plus 3'.split())
+
+    benchmarks.update({
+        'do_operation chain': lambda: _press(engine, chain),
+        'do_equal chain': lambda: _press(engine, equal_chain),
+        'do_percent': lambda: _press(engine, percent),
+        'error toggle': error_toggle,
+        'undo redo': lambda: _press(undo_engine, ('undo', 'redo')),
+        'is_slow[digit]': lambda: slow_engine.is_slow('4'),
+        'is_slow[operator]': lambda: slow_engine.is_slow('plus'),
+    })
+
+    return benchmarks
+
+
+def backend_benchmarks(n_rows=BATCH_ROWS):
+    """
+    Return the benchmarks comparing the numeric backends.
+
+    Every backend runs the same keystroke chain on an engine, a batch of
+    n_rows calculations through calc_batch.evaluate_batch() (arithmetic
+    only), and the same batch as CSV rows through
+    calc_batch.evaluate_rows(), which also formats the results for the
+    display.
+
+    Args:
+        n_rows (int, optional): Number of rows of the batch. Defaults to
+            BATCH_ROWS.
+
+    Returns:
+        dict: Benchmark name and the function to time.
+    """
+    chain = ('8 9 5 plus 9 4 period 5 minus 4 5 slash 7 asterisk 3 equal '
+             'plus 1 0 percent Escape').split()
+    operators = ('+', '-', '*', '/', '+%', '*%')
+    rows = [[str(1 + row * 7 % 9973), operators[row % len(operators)],
+             f'{1 + row % 97}.{row % 10}'] for row in range(n_rows)]
+    columns = list(zip(*rows))
+    benchmarks = {}
+
+    for backend in BACKENDS:
+        engine = CalcEngine(backend)
+        benchmarks[f'backend[{backend}] keys'] = (
+            lambda engine=engine: _press(engine, chain))
+        benchmarks[f'backend[{backend}] evaluate {n_rows} rows'] = (
+            lambda backend=backend: evaluate_batch(*columns, backend=backend))
+        benchmarks[f'backend[{backend}] batch {n_rows} rows'] = (
+            lambda backend=backend: evaluate_rows(rows, backend=backend))
+
+    return benchmarks
+
+
+def scientific_benchmarks():
+    """
+    Return the benchmarks of the scientific functions.
+
+    The functions are timed on Decimal at the precision of the default
+    context of the engine, next to the methods of Decimal where they exist
+    and next to a sin() whose constants are computed again. The factorial
+    of BIG_INTEGER is timed computed and kept by the memo of the last
+    factorials, and the conversion of its digits by int_to_decimal() next
+    to the conversion of every digit by Context.create_decimal().
+
+    Returns:
+        dict: Benchmark name and the function to time.
+    """
+    context = make_context()
+    value = Decimal('2.5')
+
+    def timed(function):
+        def run():
+            with localcontext(context):
+                function(value)
+        return run
+
+    def sin_uncached():
+        constants.cache_clear()
+        with localcontext(context):
+            FUNCTIONS['sin'](value)
+
+    def integer(function, *args):
+        def run():
+            with localcontext(context):
+                function(*args)
+        return run
+
+    def factorial_computed():
+        int_factorial.cache_clear()
+        with localcontext(context):
+            factorial(big)
+
+    big = Decimal(BIG_INTEGER)
+    big_factorial = int_factorial(BIG_INTEGER)
+
+    # The factorial is not defined for the value of the other functions.
+    benchmarks = {f'{name} {context.prec} digits': timed(function)
+                  for name, function in FUNCTIONS.items() if name != 'fact'}
+    benchmarks.update({
+        f'n! {BIG_INTEGER}': factorial_computed,
+        f'n! {BIG_INTEGER} (memo)': integer(factorial, big),
+        f'nPr {BIG_INTEGER} {BIG_INTEGER // 2}': integer(perm, big, big / 2),
+        f'nCr {BIG_INTEGER} {BIG_INTEGER // 2}': integer(comb, big, big / 2),
+        f'int_to_decimal({BIG_INTEGER}!)': integer(int_to_decimal,
+                                                   big_factorial),
+        f'Context.create_decimal({BIG_INTEGER}!) (legacy)': lambda:
+            context.create_decimal(big_factorial),
+        f'sin {context.prec} digits (uncached constants)': sin_uncached,
+        f'Decimal.ln {context.prec} digits': timed(Decimal.ln),
+        f'Decimal.log10 {context.prec} digits': timed(Decimal.log10),
+        'scientific keys': lambda: _press(
+            CalcEngine(), '2 at s n q r p o Escape'.split()),
+        'factorial keys': lambda: _press(
+            CalcEngine(), f'{" ".join(str(BIG_INTEGER))} exclam Escape'
+            .split()),
+    })
+
+    return benchmarks
+
+
+def number_theory_benchmarks():
+    """
+    Return the benchmarks of the number theory functions.
+
+    The sieve is timed computed again, the primality test on a prime above
+    and below the bound of the deterministic Miller-Rabin test, and the
+    factorization on BIG_COMPOSITE.
+
+    Returns:
+        dict: Benchmark name and the function to time.
+    """
+    def sieve():
+        small_primes.cache_clear()
+        small_primes()
+
+    mersenne_61 = 2 ** 61 - 1
+    return {
+        'small_primes sieve': sieve,
+        'is_prime 2^61-1': lambda: is_prime(mersenne_61),
+        'is_prime 2^127-1': lambda: is_prime(BIG_PRIME),
+        'is_prime 40 digit composite': lambda: is_prime(BIG_COMPOSITE),
+        'mod_pow 1024 bits': lambda: mod_pow(3, BIG_PRIME ** 8,
+                                             BIG_PRIME ** 8 + 2),
+        'factorize 40 digits': lambda: factorize(BIG_COMPOSITE),
+    }
+
+
+def history_benchmarks(n_entries=HISTORY_ENTRIES, n_searched=SEARCH_ENTRIES):
+    """
+    Return the history tape benchmarks.
+
+    The reopen benchmark maps a file of n_entries entries and reads its
+    newest entry. The file is created once in a temporary directory which
+    is removed when the benchmarks are garbage collected. The search
+    benchmarks query an index of n_searched calculations by value range,
+    substring and operator.
+
+    Args:
+        n_entries (int, optional): Number of entries of the history file.
+            Defaults to HISTORY_ENTRIES.
+        n_searched (int, optional): Number of entries of the searched
+            history. Defaults to SEARCH_ENTRIES.
+
+    Returns:
+        dict: Benchmark name and the function to time.
+    """
+    tape = History(capacity=1000)
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, 'history')
+    with History(path, capacity=n_entries) as history:
+        # Reopening does not depend on the content of the records, so only
+        # the last one is written to mark the history as full.
+        history.count = n_entries - 1
+        history.append('895', '+', '94.5', '989.5')
+
+    def reopen(directory=directory):
+        with History(path) as history:
+            return history[-1]
+
+    engine = CalcEngine()
+    operators = ('+', '-', '*', '/', '+%', '*%')
+    searched = History(capacity=n_searched)
+    for row in range(n_searched):
+        accumulator = 1 + row * 7 % 9973
+        value = 1 + row % 97
+        searched.append(str(accumulator), operators[row % len(operators)],
+                        str(value), engine.float_to_str(
+                            Decimal(accumulator) / Decimal(value)))
+    index = HistoryIndex(searched)
+    index.sync()
+
+    return {'history append': lambda: tape.append('895', '+', '94.5',
+                                                  '989.5'),
+            f'history reopen {n_entries} entries': reopen,
+            f'history search {n_searched} range':
+                lambda: index.search(low=100, high=200),
+            f'history search {n_searched} text':
+                lambda: index.search(text='714'),
+            f'history search {n_searched} operator and range':
+                lambda: index.search(low=100, high=200, operator='/')}
+
+
+def gui_benchmarks():
+    """
+    Return the GUI benchmarks.
+
+    A Calculator window is created (and withdrawn) for the benchmarks. The
+    GUI benchmarks are skipped when tkinter or a display is not available.
+
+    Returns:
+        dict: Benchmark name and the function to time, or {} if the GUI is
+        not available.
+    """
+    try:
+        import tkinter as tk
+        from calculator import Calculator, StandardCalc
+    except ImportError as error:
+        print(f'Skipping GUI benchmarks: {error}', file=sys.stderr)
+        return {}
+
+    try:
+        calc = Calculator(StandardCalc)
+        legacy_calc = Calculator(StandardCalc)
+    except tk.TclError as error:    # No display available.
+        print(f'Skipping GUI benchmarks: {error}', file=sys.stderr)
+        return {}
+
+    calc.window.withdraw()
+    legacy_calc.window.withdraw()
+
+    def create_buttons():
+        for btn in calc.buttons_dict.values():
+            btn.destroy()
+        calc.create_buttons()
+        calc.keypads[type(calc.calc_type)] = (calc.frame, calc.calc_type,
+                                              calc.buttons_dict,
+                                              calc.error_styles)
+
+    def calc_type_switch():
+        calc.calc_type_switch('sci_calc')
+        calc.calc_type_switch('stand_calc')
+        calc.window.update_idletasks()
+
+    def legacy_switch():
+        legacy_calc_type_switch(legacy_calc, 'sci_calc')
+        legacy_calc_type_switch(legacy_calc, 'stand_calc')
+        legacy_calc.window.update_idletasks()
+
+    def error_toggle():
+        calc.disable_if_error()
+        calc.do_clear()
+        calc.window.update_idletasks()
+
+    def legacy_error_toggle():
+        legacy_disable_if_error(legacy_calc)
+        legacy_enable_after_error(legacy_calc)
+        legacy_calc.window.update_idletasks()
+
+    error_keys = '1 slash 0 Return Escape'.split() * 100
+
+    def error_cycles():
+        _press(calc, error_keys)
+        calc.render.flush()
+
+    paste_keys = text_to_keysyms('12345678 + 1 = ' * 700)
+
+    def paste():
+        calc.queue_keys(paste_keys)
+        while calc.input_queue:
+            calc.drain_input()
+        calc.render.flush()
+
+    return {'gui create_buttons': create_buttons,
+            'gui calc_type_switch': calc_type_switch,
+            'gui calc_type_switch (legacy)': legacy_switch,
+            'gui error toggle': error_toggle,
+            'gui error toggle (legacy)': legacy_error_toggle,
+            'gui 100 error/clear cycles': error_cycles,
+            'gui paste 10k keys': paste,
+            'gui do_equal chain': lambda: _press(
+                calc, '1 2 5 asterisk 8 Return Escape'.split())}
+
+
+def run_suite(benchmarks, repeat=5):
+    """
+    Time the benchmarks.
+
+    The number of calls per timing is chosen by timeit.Timer.autorange()
+    so that each timing takes at least 0.2 seconds.
+
+    Args:
+        benchmarks (dict): Benchmark name and the function to time.
+        repeat (int, optional): Number of timings per benchmark. Defaults to
+            5.
+
+    Returns:
+        dict: Benchmark name and its 'min_us' and 'median_us' time per call
+        in microseconds.
+    """
+    results = {}
+
+    for name, function in benchmarks.items():
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        timings = [timing / number * 1e6
+                   for timing in timer.repeat(repeat=repeat, number=number)]
+        results[name] = {'min_us': min(timings),
+                         'median_us': statistics.median(timings)}
+
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Compare results with a baseline and return the regressions.
+
+    Benchmarks are compared on their minimum time, which is the least
+    sensitive to noise.
+
+    Args:
+        results (dict): Results returned by run_suite().
+        baseline (dict): Results of the baseline.
+        threshold (float, optional): Relative slowdown flagged as a
+            regression. Defaults to THRESHOLD.
+
+    Returns:
+        list: A (name, baseline_us, current_us, change) tuple for every
+        benchmark present in both, where change is the relative slowdown,
+        and a list of the names of the regressions.
+    """
+    rows = []
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['min_us']
+        after = result['min_us']
+        change = after / before - 1
+        rows.append((name, before, after, change))
+        if change > threshold:
+            regressions.append(name)
+
+    return rows, regressions
+
+
+def main(argv=None):
+    """
+    Run the benchmark suite given on the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        int: Exit status, 1 if regressions were found, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the hot paths of the calculator.')
+    parser.add_argument('--save', metavar='FILE',
+                        help='save the results as JSON')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the results with a saved baseline')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='relative slowdown flagged as a regression '
+                             f'(default: {THRESHOLD})')
+    parser.add_argument('-k', '--filter', default='',
+                        help='only run benchmarks whose name contains this')
+    parser.add_argument('--no-gui', action='store_true',
+                        help='skip the GUI benchmarks')
+    parser.add_argument('--legacy', action='store_true',
+                        help='compare float_to_str() with the legacy '
+                             'formatter')
+    args = parser.parse_args(argv)
+
+    if args.legacy:
+        print(f"{'float_to_str':<20}{'legacy (us)':>12}{'current (us)':>14}"
+              f"{'speedup':>9}")
+        for name, legacy, current, speedup in bench_float_to_str():
+            print(f'{name:<20}{legacy:>12.2f}{current:>14.2f}'
+                  f'{speedup:>8.1f}x')
+        return 0
+
+    benchmarks = engine_benchmarks()
+    benchmarks.update(backend_benchmarks())
+    benchmarks.update(scientific_benchmarks())
+    benchmarks.update(number_theory_benchmarks())
+    benchmarks.update(history_benchmarks())
+    if not args.no_gui:
+        benchmarks.update(gui_benchmarks())
+    benchmarks = {name: function for name, function in benchmarks.items()
+                  if args.filter in name}
+
+    results = run_suite(benchmarks)
+    for name, result in results.items():
+        print(f"{name:<40}{result['min_us']:>12.2f} us")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump({'python': platform.python_version(),
+                       'timestamp': time.time(),
+                       'results': results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        rows, regressions = compare(results, baseline, args.threshold)
+        print(f"\n{'benchmark':<40}{'baseline':>12}{'current':>12}"
+              f"{'change':>9}")
+        for name, before, after, change in rows:
+            flag = '  REGRESSION' if name in regressions else ''
+            print(f'{name:<40}{before:>12.2f}{after:>12.2f}'
+                  f'{change:>+8.1%}{flag}')
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,335 @@
+"""
+calc_client module
+
+This module provides an asyncio client for the calculation server of
+calc_server module.
+
+The client keeps a pool of connections to the server. The requests of a
+named session always go to the same connection, picked from the hash of
+the session name, so the server receives its keystrokes in order. The
+other requests are spread over the connections in round robin order.
+Requests are pipelined: every
+request gets an id, the responses are matched to their request by id, and
+all requests issued during one iteration of the event loop are written to
+a connection with a single write.
+
+Classes:
+    CalcClient: An asyncio client with connection pooling and request
+        batching.
+
+Imports:
+    asyncio: For the streams based connections.
+    itertools: For the request ids and the round robin order.
+    json: For encoding and decoding the JSON-lines protocol.
+    calc_server: A custom module providing the default port of the server
+        and its maximum request line length.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> async def demo():
+    ...     async with CalcClient(port=8765) as client:
+    ...         print(await client.evaluate('12.5*(3+4)%'))
+    ...         print(await client.press(['1', 'plus', '2', 'Return']))
+    >>> asyncio.run(demo())    # doctest: +SKIP
+    0.875
+    ('1+2=', '3')
+"""
+
+# Importing required modules
+import asyncio
+import itertools
+import json
+
+from calc_server import DEFAULT_PORT, MAX_LINE
+
+
+class _Connection:
+    """
+    A single pipelined connection to the calculation server.
+
+    Attributes:
+        reader (asyncio.StreamReader): Reader of the connection.
+        writer (asyncio.StreamWriter): Writer of the connection.
+        pending (dict): Futures of the requests waiting for a response, by
+            request id.
+        buffer (list): Encoded requests waiting to be written.
+        read_task (asyncio.Task): Task reading the responses.
+    """
+
+    def __init__(self, reader, writer):
+        """
+        Initialize the _Connection class.
+
+        Args:
+            reader (asyncio.StreamReader): Reader of the connection.
+            writer (asyncio.StreamWriter): Writer of the connection.
+
+        Returns:
+            None
+        """
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        self.buffer = []
+        self.read_task = asyncio.get_running_loop().create_task(
+            self.read_responses())
+
+    def send(self, request):
+        """
+        Queue a request and return the future of its response.
+
+        The queued requests are written together once the current iteration
+        of the event loop is over. A request longer than the MAX_LINE bytes
+        read by the server is not sent, and its future fails with
+        ValueError.
+
+        Args:
+            request (dict): The request, with its 'id' set.
+
+        Returns:
+            asyncio.Future: Future of the decoded response.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        line = json.dumps(request).encode()
+        if len(line) > MAX_LINE:
+            future.set_exception(ValueError(
+                f'Request is longer than {MAX_LINE} bytes.'))
+            return future
+
+        self.pending[request['id']] = future
+        if not self.buffer:
+            loop.call_soon(self.flush)
+        self.buffer.append(line + b'\n')
+
+        return future
+
+    def flush(self):
+        """
+        Write all queued requests with a single write.
+
+        Returns:
+            None
+        """
+        if self.buffer and not self.writer.is_closing():
+            self.writer.write(b''.join(self.buffer))
+        self.buffer.clear()
+
+    async def read_responses(self):
+        """
+        Read responses and resolve the futures of their requests.
+
+        Returns:
+            None
+        """
+        error = ConnectionError('Connection to the server was closed.')
+        try:
+            while line := await self.reader.readline():
+                response = json.loads(line)
+                future = self.pending.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (ConnectionError, ValueError) as exc:
+            error = exc
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.pending.clear()
+
+    async def close(self):
+        """
+        Close the connection.
+
+        Returns:
+            None
+        """
+        self.flush()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.read_task.cancel()
+
+
+class CalcClient:
+    """
+    An asyncio client of the calculation server with connection pooling and
+    request batching.
+
+    Attributes:
+        host (str): Host of the TCP server.
+        port (int): TCP port of the server.
+        path (str): Path of the Unix socket of the server, or None for TCP.
+        pool_size (int): Number of connections.
+        connections (list): Open connections.
+    """
+
+    def __init__(self, host='127.0.0.1', port=DEFAULT_PORT, path=None,
+                 pool_size=4):
+        """
+        Initialize the CalcClient class.
+
+        Args:
+            host (str, optional): Host of the TCP server. Defaults to
+                '127.0.0.1'.
+            port (int, optional): TCP port of the server. Defaults to
+                DEFAULT_PORT.
+            path (str, optional): Path of the Unix socket of the server. If
+                given, host and port are ignored. Defaults to None.
+            pool_size (int, optional): Number of connections. Defaults to 4.
+
+        Returns:
+            None
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        self.pool_size = pool_size
+        self.connections = []
+        self._ids = itertools.count()
+        self._round_robin = None
+
+    async def connect(self):
+        """
+        Open the pool of connections.
+
+        Returns:
+            CalcClient: The client itself.
+        """
+        for _ in range(self.pool_size):
+            if self.path is not None:
+                streams = await asyncio.open_unix_connection(self.path)
+            else:
+                streams = await asyncio.open_connection(self.host, self.port)
+            self.connections.append(_Connection(*streams))
+
+        self._round_robin = itertools.cycle(self.connections)
+        return self
+
+    async def close(self):
+        """
+        Close the pool of connections.
+
+        Returns:
+            None
+        """
+        for connection in self.connections:
+            await connection.close()
+        self.connections.clear()
+
+    async def __aenter__(self):
+        """
+        Open the pool of connections when entering the runtime context.
+
+        Returns:
+            CalcClient: The client itself.
+        """
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info):
+        """
+        Close the pool of connections when leaving the runtime context.
+
+        Args:
+            *exc_info: Type, value and traceback of the exception raised in
+                the context, if any.
+
+        Returns:
+            None
+        """
+        await self.close()
+
+    def send(self, request):
+        """
+        Send a request on a connection of the pool.
+
+        Requests of a named session are sent on the connection of the
+        session, so they are handled in order. Other requests are sent on
+        the next connection in round robin order.
+
+        Args:
+            request (dict): The request without id.
+
+        Returns:
+            asyncio.Future: Future of the decoded response.
+        """
+        request = dict(request, id=next(self._ids))
+        session = request.get('session')
+        if session is None:
+            connection = next(self._round_robin)
+        else:
+            connection = self.connections[hash(str(session))
+                                          % len(self.connections)]
+        return connection.send(request)
+
+    async def request(self, request):
+        """
+        Send a request and wait for its response.
+
+        Args:
+            request (dict): The request without id.
+
+        Returns:
+            dict: The decoded response.
+        """
+        return await self.send(request)
+
+    async def batch(self, requests):
+        """
+        Send many requests at once and wait for all of their responses.
+
+        Args:
+            requests (iterable): Requests without id.
+
+        Returns:
+            list: The decoded responses in the order of the requests.
+        """
+        return await asyncio.gather(*[self.send(request)
+                                      for request in requests])
+
+    async def evaluate(self, expr):
+        """
+        Evaluate an expression on the server.
+
+        Args:
+            expr (str): The expression.
+
+        Raises:
+            ValueError: If the server rejects the expression.
+
+        Returns:
+            str: The formatted result.
+        """
+        response = await self.request({'expr': expr})
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response['result']
+
+    async def press(self, keys, session=None):
+        """
+        Press keysyms on an engine of the server.
+
+        Args:
+            keys (list): Keysyms to press.
+            session (str, optional): Name of the session whose engine keeps
+                its state across requests. Defaults to None.
+
+        Raises:
+            ValueError: If the server rejects a keysym, or the request is
+                longer than calc_server.MAX_LINE bytes.
+
+        Returns:
+            tuple: (secondary display, primary display) after the keys.
+        """
+        request = {'keys': list(keys)}
+        if session is not None:
+            request['session'] = session
+
+        response = await self.request(request)
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response['sec'], response['pri']
@@ -0,0 +1,1806 @@
+"""
+calc_engine module
+
+This module contains the CalcEngine class, the headless arithmetic state
+machine of the calculator, the CalcState class holding its state, and the
+DisplayText class used as its display state.
+
+The CalcEngine class implements the same keystroke driven logic as the
+calculator application (operations, equal, percentage, sign toggle, clear,
+backspace, the functions and constants of the scientific calculator and
+display formatting) without depending on tkinter. It can be
+driven from scripts, worker processes or tests without creating a Tcl
+interpreter. The CalcOperations class of calc_operations module extends it
+with the widgets related behaviour of the GUI.
+
+Every keystroke pressed with press_key() can be undone and redone. The
+snapshots of the undo and redo stacks are tuples sharing the immutable
+numbers and strings of the state, so a snapshot costs a few references.
+
+Classes:
+    DisplayText: A plain string holder with the get/set interface of
+        tk.StringVar.
+    CalcState: The state of the arithmetic state machine of a CalcEngine.
+    CalcEngine: A class containing the arithmetic state machine of the
+        calculator.
+
+Functions:
+    text_to_keysyms: Translate text such as a pasted number or operation
+        sequence to keysyms.
+    value_to_text: Return every digit of a number as text, e.g. for copying
+        the display.
+    press_detached: Press a key on an engine restored from a snapshot, in a
+        worker process.
+
+Imports:
+    collections: For the bounded undo stack.
+    decimal: This module provides functionality for precise arithmetic
+      operations using the Decimal data type from the decimal module.
+    calc_kernels: A custom module providing the dispatch table of operator
+        kernels.
+    calc_backends: A custom module providing the numeric backends.
+    calc_scientific: A custom module providing the functions and constants
+        of the scientific calculator.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_engine import CalcEngine
+    >>> engine = CalcEngine()
+    >>> for digit in '125':
+    ...     engine.enter_digit(digit)
+    >>> engine.do_multi()
+    >>> engine.enter_digit('8')
+    >>> engine.do_equal()
+    >>> engine.pri_display_text.get()
+    '1000'
+"""
+
+# Importing required modules
+from collections import deque
+from decimal import (MAX_EMAX, MIN_EMIN, ROUND_05UP, Context, Decimal,
+                     InvalidOperation, localcontext)
+from fractions import Fraction
+
+from calc_backends import (OVERFLOW_ERRORS, get_backend, int_to_text,
+                           make_context, to_decimal)
+from calc_kernels import OPERATORS
+from calc_scientific import DOMAIN_ERRORS, FUNCTIONS, constant
+
+# Button states used by the engine. Values are same as tk.NORMAL and
+# tk.DISABLED, so the GUI can use btn_state directly with tkinter widgets.
+NORMAL = 'normal'
+DISABLED = 'disabled'
+
+# Number of keystrokes which can be undone.
+UNDO_LIMIT = 10000
+
+# Keysyms of undo and redo, which are not recorded in the undo stack.
+UNDO_KEYSYMS = frozenset(('undo', 'redo'))
+
+# Keysyms typed by the characters of a pasted text. Characters not listed
+# here, other than whitespace and thousands separators, are not valid input.
+CHAR_KEYSYMS = {'0': '0', '1': '1', '2': '2', '3': '3', '4': '4', '5': '5',
+                '6': '6', '7': '7', '8': '8', '9': '9', '.': 'period',
+                '+': 'plus', '-': 'minus', '\u2212': 'minus',
+                '*': 'asterisk', 'x': 'asterisk', 'X': 'asterisk',
+                '\u00d7': 'asterisk', '/': 'slash', '\u00f7': 'slash',
+                '%': 'percent', '=': 'equal'}
+
+# Characters skipped in a pasted text.
+IGNORED_CHARS = frozenset(' \t\r\n,_')
+
+# Significant digits kept by float_to_str() of the numbers of an engine
+# whose context is more precise, more than any display shows. The numbers
+# are rounded with ROUND_05UP, which keeps enough of the dropped digits in
+# the last digit kept that the display then rounds them as it would round
+# every digit.
+DISPLAY_DIGITS = 40
+DISPLAY_CONTEXT = Context(prec=DISPLAY_DIGITS, rounding=ROUND_05UP,
+                          Emax=MAX_EMAX, Emin=MIN_EMIN, traps=[])
+
+# Functions of the scientific calculator by the keysym of their key.
+FUNCTION_KEYSYMS = {'s': 'sin', 'o': 'cos', 't': 'tan', 'n': 'ln', 'l': 'log',
+                    'x': 'exp', 'q': 'sqr', 'at': 'sqrt', 'r': 'inv',
+                    'exclam': 'fact'}
+
+# Keysyms of the keys which complete the pending operation.
+OPERATION_KEYSYMS = frozenset(('plus', 'minus', 'asterisk', 'slash',
+                               'asciicircum', 'P', 'C', 'percent', 'equal',
+                               'Return'))
+
+# Functions and operators of Decimal numbers computed by series, whose
+# time grows faster than the square of the precision.
+SERIES_OPERATIONS = frozenset(('sin', 'cos', 'tan', 'ln', 'log', 'exp', '^'))
+
+# Functions whose argument is reduced with as many more digits of pi as it
+# has integer digits, up to calc_scientific.REDUCTION_MARGIN beyond the
+# precision.
+ANGLE_OPERATIONS = frozenset(('sin', 'cos', 'tan'))
+
+# Functions and operators of products of up to n integers.
+PRODUCT_OPERATIONS = frozenset(('fact', 'P', 'C'))
+
+# Limits above which is_slow() estimates an operation to take more than
+# about 50 ms: the precision of the series operations (about 40 ms for a
+# sine of 1000 digits), the precision plus the integer digits of the angle
+# of sin, cos and tan (about 50 ms for 1200 digits, mostly to compute pi),
+# the size in bits of the Fractions of any operation (about 50 ms for a
+# product of 200,000 bits) and n of the products (about 20 ms for 20000!).
+SLOW_PRECISION = 1000
+SLOW_ANGLE_DIGITS = 1200
+SLOW_FRACTION_BITS = 200000
+SLOW_PRODUCT = 20000
+
+
+def text_to_keysyms(text):
+    """
+    Translate text such as a pasted number or operation sequence to keysyms.
+
+    Whitespace, commas and underscores (thousands separators) are skipped.
+
+    Args:
+        text (str): The text to translate (e.g. '1,250 x 8 =').
+
+    Raises:
+        ValueError: If the text contains a character that is not a digit, a
+            decimal point, an operator or a separator.
+
+    Returns:
+        list: Keysyms typing the text, as accepted by CalcEngine.press_key().
+    """
+    keysyms = []
+    for char in text:
+        keysym = CHAR_KEYSYMS.get(char)
+        if keysym is not None:
+            keysyms.append(keysym)
+        elif char not in IGNORED_CHARS:
+            raise ValueError(f'Unsupported character: {char!r}')
+    return keysyms
+
+
+def value_to_text(num_value):
+    """
+    Return every digit of a number as text, e.g. for copying the display.
+
+    Unlike CalcEngine.float_to_str(), the text is not limited to the width
+    of the display: Decimals and floats are written in plain notation,
+    Fractions as their integer or numerator/denominator. The text can be
+    typed back with text_to_keysyms(). A number of a million digits takes
+    about a second, which is why the GUI converts such numbers in a worker
+    process.
+
+    Args:
+        num_value (Decimal | float | Fraction): The number.
+
+    Returns:
+        str: The text of the number.
+
+    Example:
+        >>> from decimal import Decimal
+        >>> from fractions import Fraction
+        >>> value_to_text(Decimal('1.5E+20'))
+        '150000000000000000000'
+        >>> value_to_text(Fraction(-1, 3))
+        '-1/3'
+    """
+    if isinstance(num_value, Fraction):
+        text = int_to_text(num_value.numerator)
+        if num_value.denominator != 1:
+            text += '/' + int_to_text(num_value.denominator)
+        return text
+
+    if not isinstance(num_value, Decimal):
+        num_value = to_decimal(num_value)
+    text = f'{num_value:f}'
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return text
+
+
+def _integer_digits(value):
+    """
+    Return about the number of integer digits of a Decimal or a Fraction.
+
+    Args:
+        value (Decimal | Fraction): A finite number.
+
+    Returns:
+        int: The number of integer digits, 0 or less below 1.
+    """
+    if isinstance(value, Fraction):
+        return ((value.numerator.bit_length()
+                 - value.denominator.bit_length()) * 3) // 10
+    return value.adjusted() + 1
+
+
+class _RecordedHistory:
+    """
+    A history keeping the entries appended by a detached engine, so that
+    they can be appended to the history of the calculator afterwards.
+
+    Attributes:
+        entries (list): (operand, operator, value, result) of every entry.
+    """
+
+    def __init__(self):
+        """
+        Initialize the _RecordedHistory class.
+
+        Returns:
+            None
+        """
+        self.entries = []
+
+    def append(self, operand, operator, value, result):
+        """
+        Record an entry, see calc_history.History.append().
+
+        Returns:
+            None
+        """
+        self.entries.append((operand, operator, value, result))
+
+
+def press_detached(backend, context, snapshot, keysym):
+    """
+    Press a key on an engine restored from a snapshot, in a worker process.
+
+    The GUI runs the keys estimated to be slow (see CalcEngine.is_slow())
+    with this function in a worker process, then restores the snapshot it
+    returns and appends the history entries to its own history.
+
+    Args:
+        backend (str): Name of the numeric backend.
+        context (decimal.Context): Decimal context of the calculations.
+        snapshot (tuple): Snapshot of the calculator, see
+            CalcEngine.snapshot().
+        keysym (str): Keysym of the key.
+
+    Returns:
+        tuple: (snapshot, entries) where snapshot is the snapshot of the
+        engine after the key and entries the history entries appended by
+        the key, as (operand, operator, value, result) tuples.
+    """
+    engine = CalcEngine(backend, context, history=_RecordedHistory())
+    engine.restore(snapshot)
+    engine.press_key(keysym)
+    return engine.snapshot(), engine.history.entries
+
+
+class DisplayText:
+    """
+    A plain display state holding the text of a calculator display.
+
+    It provides the get/set interface of tk.StringVar, so CalcEngine can
+    update its displays in the same way whether it runs headless or is
+    wrapped by the GUI.
+
+    Attributes:
+        value (str): Text of the display.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value='0'):
+        """
+        Initialize the DisplayText class.
+
+        Args:
+            value (str, optional): Initial text of the display. Defaults to
+                '0'.
+
+        Returns:
+            None
+        """
+        self.value = value
+
+    def get(self):
+        """
+        Return the text of the display.
+
+        Returns:
+            str: Text of the display.
+        """
+        return self.value
+
+    def set(self, value):
+        """
+        Set the text of the display.
+
+        Args:
+            value (str): New text of the display.
+
+        Returns:
+            None
+        """
+        self.value = value
+
+
+class CalcState:
+    """
+    The state of the arithmetic state machine of a CalcEngine.
+
+    Attributes:
+        accumulator (Decimal): Accumulator to store temporary results.
+        curr_value (Decimal): Represent the current value displayed on the
+            primary display.
+        last_operation (str): String to store the last operation performed.
+        switch (boolean): A switch variable to track the state of operator
+            buttons. Once an operator button is pressed the switch is set to
+            True, and subsequent presses of operator buttons merely switch
+            the operator sign. Defaults to False.
+        last_oper_eq_state (boolean): A boolean variable to track whether the
+            last operation performed was the equals (=) operation, ensuring
+            that subsequent numerical inputs after pressing equals don't
+            append to the previous result. Defaults to False.
+        btn_state (str): Represents certain button widgets state which changes
+            when error message is present in the display.
+        entry_value (Decimal): The full precision number shown rounded in the
+            primary display, when it is a result (of =, %, a function or a
+            constant). None when the primary display is typed.
+    """
+
+    __slots__ = ('accumulator', 'curr_value', 'last_operation', 'switch',
+                 'last_oper_eq_state', 'btn_state', 'entry_value')
+
+    def __init__(self, zero):
+        """
+        Initialize the CalcState class.
+
+        Args:
+            zero (Decimal | float | Fraction): Zero of the numeric backend,
+                the initial accumulator and current value.
+
+        Returns:
+            None
+        """
+        self.accumulator = zero
+        self.curr_value = zero
+        self.last_operation = ''
+        self.switch = False
+        self.last_oper_eq_state = False
+        self.btn_state = NORMAL
+        self.entry_value = None
+
+
+class CalcEngine:
+    """
+    A class containing the arithmetic state machine of the calculator.
+
+    This class defines methods for arithmetic operations such as addition,
+    subtraction, multiplication, division and percentage along with methods
+    for handling user input and error conditions. It keeps its displays in
+    DisplayText objects, so it does not need a Tk interpreter.
+
+    Attributes:
+        backend (NumberBackend): Numeric backend the calculations are done
+            with (see calc_backends module).
+        context (decimal.Context): Decimal context the calculations are done
+            in. Its precision and exponent limits bound the results.
+        history (History): History tape the completed calculations are
+            appended to, or None to keep no history.
+        pri_display_text (DisplayText): Display state of primary display.
+        sec_display_text (DisplayText): Display state of secondary display.
+        pri_display_width (int): Width of primary display.
+        sec_display_width (int): Width of secondary display.
+        full_precision (bool): Keep the full precision results of = and %
+            for the next operation (see read_entry()), instead of the number
+            of the primary display text. Set by the scientific calculator.
+            Defaults to False.
+        state (CalcState): State of the arithmetic state machine (the
+            accumulator, the last operation, the error state, etc.).
+        undo_stack (collections.deque): Snapshots of the states before the
+            last UNDO_LIMIT keystrokes, the latest last.
+        redo_stack (list): Snapshots of the undone states, the latest
+            undone last.
+        error (str): Error message for division by zero.
+        invalid_error (str): Error message for operations which are not
+            defined for the operands (e.g. square root of negative numbers).
+        overflow_error (str): Error message for results out of the bounds of
+            the backend (e.g. above 10 ** 10000 with the default context).
+        keysym_callbacks (dict): A dictionary representing keyboard event
+            keysyms (same as bound by the GUI) and reference to their
+            respective callback. Digits 1-9 are handled by enter_digit().
+            The 'undo' and 'redo' keysyms are bound to Ctrl-Z and Ctrl-Y by
+            the GUI. The letter keysyms and 'at', 'asciicircum' and
+            'exclam' are the keys of the scientific calculator.
+        disabled_keysyms (set): Keysyms of the buttons which are disabled
+            when error message is present in the display.
+
+    Note:
+        - Subclasses can replace pri_display_text and sec_display_text with
+          tk.StringVar objects and override disable_if_error() and
+          enable_after_error() to reflect the error state in the widgets.
+        - A snapshot of the calculator (see snapshot()) is a tuple of the
+          fields of state and of the display texts. The numbers and strings
+          are immutable, so the snapshots share them with the state instead
+          of copying them, and taking or restoring a snapshot is O(1).
+    """
+
+    def __init__(self, backend=None, context=None, history=None):
+        """
+        Initialize the CalcEngine class.
+
+        Args:
+            backend (str | NumberBackend, optional): Numeric backend, one of
+                'float', 'decimal' or 'fraction'. Defaults to 'decimal'.
+            context (decimal.Context, optional): Decimal context of the
+                calculations. Defaults to calc_backends.make_context().
+            history (History, optional): History tape of the completed
+                calculations (see calc_history module). Defaults to None.
+
+        Raises:
+            ValueError: If the backend is not known.
+
+        Returns:
+            None
+        """
+        self.backend = get_backend(backend)
+        self.context = context or make_context()
+        self.history = history
+        self.pri_display_text = DisplayText('0')
+        self.sec_display_text = DisplayText('0')
+        self.pri_display_width = 16
+        self.sec_display_width = 34
+        self.full_precision = False
+        self.state = CalcState(self.backend.zero)
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack = []
+        self.error = 'Div. by 0 Error!'
+        self.invalid_error = 'Invalid Input!'
+        self.overflow_error = 'Overflow Error!'
+
+        # A dictionary containing keysyms of the keyboard events bound by the
+        # GUI and reference to their respective callback.
+        self.keysym_callbacks = {'BackSpace': self.do_backspace,
+                                 'Escape': self.do_clear,
+                                 'Delete': self.do_clear_entry,
+                                 'percent': self.do_percent,
+                                 'slash': self.do_divd,
+                                 'asterisk': self.do_multi,
+                                 'minus': self.do_minus,
+                                 'plus': self.do_plus,
+                                 'F9': self.do_plusminus,
+                                 '0': self.do_digit_0,
+                                 'period': self.do_dot,
+                                 'equal': self.do_equal,
+                                 'Return': self.do_equal,
+                                 'undo': self.do_undo,
+                                 'redo': self.do_redo,
+                                 's': self.do_sin,
+                                 'o': self.do_cos,
+                                 't': self.do_tan,
+                                 'p': self.do_pi,
+                                 'n': self.do_ln,
+                                 'l': self.do_log,
+                                 'x': self.do_exp,
+                                 'e': self.do_e,
+                                 'q': self.do_square,
+                                 'at': self.do_sqrt,
+                                 'asciicircum': self.do_power,
+                                 'r': self.do_reciprocal,
+                                 'exclam': self.do_factorial,
+                                 'P': self.do_perm,
+                                 'C': self.do_comb}
+        # Keysyms which are unbound by the GUI when error message is present
+        # in the display.
+        self.disabled_keysyms = {'percent', 'slash', 'asterisk', 'minus',
+                                 'plus', 'F9', 'period', 'equal', 'Return',
+                                 's', 'o', 't', 'n', 'l', 'x', 'q', 'at',
+                                 'asciicircum', 'r', 'exclam', 'P', 'C'}
+
+    def str_to_float(self, str_value):
+        """
+        Convert a string to a number of the backend of the engine.
+
+        A display without any digit ('', or only a sign and a point such as
+        '-' or '-.') is an entry without digits yet, converted to zero, so
+        every number text written by the engine converts.
+
+        Args:
+            str_value (str): The string value to convert.
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - num_value (float): Stores the converted float value.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+            - Decimal raises decimal.InvalidOperation, not ValueError, for
+              text which is not a number.
+
+        Returns:
+            Decimal, float, Fraction or None: The converted number if
+            successful, None for text which is not a number (e.g. an error
+            message).
+        """
+        if not str_value.strip('-.'):
+            return self.backend.zero
+        try:
+            num_value = self.backend.convert(str_value)
+            return num_value
+        except (ValueError, InvalidOperation):
+            return None
+
+    def float_to_str(self, num_value):
+        """
+        Convert a floating-point number to a string.
+
+        The number is converted to a string once and the notation is picked
+        from its sign and adjusted exponent (the exponent of its leading
+        digit), so no intermediate Decimal objects are created and the
+        string is not re-parsed. Trailing zeros after the decimal point are
+        dropped. If the number does not fit into the primary display, it is
+        either rounded off to fit into the primary display or converted to
+        a string representing scientific notation.
+
+        When the context of the engine is more precise than DISPLAY_DIGITS,
+        the number is first rounded to DISPLAY_DIGITS digits, so a result
+        of a million digits is formatted from its leading digits and not
+        converted to a million character string. Every digit is converted
+        by value_to_text() instead, on demand.
+
+        Args:
+            num_value (Decimal | float | Fraction): The number to convert.
+                Numbers other than Decimal are converted with
+                calc_backends.to_decimal() first.
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - str_value (str): The converted string value.
+                - adjusted (int): Adjusted exponent of the num_value.
+                - sci_notation_len (int): The desired length of the scientific
+                  notation string representation. The resulting string length
+                  may vary depending on whether the number is negative or
+                  positive, as the representation includes a sign for
+                  negative numbers.
+                - int_len (int): Length of the integer part (including sign)
+                  of the str_value when lenght of the str_value is greater
+                  than primary display width and '.' is present.
+                - n_digits (int): Remaining number of digits after duducting
+                  (lenght of integer part + 1 for dot) from primary display
+                  width.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+
+        Returns:
+            str: The converted string representation of the number.
+        """
+        # Fast path of the float backend: a float whose shortest repr fits
+        # into the primary display is shown as is, without going through
+        # Decimal. float.__repr__ also gives the plain repr of numpy float64.
+        if isinstance(num_value, float):
+            str_value = float.__repr__(num_value)
+            # 'e' for scientific notation, 'n' for inf and nan.
+            if 'e' not in str_value and 'n' not in str_value:
+                str_value = str_value.rstrip('0').rstrip('.')
+                if len(str_value) <= self.pri_display_width:
+                    return str_value
+
+        if not isinstance(num_value, Decimal):
+            num_value = to_decimal(num_value)
+        if self.context.prec > DISPLAY_DIGITS:
+            num_value = DISPLAY_CONTEXT.create_decimal(num_value)
+
+        str_value = str(num_value)
+        sci_notation_len = 9 if num_value.is_signed() else 10
+
+        # Python converts small (like 0.00000008 becomes 8E-8) and large
+        # integral Decimal values to the scientific notation, but since we
+        # want to convert only when length of the whole value becomes more
+        # than primary display width, the value is formatted to the regular
+        # decimal number. Values whose leading digit is out of the primary
+        # display width are handled without expanding all their digits.
+        if 'E' in str_value and num_value.is_finite():
+            # Zero with an exponent (e.g. 0E-26) has no digit to show.
+            if num_value.is_zero():
+                return '-0' if num_value.is_signed() else '0'
+            adjusted = num_value.adjusted()
+            if adjusted >= self.pri_display_width or (
+                    adjusted < -self.pri_display_width
+                    and not num_value.is_signed()):
+                return f"{num_value:.{sci_notation_len}E}"
+            if adjusted < -self.pri_display_width:
+                # Tiny negative values round off to negative zero (e.g.
+                # -0.0000000000000) same as the rounding done below.
+                return f"{num_value:.{max(0, self.pri_display_width - 3)}f}"
+            str_value = f'{num_value:f}'
+
+        # Remove all trailing zero and then the '.' which is not followed by
+        # any digit when '.' is present in the string str_value.
+        if '.' in str_value:
+            str_value = str_value.rstrip('0').rstrip('.')
+
+        # If length of str_value is greater than primary display width.
+        if len(str_value) > self.pri_display_width:
+            int_len = str_value.find('.')
+
+            # When '.' is not present into str_value, or integer part is equal
+            # to the zero, or lenght of integer part is greater than primary
+            # display width, convert the value into scientific notation.
+            if (int_len == -1 or str_value.startswith('0.')
+                    or int_len > self.pri_display_width):
+                return f"{num_value:.{sci_notation_len}E}"
+
+            # If length of integer parts is less than or equal to primary
+            # display width, round off the value upto n_digits.
+            # Subtract 1 for the dicimal point in n_digits expresssion.
+            n_digits = self.pri_display_width - int_len - 1
+            str_value = f"{num_value:.{max(0, n_digits)}f}"
+
+            # If rounded off str_value become longer than primary display
+            # width (eg. 9999999999999999.8 becomes 10000000000000000), which
+            # may not fit into primary display, so convert it into scientific
+            # notation.
+            if len(str_value) > self.pri_display_width:
+                str_value = f"{Decimal(str_value):.{sci_notation_len}E}"
+
+        return str_value
+
+    def operand_str(self, num_value):
+        """
+        Convert an operand to a string for the secondary display.
+
+        With full_precision, an operand may have more digits than the
+        primary display shows, so it is shown the way the primary display
+        shows it (e.g. 0.11111111111 for 1/9 rather than the scientific
+        notation of all its digits), as if read from the display text.
+
+        Args:
+            num_value (Decimal | float | Fraction): The number to convert.
+
+        Returns:
+            str: The converted string representation of the number.
+        """
+        str_value = self.float_to_str(num_value)
+        if self.full_precision:
+            str_value = self.float_to_str(self.str_to_float(str_value))
+        return str_value
+
+    def clear_if_error(self):
+        """
+        Clear the display if an error message is present in the display.
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - str_value (str): The current string retrieved from primary
+                  display.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+
+        Returns:
+            None
+        """
+        str_value = self.pri_display_text.get()
+
+        if str_value in (self.error, self.invalid_error,
+                         self.overflow_error):
+            self.do_clear()
+            return True
+
+    def clear_if_last_oper_equal(self):
+        """
+        Reset the calculator state if the last operation performed was the
+        equals (=) operation and subsequent numerical key is pressed.
+
+        This method checks if the last operation performed was the equals
+        operation (=) (Note: last_operation is always equal when = button is
+        pressed or % operation is performed). It is used to control the
+        behavior of the calculator after the equals operation, ensuring that
+        subsequent numerical inputs after pressing equals don't append to the
+        previous result.
+
+        Returns:
+            None
+        """
+        if (self.state.last_operation == ''
+                and self.state.last_oper_eq_state is True):
+            self.do_clear()
+            self.state.last_oper_eq_state = False
+            return True
+
+    def clear_if_entry_value(self):
+        """
+        Start a new entry if the primary display shows a result, so typed
+        digits do not append to it.
+
+        Returns:
+            None
+        """
+        if self.state.entry_value is not None:
+            self.state.entry_value = None
+            self.pri_display_text.set('0')
+
+    def read_entry(self):
+        """
+        Return the number of the primary display.
+
+        Returns:
+            Decimal, float or Fraction: The full precision result when the
+            display shows one, otherwise the number of the display text.
+        """
+        if self.state.entry_value is not None:
+            return self.state.entry_value
+        return self.str_to_float(self.pri_display_text.get())
+
+    def disable_if_error(self):
+        """
+        Put the calculator into error state when an error message is present
+        in the display.
+
+        The engine only records the state in btn_state. Subclasses extend it
+        to disable certain calculator buttons (operator buttons).
+
+        Returns:
+            None
+        """
+        # btn_state changes when certain buttons are set to disabled due to
+        # error message present in the display.
+        self.state.btn_state = DISABLED
+
+    def enable_after_error(self):
+        """
+        Bring the calculator back from error state once it has been cleared.
+
+        The engine only records the state in btn_state. Subclasses extend it
+        to enable the buttons disabled by disable_if_error().
+
+        Returns:
+            None
+        """
+        self.state.btn_state = NORMAL
+
+    def do_clear(self, event=None):
+        """
+        Clear the calculator display and reset internal state.
+
+        This method clears primary and secondary displays of the calculator,
+        resetting them to '0'. Additionally, it resets the internal state of
+        the calculator by initializing the 'last_operation' to an empty string,
+        resetting the 'accumulator' to 0, and setting the 'switch' and
+        'last_oper_eq_state' to False.
+
+        Args:
+            event(tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the clear display
+                event. Defaults to None.
+
+        Note:
+            - If the calculator is in error state, enable_after_error() is
+              called to bring it back to its normal state.
+
+        Returns:
+            None
+        """
+        self.state.last_operation = ""
+        self.state.accumulator = self.backend.zero
+        self.state.switch = False
+        self.state.last_oper_eq_state = False
+        self.state.entry_value = None
+        self.pri_display_text.set('0')
+        self.sec_display_text.set('0')
+
+        if self.state.btn_state == DISABLED:
+            self.enable_after_error()
+
+    def do_clear_entry(self, event=None):
+        """
+        Clear the current entry on the calculator display.
+
+        It clears the current entry on the display if no error message is
+        present in the dipslay otherwise reset the calculator's internal state
+        to initial state.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the clear entry
+                event. Defaults to None.
+
+        Note:
+            - It also reset the calculator state if error is present in the
+              primary display or the last_operation is = (equal)
+              (last_operation is always equal when =  button is pressed or %
+              operation is performed).
+
+        Returns:
+            None
+        """
+        # If here is an error in the display or last performed operation was
+        # equal (=), reset the caculator's state and do nothing.
+        if self.clear_if_error() or self.clear_if_last_oper_equal():
+            return None
+
+        self.state.entry_value = None
+        self.pri_display_text.set('0')
+
+    def enter_digit(self, digit):
+        """
+        Handle digit input for the calculator.
+
+        This method appends the digit to the primary display, replacing the
+        initial '0', as long as the primary display has room for it.
+
+        Args:
+            digit (str): The pressed numerical button's text (0 to 9).
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - str_value (str): The current value displayed on the
+                  calculator.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+
+        Returns:
+            None
+        """
+        self.state.switch = False
+
+        self.clear_if_error()
+        self.clear_if_last_oper_equal()
+        self.clear_if_entry_value()
+
+        str_value = self.pri_display_text.get()
+
+        # Set the input value to the display.
+        if len(str_value) < self.pri_display_width:
+            if str_value == "0":
+                self.pri_display_text.set(digit)
+            else:
+                self.pri_display_text.set(str_value + digit)
+
+    def press_key(self, keysym):
+        """
+        Handle a keyboard event given by its keysym.
+
+        It lets the engine be driven by recorded keystrokes in the same way
+        the GUI is driven by the keyboard. Keys whose buttons are disabled
+        in error state are ignored as long as the calculator is in error
+        state. The keystroke is recorded in the undo stack (see
+        record_undo()).
+
+        Args:
+            keysym (str): Keysym of the pressed key (e.g. '7', 'plus',
+                'asterisk', 'Return').
+
+        Raises:
+            ValueError: If the keysym is not bound by the calculator.
+
+        Returns:
+            None
+        """
+        before = self.snapshot()
+
+        if keysym in '123456789' and len(keysym) == 1:
+            self.enter_digit(keysym)
+        elif keysym in self.keysym_callbacks:
+            if (self.state.btn_state == DISABLED
+                    and keysym in self.disabled_keysyms):
+                return None
+            self.keysym_callbacks[keysym]()
+            if keysym in UNDO_KEYSYMS:
+                return None
+        else:
+            raise ValueError(f'Unsupported keysym: {keysym!r}')
+
+        self.record_undo(before)
+
+    def is_slow(self, keysym):
+        """
+        Tell whether a key runs an operation estimated to be slow.
+
+        The estimate is made from the operation the key runs (a function,
+        or the pending operation for the keys completing it) and the size
+        of its operands, against SLOW_PRECISION, SLOW_ANGLE_DIGITS,
+        SLOW_FRACTION_BITS and SLOW_PRODUCT. The angle of sin, cos and tan
+        is reduced with as many more digits as it has integer digits, which
+        are added to the precision against SLOW_ANGLE_DIGITS. With the
+        default context, only operations on huge Fractions are slow: the
+        results of the other backends are bounded to 28 digits and
+        10 ** 10000.
+
+        Args:
+            keysym (str): Keysym of the key.
+
+        Returns:
+            bool: True if the key is estimated to take more than about
+            50 ms.
+        """
+        state = self.state
+        if self.backend.name == 'float' or state.btn_state == DISABLED:
+            return False
+
+        name = FUNCTION_KEYSYMS.get(keysym)
+        pending = name is None
+        if pending:
+            if (keysym not in OPERATION_KEYSYMS or not state.last_operation
+                    or (state.switch
+                        and keysym not in ('percent', 'equal', 'Return'))):
+                return False
+            name = state.last_operation
+
+        # The operands are only read when needed, as every key of the input
+        # queue is checked.
+        if name in SERIES_OPERATIONS and self.context.prec > SLOW_PRECISION:
+            return True
+        if (name in ANGLE_OPERATIONS and self.context.prec
+                + _integer_digits(self.read_entry()) > SLOW_ANGLE_DIGITS):
+            return True
+        if name in PRODUCT_OPERATIONS:
+            n_value = state.accumulator if pending else self.read_entry()
+            if n_value > SLOW_PRODUCT:
+                return True
+        if self.backend.name != 'fraction':
+            return False
+
+        operands = ((state.accumulator, self.read_entry()) if pending
+                    else (self.read_entry(),))
+        return any(operand.numerator.bit_length()
+                   + operand.denominator.bit_length() > SLOW_FRACTION_BITS
+                   for operand in operands)
+
+    def snapshot(self):
+        """
+        Return a snapshot of the state and displays of the calculator.
+
+        Returns:
+            tuple: The fields of state (in the order of CalcState.__slots__)
+            followed by the texts of the primary and secondary displays.
+        """
+        state = self.state
+        return (state.accumulator, state.curr_value, state.last_operation,
+                state.switch, state.last_oper_eq_state, state.btn_state,
+                state.entry_value, self.pri_display_text.get(),
+                self.sec_display_text.get())
+
+    def restore(self, snapshot):
+        """
+        Bring the calculator back to a snapshot taken by snapshot().
+
+        The error state is restored with disable_if_error() and
+        enable_after_error(), so subclasses update their widgets.
+
+        Args:
+            snapshot (tuple): The snapshot.
+
+        Returns:
+            None
+        """
+        state = self.state
+        (state.accumulator, state.curr_value, state.last_operation,
+         state.switch, state.last_oper_eq_state, btn_state,
+         state.entry_value, pri_display, sec_display) = snapshot
+        self.pri_display_text.set(pri_display)
+        self.sec_display_text.set(sec_display)
+
+        if btn_state != state.btn_state:
+            if btn_state == DISABLED:
+                self.disable_if_error()
+            else:
+                self.enable_after_error()
+
+    def record_undo(self, before):
+        """
+        Record the snapshot taken before a keystroke in the undo stack.
+
+        Keystrokes which change nothing (e.g. a digit when the display is
+        full) are not recorded. A recorded keystroke clears the redo stack.
+
+        Args:
+            before (tuple): Snapshot taken before the keystroke.
+
+        Returns:
+            None
+        """
+        if before != self.snapshot():
+            self.undo_stack.append(before)
+            if self.redo_stack:
+                self.redo_stack.clear()
+
+    def reset(self):
+        """
+        Clear the calculator and forget its undo and redo stacks, e.g. before
+        the engine is used for another session.
+
+        Returns:
+            None
+        """
+        self.do_clear()
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def do_undo(self, event=None):
+        """
+        Undo the last keystroke.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the undo event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        if self.undo_stack:
+            self.redo_stack.append(self.snapshot())
+            self.restore(self.undo_stack.pop())
+
+    def do_redo(self, event=None):
+        """
+        Redo the last undone keystroke.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the redo event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        if self.redo_stack:
+            self.undo_stack.append(self.snapshot())
+            self.restore(self.redo_stack.pop())
+
+    def do_dot(self, event=None):
+        """
+        Handle decimal point input for the calculator.
+
+        This method handles decimal point input for the calculator, updating
+        the display accordingly.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the decimal point
+                event. Defaults to None.
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - str_value (str): The current value displayed on the
+                  calculator.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+
+        Returns:
+            None
+        """
+        # switch (boolean): A variable that ensures that code inside the
+        # operation functions like 'do_plus' works only if there is input in
+        # the screen.
+        self.state.switch = False
+
+        self.clear_if_error()
+        self.clear_if_last_oper_equal()
+        self.clear_if_entry_value()
+
+        str_value = self.pri_display_text.get()
+
+        if len(str_value) < self.pri_display_width and '.' not in str_value:
+            self.pri_display_text.set(str_value + '.')
+
+    def do_digit_0(self, event=None):
+        """
+        Handle zero digit input for the calculator.
+
+        This method handles zero digit ('0') input for the calculator,
+        updating the display accordingly.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the zero digit
+                input event. Defaults to None.
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - str_value (str): The current value displayed on the
+                  calculator.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+
+        Returns:
+            None
+        """
+        self.state.switch = False
+
+        self.clear_if_error()
+        self.clear_if_last_oper_equal()
+        self.clear_if_entry_value()
+
+        str_value = self.pri_display_text.get()
+
+        if len(str_value) < self.pri_display_width and str_value != '0':
+            self.pri_display_text.set(str_value + '0')
+
+    def do_operation(self, curr_operation):
+        """
+        Handle addition, subtraction, multiplication and division operation
+        for the calculator.
+
+        This method handles the addition, subtraction, multiplication and
+        division operation for the calculator, updating the display and
+        internal state accordingly.
+
+        Args:
+            curr_operation (str): A string representing current operation.
+
+        Returns:
+            None
+        """
+        # If here is an error in the display, reset the calculator state and do
+        # nothing.
+        if self.clear_if_error():
+            return None
+
+        # Ensures that pressing + or - or x or / button subsequently has no
+        # effect as switch is set to True once any of the above mentioned
+        # button is clicked. It only helps to replace current operation to be
+        # performed.
+        if self.state.switch is False:
+            if self.state.last_operation == '':
+                self.state.accumulator = self.read_entry()
+                # Current operation becomes the last operation for any
+                # subsequent operation.
+                self.state.last_operation = curr_operation
+                self.state.entry_value = None
+                self.pri_display_text.set('0')
+                self.sec_display_text.set(self.operand_str(
+                    self.state.accumulator) + self.state.last_operation)
+            else:
+                self.do_equal(curr_operation=curr_operation)
+                # Current operation becomes the last operation for any
+                # subsequent operation.
+                self.state.last_operation = curr_operation
+
+        # This condition sets last_operation when user switch operations
+        # (eg. from + to x, etc) without any current value as input.
+        if self.state.switch is True:
+            self.state.last_operation = curr_operation
+            self.sec_display_text.set(self.operand_str(
+                self.state.accumulator) + self.state.last_operation)
+
+        self.state.switch = True
+
+    def do_plus(self, event=None):
+        """
+        Handle addition operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the addition event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_operation(curr_operation='+')
+
+    def do_minus(self, event=None):
+        """
+        Handle subtraction operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the substraction
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_operation(curr_operation='-')
+
+    def do_multi(self, event=None):
+        """
+        Handle multiplication operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the multiplication
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_operation(curr_operation='*')
+
+    def do_divd(self, event=None):
+        """
+        Handle division operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the division event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_operation(curr_operation='/')
+
+    def do_percent(self, event=None):
+        """
+        Handle percentage operation for the calculator.
+
+        This method calculates the percentage of the current value displayed
+        on the calculator. If no previous operation has been performed, it
+        calculates the percentage of the current value relative to zero. It
+        then updates the display and internal state accordingly.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the percentage
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        # If here is an error in the display, reset the calculator state and do
+        # nothing.
+        if self.clear_if_error():
+            return None
+
+        if self.state.last_operation == '':
+            self.state.accumulator = self.read_entry()
+
+        self.do_equal(curr_operation='%')
+        self.state.last_operation = ''
+
+    def do_equal(self, event=None, curr_operation='='):
+        """
+        Handle the equal sign button press to perform arithmetic calculations.
+
+        This method performs arithmetic calculations based on the last
+        operation and the current value displayed on the calculator. It
+        updates the secondary display with the operation and operand, performs
+        the calculation, updates the primary display with the result, and
+        resets the internal state accordingly.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the equal event.
+                Defaults to None.
+            curr_operation (str, optional): A string representing the
+                curr_operation. Defaults to '='.
+
+        Note:
+            - Errors raised by the operation, such as ZeroDivisionError
+              during division and percentage operation, are handled as per
+              the error policy of the operator kernel: the error message is
+              shown in the primary display and the calculator is put into
+              error state.
+            - The operation is done in the decimal context of the engine.
+              Results out of the bounds of the backend put the calculator
+              into error state with the overflow error message.
+            - The calculation, or its error message, is appended to the
+              history tape when the engine has one.
+
+        Returns:
+            None
+        """
+        # If here is an error in the display, reset the calculator state and do
+        # nothing.
+        if self.clear_if_error():
+            return None
+
+        # If last_operaton is set to '' and curr_operation is not set to '%',
+        # then do nothing. It also works when there is an error in the display
+        # which is reset by clear_if_error() as the same has been called above.
+        if self.state.last_operation == '' and curr_operation != '%':
+            return None
+
+        self.state.curr_value = self.read_entry()
+        self.state.entry_value = None
+
+        self.state.switch = False
+
+        # Set secondary display for three different conditions i.e. 5+8=, 5%,
+        # and 100*5% or 100/5% or 100-5% or 100+5%.
+
+        # Set the last_oper_eq_state to True if the last operation performed
+        # was the equals operation(=) (last_operation is always equal when =
+        # button is pressed or % operation is performed). It is used to
+        # control the behavior of the calculator after the equals operation,
+        # ensuring that subsequent numerical inputs after pressing equals don't
+        # append to the previous result.
+        if curr_operation == '=':
+            self.sec_display_text.set(self.operand_str(self.state.accumulator)
+                                      + self.state.last_operation
+                                      + self.operand_str(self.state.curr_value)
+                                      + '=')
+            self.state.last_oper_eq_state = True
+        elif self.state.last_operation == '' and curr_operation == '%':
+            self.sec_display_text.set(self.operand_str(self.state.accumulator)
+                                      + curr_operation)
+            self.state.last_oper_eq_state = True
+        elif self.state.last_operation != '' and curr_operation == '%':
+            self.sec_display_text.set(self.operand_str(self.state.accumulator)
+                                      + self.state.last_operation
+                                      + self.operand_str(self.state.curr_value)
+                                      + curr_operation
+                                      + '=')
+            self.state.last_oper_eq_state = True
+
+        # Below code perform calculation based on last_operation &
+        # curr_operation. The operator kernel of last_operation is looked up
+        # in the dispatch table, and its percent variant is used when
+        # curr_operation is %.
+        kernel = OPERATORS[self.state.last_operation]
+        operation = (kernel.percent if curr_operation == '%'
+                     else kernel.operation)
+
+        # Handle the errors (e.g. ZeroDivisionError) that may occur during
+        # the operation according to the error policy of the kernel, and
+        # results out of the bounds of the backend as overflow.
+        operand = self.state.accumulator
+        error_message = None
+        try:
+            with localcontext(self.context):
+                result = operation(self.state.accumulator,
+                                   self.state.curr_value)
+            in_range = self.backend.in_range
+            if in_range is not None and not in_range(result):
+                raise OverflowError(result)
+            self.state.accumulator = result
+        except kernel.errors:
+            error_message = getattr(self, kernel.error)
+        except OVERFLOW_ERRORS:
+            error_message = self.overflow_error
+
+        if self.history is not None:
+            self.history.append(self.float_to_str(operand),
+                                self.state.last_operation + curr_operation
+                                if curr_operation == '%'
+                                else self.state.last_operation,
+                                self.float_to_str(self.state.curr_value),
+                                error_message
+                                or self.float_to_str(self.state.accumulator))
+
+        if error_message is not None:
+            self.pri_display_text.set(error_message)
+            # Set secondary display in case of error occurred during series
+            # of operations like (5+8)/0+.
+            if curr_operation not in ('=', '%'):
+                self.sec_display_text.set(
+                    self.operand_str(self.state.accumulator)
+                    + self.state.last_operation
+                    + self.operand_str(self.state.curr_value) + '=')
+            self.disable_if_error()
+            return None
+
+        # Set primary display. With full_precision, the result is kept in
+        # full precision for the next operation or function.
+        # Excecuted when user presses equal (=) button.
+        if curr_operation == '=':
+            if self.full_precision:
+                self.state.entry_value = self.state.accumulator
+            self.pri_display_text.set(
+                self.float_to_str(self.state.accumulator))
+            self.state.last_operation = ''
+        # Set primary display when curr_operation is %.
+        elif curr_operation == '%':
+            if self.full_precision:
+                self.state.entry_value = self.state.accumulator
+            self.pri_display_text.set(
+                self.float_to_str(self.state.accumulator))
+        else:
+            # Executed when user want to calculated series of operations such
+            # as 10 + 20 + 30 - 23 * 4 etc.
+            self.pri_display_text.set('0')
+            self.sec_display_text.set(
+                self.operand_str(self.state.accumulator)+curr_operation)
+
+    def do_plusminus(self, event=None):
+        """
+        Toggle the sign of the number displayed on the calculator.
+
+        It changes the sign of the number displayed on the calculator's
+        primary display. If the number is positive, it becomes negative, and
+        vice versa.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the plusminus (+/-)
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        # If here is an error in the display we need to clear the error and do
+        # nothing.
+        if self.clear_if_error():
+            return None
+
+        if self.state.entry_value is not None:
+            self.state.entry_value = -self.state.entry_value
+            self.pri_display_text.set(
+                self.float_to_str(self.state.entry_value))
+            return None
+
+        self.pri_display_text.set(
+            self.float_to_str(-self.str_to_float(self.pri_display_text.get())))
+
+    def do_backspace(self, event=None):
+        """
+        Perform backspace operation on the calculator display.
+
+        This method removes the last character from the number displayed on
+        the calculator's primary display. If no digit is left after
+        backspacing (e.g. '-' or '-.'), it sets the display to '0'.
+
+        Note: It also reset the calculator state if error is present in the
+        primary display or the last_operation is = (equal) (last_operation is
+        always equal when =  button is pressed or % operation is performed).
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the backspace
+                event. Defaults to None.
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - str_value (str): A string variable to store primary display
+                  value.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+
+        Returns:
+            None
+        """
+        # If here is an error in the display or last performed operation was
+        # equal (=), reset the caculator's state and do nothing.
+        if self.clear_if_error() or self.clear_if_last_oper_equal():
+            return None
+
+        self.clear_if_last_oper_equal()
+        # The display text of a function result becomes a typed entry.
+        self.state.entry_value = None
+
+        str_value = self.pri_display_text.get()
+
+        if str_value != '0':
+            str_value = str_value[0:-1]
+            # Only a sign or a point left (e.g. '-' after backspacing '-4')
+            # is an entry without any digit.
+            if not str_value.strip('-.'):
+                str_value = '0'
+            self.pri_display_text.set(str_value)
+
+    def do_function(self, name):
+        """
+        Apply a function of the scientific calculator to the number of the
+        primary display.
+
+        The result replaces the number of the primary display, in full
+        precision (see read_entry()), and the secondary display shows the
+        function applied (e.g. 'sin(30)').
+
+        Args:
+            name (str): Name of the function in calc_scientific.FUNCTIONS
+                (e.g. 'sin', 'sqrt' or 'inv').
+
+        Note:
+            - Arguments out of the domain of the function (e.g. ln of a
+              negative number) put the calculator into error state with the
+              invalid error message, the reciprocal of zero with the
+              division by zero error message and results out of the bounds
+              of the backend with the overflow error message.
+            - The calculation, or its error message, is appended to the
+              history tape when the engine has one.
+
+        Returns:
+            None
+        """
+        # If here is an error in the display, reset the calculator state and do
+        # nothing.
+        if self.clear_if_error():
+            return None
+
+        function = FUNCTIONS[name]
+        value = self.read_entry()
+        self.state.switch = False
+
+        error_message = None
+        try:
+            with localcontext(self.context):
+                result = function(value)
+            in_range = self.backend.in_range
+            if in_range is not None and not in_range(result):
+                raise OverflowError(result)
+        except ZeroDivisionError:
+            error_message = self.error
+        except DOMAIN_ERRORS:
+            error_message = self.invalid_error
+        except OVERFLOW_ERRORS:
+            error_message = self.overflow_error
+
+        applied = f'{function.symbol}({self.operand_str(value)})'
+        if self.history is not None:
+            self.history.append('', name, self.float_to_str(value),
+                                error_message or self.float_to_str(result))
+
+        # Show the pending operation, if any, before the function applied.
+        if self.state.last_operation != '':
+            applied = (self.operand_str(self.state.accumulator)
+                       + self.state.last_operation + applied)
+        self.sec_display_text.set(applied)
+
+        if error_message is not None:
+            self.state.entry_value = None
+            self.pri_display_text.set(error_message)
+            self.disable_if_error()
+            return None
+
+        self.state.entry_value = result
+        self.pri_display_text.set(self.float_to_str(result))
+
+    def do_constant(self, name):
+        """
+        Enter a constant into the primary display.
+
+        The constant is entered in the precision of the decimal context of
+        the engine (see read_entry()), not only the digits displayed.
+
+        Args:
+            name (str): Name of the constant, either 'pi' or 'e'.
+
+        Returns:
+            None
+        """
+        with localcontext(self.context):
+            value = constant(name)
+        self.enter_value(value)
+
+    def enter_value(self, value):
+        """
+        Enter a number into the primary display, as if it had been typed.
+
+        The number is converted by the backend and rounded to the decimal
+        context of the engine. A number out of the bounds of the backend
+        puts the calculator into error state with the overflow error
+        message.
+
+        Args:
+            value (int | Decimal | Fraction): The number, e.g. a constant or
+                a result of the number theory panel.
+
+        Returns:
+            None
+        """
+        self.state.switch = False
+
+        self.clear_if_error()
+        self.clear_if_last_oper_equal()
+
+        try:
+            with localcontext(self.context):
+                value = +self.backend.convert(value)
+            in_range = self.backend.in_range
+            if in_range is not None and not in_range(value):
+                raise OverflowError(value)
+        except OVERFLOW_ERRORS:
+            self.state.entry_value = None
+            self.pri_display_text.set(self.overflow_error)
+            self.disable_if_error()
+            return None
+
+        self.state.entry_value = value
+        self.pri_display_text.set(self.float_to_str(value))
+
+    def do_sin(self, event=None):
+        """
+        Handle sine (sin) operation for the calculator, in radians.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the sine event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('sin')
+
+    def do_cos(self, event=None):
+        """
+        Handle cosine (cos) operation for the calculator, in radians.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the cosine event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('cos')
+
+    def do_tan(self, event=None):
+        """
+        Handle tangent (tan) operation for the calculator, in radians.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the tangent event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('tan')
+
+    def do_ln(self, event=None):
+        """
+        Handle natural logarithm (ln) operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the natural
+                logarithm event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('ln')
+
+    def do_log(self, event=None):
+        """
+        Handle common logarithm (log) operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the common
+                logarithm event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('log')
+
+    def do_exp(self, event=None):
+        """
+        Handle exponential (e^x) operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the exponential
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('exp')
+
+    def do_square(self, event=None):
+        """
+        Handle square (x^2) operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the square event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('sqr')
+
+    def do_sqrt(self, event=None):
+        """
+        Handle square root operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the square root
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('sqrt')
+
+    def do_reciprocal(self, event=None):
+        """
+        Handle reciprocal (1/x) operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the reciprocal
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('inv')
+
+    def do_power(self, event=None):
+        """
+        Handle power (x^y) operation for the calculator.
+
+        The power is a binary operation like addition, done by the '^'
+        operator kernel when = or another operator is pressed.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the power event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_operation(curr_operation='^')
+
+    def do_factorial(self, event=None):
+        """
+        Handle factorial (n!) operation for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the factorial
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_function('fact')
+
+    def do_perm(self, event=None):
+        """
+        Handle permutations (nPr) operation for the calculator.
+
+        The number of permutations of the operand items out of the
+        accumulator is a binary operation, done by the 'P' operator kernel
+        when = or another operator is pressed.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the permutations
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_operation(curr_operation='P')
+
+    def do_comb(self, event=None):
+        """
+        Handle combinations (nCr) operation for the calculator.
+
+        The number of combinations of the operand items out of the
+        accumulator is a binary operation, done by the 'C' operator kernel
+        when = or another operator is pressed.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the combinations
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_operation(curr_operation='C')
+
+    def do_pi(self, event=None):
+        """
+        Handle the pi constant input for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the pi event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_constant('pi')
+
+    def do_e(self, event=None):
+        """
+        Handle the e constant input for the calculator.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for the e event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.do_constant('e')
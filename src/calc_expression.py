@@ -0,0 +1,401 @@
+"""
+calc_expression module
+
+This module provides an infix expression front end for the calculator.
+
+Expressions such as '12.5*(3+4)%' are parsed into an abstract syntax tree
+(AST), compiled into a reusable closure and cached in an LRU cache keyed by
+the expression text, so repeated expressions skip parsing entirely. Unlike
+the button driven state machine of CalcEngine, which evaluates strictly from
+left to right, expressions follow the usual operator precedence and
+parentheses.
+
+Grammar:
+    expression := term (('+' | '-') term)*
+    term := unary (('*' | 'x' | '/') unary)*
+    unary := ('+' | '-') unary | percent
+    percent := primary '%'?
+    primary := NUMBER | '(' expression ')'
+
+The percentage follows the calculator semantics. When the right operand of
+a binary operator carries '%', the percent variant of the operator is used
+(e.g. '1250+10%' is 1250 + 1250 * (10/100) = 1375), otherwise 'a%' is
+a / 100.
+
+Functions:
+    parse_expression: Parse an expression into an AST.
+    compile_expression: Compile an expression into a cached closure.
+    evaluate: Evaluate an expression and format the result for the primary
+        display.
+
+Imports:
+    re: For tokenizing the expression.
+    functools: For the LRU cache of compiled expressions.
+    decimal: This module provides functionality for precise arithmetic
+      operations using the Decimal data type from the decimal module.
+    calc_backends: A custom module providing the overflow exceptions.
+    calc_engine: A custom module providing the CalcEngine class whose
+        float_to_str() method is used to format the results.
+    calc_kernels: A custom module providing the operator kernels of the
+        calculator.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_expression import evaluate
+    >>> evaluate('12.5*(3+4)%')
+    '0.875'
+    >>> evaluate('895 + 94.5 - 45 / 2 * 3')
+    '922'
+"""
+
+# Importing required modules
+import re
+from functools import lru_cache
+from decimal import Decimal, InvalidOperation, localcontext
+
+from calc_backends import OVERFLOW_ERRORS
+from calc_engine import CalcEngine
+from calc_kernels import get_operation
+
+# Regular expression matching one token (a number or a single character
+# operator) along with its leading whitespace.
+TOKEN_RE = re.compile(r'\s*(?:(\d+\.?\d*|\.\d+)|(\S))')
+
+# Operators accepted for multiplication and their canonical form.
+OPERATOR_ALIASES = {'x': '*', 'X': '*'}
+
+# Size of the LRU cache of compiled expressions.
+CACHE_SIZE = 1024
+
+# Most parentheses and unary signs nested in one another, each taking a few
+# frames of the recursive descent parser and of the compiled closures.
+# Chains of binary operators are flat, so they do not count.
+MAX_NESTING = 100
+
+
+def tokenize(text):
+    """
+    Split an expression into tokens.
+
+    Args:
+        text (str): The expression.
+
+    Raises:
+        ValueError: If the expression contains an unsupported character.
+
+    Returns:
+        list: Tokens of the expression. Numbers are Decimal objects,
+        operators and parentheses are strings.
+    """
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        number, symbol = match.groups()
+        if number is not None:
+            tokens.append(Decimal(number))
+        else:
+            symbol = OPERATOR_ALIASES.get(symbol, symbol)
+            if symbol not in '+-*/%()':
+                raise ValueError(f'Unsupported character {symbol!r} at '
+                                 f'position {match.start(2)}.')
+            tokens.append(symbol)
+        pos = match.end()
+
+    return tokens
+
+
+class _Parser:
+    """
+    A recursive descent parser producing the AST of an expression.
+
+    AST nodes are tuples:
+        - ('num', value): A number.
+        - ('neg', node): Negation of a node.
+        - ('pct', node): A node followed by '%'.
+        - ('chain', first, steps): Binary operations of the same precedence
+          applied from left to right, steps being a tuple of
+          (operator, node) pairs.
+
+    Attributes:
+        tokens (list): Tokens of the expression.
+        pos (int): Position of the next token.
+        nesting (int): Number of parentheses and unary signs being parsed.
+    """
+
+    def __init__(self, tokens):
+        """
+        Initialize the _Parser class.
+
+        Args:
+            tokens (list): Tokens returned by tokenize().
+
+        Returns:
+            None
+        """
+        self.tokens = tokens
+        self.pos = 0
+        self.nesting = 0
+
+    def peek(self):
+        """
+        Return the next token without consuming it, or None at the end.
+
+        Returns:
+            Decimal | str | None: The next token.
+        """
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
+
+    def take(self):
+        """
+        Consume and return the next token.
+
+        Raises:
+            ValueError: If there is no token left.
+
+        Returns:
+            Decimal | str: The consumed token.
+        """
+        token = self.peek()
+        if token is None:
+            raise ValueError('Unexpected end of expression.')
+        self.pos += 1
+        return token
+
+    def nest(self):
+        """
+        Enter a parenthesis or a unary sign.
+
+        Raises:
+            ValueError: If more than MAX_NESTING are nested.
+
+        Returns:
+            None
+        """
+        self.nesting += 1
+        if self.nesting > MAX_NESTING:
+            raise ValueError('Expression is nested too deeply.')
+
+    def parse(self):
+        """
+        Parse the whole token list.
+
+        Raises:
+            ValueError: If the tokens do not form a valid expression.
+
+        Returns:
+            tuple: Root node of the AST.
+        """
+        node = self.expression()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected token '{self.peek()}'.")
+        return node
+
+    def chain(self, operand, operators):
+        """
+        Parse a chain of binary operators of the same precedence.
+
+        The operations are collected in a loop into one flat node, so a long
+        chain does not nest the AST.
+
+        Args:
+            operand (function): Method parsing an operand of the chain.
+            operators (tuple): Operators of the chain.
+
+        Returns:
+            tuple: AST node.
+        """
+        node = operand()
+        steps = []
+        while self.peek() in operators:
+            steps.append((self.take(), operand()))
+        return ('chain', node, tuple(steps)) if steps else node
+
+    def expression(self):
+        """
+        Parse additions and subtractions.
+
+        Returns:
+            tuple: AST node.
+        """
+        return self.chain(self.term, ('+', '-'))
+
+    def term(self):
+        """
+        Parse multiplications and divisions.
+
+        Returns:
+            tuple: AST node.
+        """
+        return self.chain(self.unary, ('*', '/'))
+
+    def unary(self):
+        """
+        Parse unary plus and minus.
+
+        Returns:
+            tuple: AST node.
+        """
+        if self.peek() in ('-', '+'):
+            sign = self.take()
+            self.nest()
+            node = self.unary()
+            self.nesting -= 1
+            return ('neg', node) if sign == '-' else node
+        return self.percent()
+
+    def percent(self):
+        """
+        Parse an optional '%' following a primary.
+
+        Returns:
+            tuple: AST node.
+        """
+        node = self.primary()
+        if self.peek() == '%':
+            self.take()
+            node = ('pct', node)
+        return node
+
+    def primary(self):
+        """
+        Parse a number or a parenthesized expression.
+
+        Raises:
+            ValueError: If the next token is neither a number nor '('.
+
+        Returns:
+            tuple: AST node.
+        """
+        token = self.take()
+        if isinstance(token, Decimal):
+            return ('num', token)
+        if token == '(':
+            self.nest()
+            node = self.expression()
+            if self.take() != ')':
+                raise ValueError("Missing ')'.")
+            self.nesting -= 1
+            return node
+        raise ValueError(f"Unexpected token '{token}'.")
+
+
+def parse_expression(text):
+    """
+    Parse an expression into an AST.
+
+    Args:
+        text (str): The expression.
+
+    Raises:
+        ValueError: If the expression is not valid, or nested more deeply
+            than MAX_NESTING parentheses and unary signs.
+
+    Returns:
+        tuple: Root node of the AST (see _Parser for the node layout).
+    """
+    return _Parser(tokenize(text)).parse()
+
+
+def _compile_node(node):
+    """
+    Compile an AST node into a closure taking no argument.
+
+    Args:
+        node (tuple): AST node.
+
+    Returns:
+        function: A closure returning the Decimal value of the node.
+    """
+    kind = node[0]
+
+    if kind == 'num':
+        value = node[1]
+        return lambda: value
+
+    if kind == 'neg':
+        operand = _compile_node(node[1])
+        return lambda: -operand()
+
+    if kind == 'pct':
+        operand = _compile_node(node[1])
+        percent = get_operation('%')[1]
+        return lambda: percent(operand(), None)
+
+    _, first, steps = node
+    first = _compile_node(first)
+    compiled = []
+    for operator, right in steps:
+        # The percent variant of the operator takes the operand without '%'
+        # applied, e.g. 'a+b%' is a + a * (b/100).
+        if right[0] == 'pct':
+            operation = get_operation(operator + '%')[1]
+            right = _compile_node(right[1])
+        else:
+            operation = get_operation(operator)[1]
+            right = _compile_node(right)
+        compiled.append((operation, right))
+
+    def run():
+        value = first()
+        for operation, right in compiled:
+            value = operation(value, right())
+        return value
+
+    return run
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(text):
+    """
+    Compile an expression into a reusable closure.
+
+    Compiled expressions are cached by their text, so compiling the same
+    expression again skips tokenizing and parsing.
+
+    Args:
+        text (str): The expression.
+
+    Raises:
+        ValueError: If the expression is not valid.
+
+    Returns:
+        function: A closure returning the Decimal value of the expression.
+        It raises ZeroDivisionError or decimal.InvalidOperation on division
+        by zero.
+    """
+    return _compile_node(parse_expression(text))
+
+
+def evaluate(text, engine=None):
+    """
+    Evaluate an expression and format the result for the primary display.
+
+    Args:
+        text (str): The expression.
+        engine (CalcEngine, optional): The engine whose float_to_str() and
+            error message are used. Defaults to a new CalcEngine.
+
+    Raises:
+        ValueError: If the expression is not valid.
+
+    Returns:
+        str: Formatted result, or the division by zero or overflow error
+        message of the engine.
+    """
+    engine = engine or CalcEngine()
+    compiled = compile_expression(text)
+
+    try:
+        with localcontext(engine.context):
+            result = compiled()
+    except (ZeroDivisionError, InvalidOperation):
+        return engine.error
+    except OVERFLOW_ERRORS:
+        return engine.overflow_error
+    return engine.float_to_str(result)
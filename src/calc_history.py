@@ -0,0 +1,349 @@
+"""
+calc_history module
+
+This module provides the history tape of the calculator.
+
+Every completed calculation (the two operands, the operator, the result and
+a timestamp) is appended to a fixed capacity ring buffer. The ring buffer is
+a single buffer of fixed size records packed with the struct module, not a
+list of per entry objects, so a history of a million calculations takes
+about 100 MB of flat storage and no Python objects until an entry is read.
+
+With a path, the buffer is a memory-mapped file: appending writes one record
+and the header in place, and reopening the history at startup maps the
+file without reading or parsing it. Without a path, the buffer is a
+bytearray and the history is lost when the program exits.
+
+File layout:
+    header: magic (8 bytes), capacity and number of appended entries
+        (unsigned 64-bit integers, little endian).
+    records: capacity slots of RECORD, the entry n being in the slot
+        n % capacity.
+
+Classes:
+    HistoryEntry: A named tuple representing one calculation.
+    History: A fixed capacity ring buffer of calculations.
+
+Functions:
+    default_history_path: Return the path of the history file of the user.
+
+Imports:
+    collections: For the HistoryEntry named tuple.
+    mmap: For the memory-mapped history file.
+    os: For the default path and the size of the history file.
+    struct: For packing the records.
+    time: For the timestamps of the entries.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_history import History
+    >>> history = History(capacity=2)
+    >>> for result in ('1', '2', '3'):
+    ...     history.append('1', '+', result, result)
+    >>> [entry.result for entry in history]
+    ['2', '3']
+"""
+
+# Importing required modules
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+
+# Default number of entries kept by a history.
+CAPACITY = 100000
+
+# Magic bytes at the start of a history file.
+MAGIC = b'CALCHST1'
+
+# Header of a history file: magic, capacity and number of appended entries.
+HEADER = struct.Struct('<8sQQ')
+
+# Offset of the number of appended entries in the header.
+COUNT = struct.Struct('<Q')
+COUNT_OFFSET = 16
+
+# Size of the operand, value and result fields of a record. Texts longer
+# than their field are truncated, which does not happen with the display
+# formatter of the engine.
+TEXT_SIZE = 32
+
+# One entry: timestamp, display text of the left operand, operator, display
+# text of the right operand and of the result.
+RECORD = struct.Struct(f'<d{TEXT_SIZE}s4s{TEXT_SIZE}s{TEXT_SIZE}s')
+
+# Name of the history file in the home directory of the user.
+HISTORY_FILE = '.calc_history'
+
+HistoryEntry = namedtuple('HistoryEntry',
+                          'timestamp operand operator value result')
+HistoryEntry.__doc__ = """
+One calculation of the history.
+
+Attributes:
+    timestamp (float): Time of the calculation in seconds since the epoch.
+    operand (str): Display text of the accumulator (left operand).
+    operator (str): Operator of the calculation, e.g. '+' or '*%'.
+    value (str): Display text of the right operand.
+    result (str): Display text of the result, or the error message.
+"""
+
+
+def default_history_path():
+    """
+    Return the path of the history file of the user.
+
+    Returns:
+        str: Path of HISTORY_FILE in the home directory.
+    """
+    return os.path.join(os.path.expanduser('~'), HISTORY_FILE)
+
+
+def _decode(field):
+    """
+    Return the text of a NUL padded record field.
+
+    Args:
+        field (bytes): The field.
+
+    Returns:
+        str: The text.
+    """
+    return field.rstrip(b'\0').decode('ascii', 'replace')
+
+
+class History:
+    """
+    A fixed capacity ring buffer of calculations.
+
+    The oldest entries are overwritten once capacity entries have been
+    appended. Entries are indexed from the oldest (0) to the newest (-1).
+    Every entry also has a number, the value of count when it was appended,
+    which does not change when older entries are overwritten (see get()).
+
+    Attributes:
+        path (str): Path of the history file, or None for a history kept in
+            memory.
+        capacity (int): Number of entries kept.
+        count (int): Number of entries appended since the history was
+            created or cleared, including the overwritten ones.
+        generation (int): Number of times the history has been cleared since
+            it was opened, so that an index can tell a cleared history from
+            one that was appended to.
+        buffer (mmap.mmap | bytearray): Header and records.
+    """
+
+    def __init__(self, path=None, capacity=CAPACITY):
+        """
+        Initialize the History class.
+
+        Args:
+            path (str, optional): Path of the history file, which is created
+                when it does not exist. Defaults to None (kept in memory).
+            capacity (int, optional): Number of entries kept, for a new
+                history. An existing file keeps the capacity it was created
+                with. Defaults to CAPACITY.
+
+        Raises:
+            ValueError: If capacity is not positive, or if the file is not a
+                history file.
+            OSError: If the file cannot be opened.
+
+        Returns:
+            None
+        """
+        if capacity < 1:
+            raise ValueError(f'capacity must be positive, not {capacity}')
+
+        self.path = path
+        if path is None:
+            self.capacity = capacity
+            self.buffer = bytearray(HEADER.size + capacity * RECORD.size)
+            HEADER.pack_into(self.buffer, 0, MAGIC, capacity, 0)
+            self.count = 0
+        else:
+            self.buffer = self._map(path, capacity)
+            _, self.capacity, self.count = HEADER.unpack_from(self.buffer)
+        self.generation = 0
+
+    @staticmethod
+    def _map(path, capacity):
+        """
+        Map a history file, creating it when it does not exist.
+
+        Args:
+            path (str): Path of the history file.
+            capacity (int): Capacity of a new file.
+
+        Raises:
+            ValueError: If the file is not a history file.
+
+        Returns:
+            mmap.mmap: The mapped file.
+        """
+        with open(path, 'a+b') as file:
+            file.seek(0)
+            header = file.read(HEADER.size)
+            if not header:
+                # New file: the records are left to the file system as a
+                # sparse file, only the header is written.
+                file.write(HEADER.pack(MAGIC, capacity, 0))
+                file.truncate(HEADER.size + capacity * RECORD.size)
+                file.flush()
+            elif len(header) < HEADER.size or header[:8] != MAGIC:
+                raise ValueError(f'{path!r} is not a history file')
+            else:
+                capacity = HEADER.unpack(header)[1]
+                if os.fstat(file.fileno()).st_size != (HEADER.size
+                                                       + capacity
+                                                       * RECORD.size):
+                    raise ValueError(f'{path!r} is truncated')
+
+            return mmap.mmap(file.fileno(), 0)
+
+    @property
+    def first(self):
+        """
+        int: Number of the oldest entry kept.
+        """
+        return max(self.count - self.capacity, 0)
+
+    def __len__(self):
+        """
+        Return the number of entries kept.
+
+        Returns:
+            int: The number of entries, at most capacity.
+        """
+        return min(self.count, self.capacity)
+
+    def __getitem__(self, index):
+        """
+        Return an entry, from the oldest (0) to the newest (-1).
+
+        Args:
+            index (int): Index of the entry.
+
+        Raises:
+            IndexError: If there is no such entry.
+
+        Returns:
+            HistoryEntry: The entry.
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('history index out of range')
+
+        return self.get(self.count - length + index)
+
+    def get(self, number):
+        """
+        Return an entry by its number.
+
+        Args:
+            number (int): Number of the entry, from first to count - 1.
+
+        Raises:
+            IndexError: If the entry has been overwritten or does not exist.
+
+        Returns:
+            HistoryEntry: The entry.
+        """
+        if not self.first <= number < self.count:
+            raise IndexError(f'history entry {number} is not kept')
+
+        timestamp, *fields = RECORD.unpack_from(
+            self.buffer, HEADER.size + number % self.capacity * RECORD.size)
+        return HistoryEntry(timestamp, *map(_decode, fields))
+
+    def __iter__(self):
+        """
+        Iterate over the entries from the oldest to the newest.
+
+        Returns:
+            iterator: The entries.
+        """
+        return (self[index] for index in range(len(self)))
+
+    def append(self, operand, operator, value, result, timestamp=None):
+        """
+        Append a calculation, overwriting the oldest entry when full.
+
+        The record is written before the count in the header, so an
+        interrupted append does not leave a partial entry in the history.
+
+        Args:
+            operand (str): Display text of the accumulator.
+            operator (str): Operator of the calculation.
+            value (str): Display text of the right operand.
+            result (str): Display text of the result, or the error message.
+            timestamp (float, optional): Time of the calculation. Defaults to
+                the current time.
+
+        Returns:
+            None
+        """
+        slot = self.count % self.capacity
+        RECORD.pack_into(self.buffer, HEADER.size + slot * RECORD.size,
+                         time.time() if timestamp is None else timestamp,
+                         operand.encode('ascii', 'replace'),
+                         operator.encode('ascii', 'replace'),
+                         value.encode('ascii', 'replace'),
+                         result.encode('ascii', 'replace'))
+        self.count += 1
+        COUNT.pack_into(self.buffer, COUNT_OFFSET, self.count)
+
+    def clear(self):
+        """
+        Remove all the entries.
+
+        Returns:
+            None
+        """
+        self.count = 0
+        self.generation += 1
+        COUNT.pack_into(self.buffer, COUNT_OFFSET, 0)
+
+    def flush(self):
+        """
+        Write the changes of a memory-mapped history to its file.
+
+        Returns:
+            None
+        """
+        if self.path is not None:
+            self.buffer.flush()
+
+    def close(self):
+        """
+        Flush and close the history. It cannot be used afterwards.
+
+        Returns:
+            None
+        """
+        if self.path is not None and not self.buffer.closed:
+            self.buffer.flush()
+            self.buffer.close()
+
+    def __enter__(self):
+        """
+        Enter the runtime context of the history.
+
+        Returns:
+            History: The history itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Close the history when leaving the runtime context.
+
+        Returns:
+            None
+        """
+        self.close()
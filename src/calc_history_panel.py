@@ -0,0 +1,337 @@
+"""
+calc_history_panel module
+
+This module contains the history search panel of the calculator.
+
+The panel searches the history tape of the calculator by result value
+range, operator and substring of the result, using the indexes of
+calc_history_search module. The matching entries are shown in a
+virtualized list: the Listbox only ever holds the rows which are visible,
+and scrolling reads the entries of the new rows from the history, so the
+panel shows a million matches as fast as ten.
+
+A large history is indexed in steps scheduled with window.after(), so the
+calculator keeps responding while the panel is opened for the first time.
+Double clicking an entry types its result into the calculator.
+
+Classes:
+    HistoryPanel: A window to search the history tape of the calculator.
+
+Imports:
+    time: For the search time shown in the status line.
+    tkinter: For creating the GUI components of the panel.
+    calc_engine: A custom module providing the text_to_keysyms() function.
+    calc_history_search: A custom module providing the HistoryIndex class.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_history_panel import HistoryPanel
+    >>> panel = HistoryPanel(calc)
+"""
+
+# Importing required modules
+import time
+import tkinter as tk
+
+from calc_engine import text_to_keysyms
+from calc_history_search import HistoryIndex
+
+# Number of visible rows of the result list.
+ROWS = 16
+
+# Number of entries indexed per step when the panel is opened.
+INDEX_STEP = 20000
+
+# Operators offered by the operator filter, '' matching any operator. The
+# functions of the scientific calculator are recorded by their name.
+OPERATOR_CHOICES = ('', '+', '-', '*', '/', '%', '+%', '-%', '*%', '/%', '^',
+                    'P', 'C', 'sin', 'cos', 'tan', 'ln', 'log', 'exp', 'sqr',
+                    'sqrt', 'inv', 'fact')
+
+
+class HistoryPanel:
+    """
+    A window to search the history tape of the calculator.
+
+    Attributes:
+        calc (Calculator): The calculator whose history is searched.
+        index (HistoryIndex): Index of the history, shared by the panels of
+            the calculator through calc.history_index.
+        window (tk.Toplevel): The window of the panel.
+        low_var (tk.StringVar): Text of the smallest result value filter.
+        high_var (tk.StringVar): Text of the largest result value filter.
+        operator_var (tk.StringVar): The operator filter.
+        text_var (tk.StringVar): Text of the result substring filter.
+        status_var (tk.StringVar): Text of the status line.
+        listbox (tk.Listbox): The visible rows of the results.
+        scrollbar (tk.Scrollbar): Scrollbar of the results.
+        results (array.array): Entry numbers of the results.
+        top (int): Position in results of the first visible row.
+        search_pending (str): Identifier of the scheduled search, or None.
+        indexing (bool): True until the history has been indexed.
+    """
+
+    def __init__(self, calc):
+        """
+        Initialize the HistoryPanel class and open its window.
+
+        Args:
+            calc (Calculator): The calculator whose history is searched. Its
+                history must not be None.
+
+        Returns:
+            None
+        """
+        self.calc = calc
+        if calc.history_index is None:
+            calc.history_index = HistoryIndex(calc.history)
+        self.index = calc.history_index
+        self.results = ()
+        self.top = 0
+        self.search_pending = None
+        self.indexing = True
+
+        self.window = tk.Toplevel(calc.window)
+        self.window.title('History')
+        self.window.config(padx=10, pady=10, bg=calc.win_bg_color)
+
+        self.create_filters()
+        self.create_list()
+
+        self.window.bind('<Escape>', lambda event: self.window.destroy())
+        self.index_step()
+
+    def create_filters(self):
+        """
+        Create the filter entries of the panel.
+
+        Every change of a filter schedules a search.
+
+        Returns:
+            None
+        """
+        bg = self.calc.win_bg_color
+        filters = tk.Frame(self.window, bg=bg)
+        filters.grid(row=0, column=0, columnspan=2, sticky=tk.W + tk.E)
+
+        self.low_var = tk.StringVar(self.window)
+        self.high_var = tk.StringVar(self.window)
+        self.operator_var = tk.StringVar(self.window, '')
+        self.text_var = tk.StringVar(self.window)
+
+        tk.Label(filters, text='From', bg=bg).grid(row=0, column=0)
+        tk.Entry(filters, textvariable=self.low_var, width=10).grid(
+            row=0, column=1, padx=(2, 8))
+        tk.Label(filters, text='To', bg=bg).grid(row=0, column=2)
+        tk.Entry(filters, textvariable=self.high_var, width=10).grid(
+            row=0, column=3, padx=(2, 8))
+        tk.Label(filters, text='Operator', bg=bg).grid(row=0, column=4)
+        tk.OptionMenu(filters, self.operator_var, *OPERATOR_CHOICES).grid(
+            row=0, column=5, padx=(2, 8))
+        tk.Label(filters, text='Contains', bg=bg).grid(row=0, column=6)
+        tk.Entry(filters, textvariable=self.text_var, width=12).grid(
+            row=0, column=7, padx=(2, 0))
+
+        for variable in (self.low_var, self.high_var, self.operator_var,
+                         self.text_var):
+            variable.trace_add('write', self.schedule_search)
+
+        self.status_var = tk.StringVar(self.window)
+        tk.Label(self.window, textvariable=self.status_var, bg=bg,
+                 anchor=tk.W).grid(row=2, column=0, columnspan=2,
+                                   sticky=tk.W + tk.E)
+
+    def create_list(self):
+        """
+        Create the virtualized result list of the panel.
+
+        Returns:
+            None
+        """
+        self.listbox = tk.Listbox(self.window, height=ROWS, width=64,
+                                  font=('Courier New', '11'),
+                                  activestyle=tk.NONE)
+        self.listbox.grid(row=1, column=0, pady=(8, 4))
+        self.scrollbar = tk.Scrollbar(self.window, orient=tk.VERTICAL,
+                                      command=self.yview)
+        self.scrollbar.grid(row=1, column=1, sticky=tk.N + tk.S,
+                            pady=(8, 4))
+
+        # The Listbox holds only the visible rows, so its own scrolling is
+        # replaced by scrolling the results.
+        for sequence, units in (('<Up>', -1), ('<Down>', 1),
+                                ('<Prior>', -ROWS), ('<Next>', ROWS),
+                                ('<Button-4>', -3), ('<Button-5>', 3)):
+            self.listbox.bind(sequence,
+                              lambda event, units=units: self.scroll(units))
+        self.listbox.bind('<MouseWheel>', lambda event: self.scroll(
+            -3 if event.delta > 0 else 3))
+        self.listbox.bind('<Double-Button-1>', self.recall)
+        self.listbox.bind('<Return>', self.recall)
+
+    def index_step(self):
+        """
+        Index the next step of the history, then search when it is done.
+
+        Returns:
+            None
+        """
+        if not self.window.winfo_exists():
+            return None
+
+        if self.index.sync(limit=INDEX_STEP):
+            self.indexing = False
+            self.search()
+            return None
+
+        history = self.calc.history
+        self.status_var.set(f'Indexing {self.index.count - history.first} '
+                            f'of {len(history)} entries...')
+        self.window.after(1, self.index_step)
+
+    def schedule_search(self, *args):
+        """
+        Schedule a search when idle, once for any number of filter changes.
+
+        Args:
+            *args: Arguments of the variable trace, not used.
+
+        Returns:
+            None
+        """
+        if self.search_pending is None:
+            self.search_pending = self.window.after_idle(self.search)
+
+    def search(self):
+        """
+        Search the history with the filters and show the first results.
+
+        A value filter which is not a number is shown in the status line
+        and no search is done.
+
+        Returns:
+            None
+        """
+        self.search_pending = None
+        if self.indexing:
+            # index_step() searches when the history has been indexed.
+            return None
+
+        try:
+            low = float(self.low_var.get()) if self.low_var.get() else None
+            high = float(self.high_var.get()) if self.high_var.get() else None
+        except ValueError:
+            self.status_var.set('From and To must be numbers')
+            return None
+
+        start = time.perf_counter()
+        self.results = self.index.search(low=low, high=high,
+                                         operator=self.operator_var.get()
+                                         or None,
+                                         text=self.text_var.get().strip())
+        elapsed = time.perf_counter() - start
+
+        self.status_var.set(f'{len(self.results)} of '
+                            f'{len(self.calc.history)} entries '
+                            f'({elapsed * 1e3:.1f} ms)')
+        self.top = 0
+        self.render()
+
+    def render(self):
+        """
+        Show the visible rows of the results and update the scrollbar.
+
+        Returns:
+            None
+        """
+        history = self.calc.history
+        rows = []
+        for number in self.results[self.top:self.top + ROWS]:
+            try:
+                entry = history.get(number)
+            except IndexError:
+                # Overwritten since the search.
+                rows.append('')
+                continue
+            when = time.strftime('%Y-%m-%d %H:%M',
+                                 time.localtime(entry.timestamp))
+            rows.append(f'{when}  {entry.operand} {entry.operator} '
+                        f'{entry.value} = {entry.result}')
+
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *rows)
+
+        n_results = len(self.results)
+        if n_results <= ROWS:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.top / n_results,
+                               (self.top + ROWS) / n_results)
+
+    def scroll(self, units):
+        """
+        Scroll the results by a number of rows.
+
+        Args:
+            units (int): Number of rows, negative to scroll up.
+
+        Returns:
+            str: 'break', so the Listbox does not handle the event.
+        """
+        top = max(0, min(self.top + units, len(self.results) - ROWS))
+        if top != self.top:
+            self.top = top
+            self.render()
+        return 'break'
+
+    def yview(self, *args):
+        """
+        Scroll the results as requested by the scrollbar.
+
+        Args:
+            *args: ('moveto', fraction) or ('scroll', number, 'units' or
+                'pages').
+
+        Returns:
+            None
+        """
+        if args[0] == 'moveto':
+            self.scroll(int(float(args[1]) * len(self.results)) - self.top)
+        elif args[0] == 'scroll':
+            step = ROWS if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+    def recall(self, event=None):
+        """
+        Type the result of the selected entry into the calculator.
+
+        The bell rings if the result cannot be typed (e.g. an error
+        message). The sign of a negative result is typed with the +/- key,
+        as the minus key would start a subtraction.
+
+        Args:
+            event (tk.Event, optional): The double click event. Defaults to
+                None.
+
+        Returns:
+            None
+        """
+        selection = self.listbox.curselection()
+        if not selection or self.top + selection[0] >= len(self.results):
+            return None
+
+        try:
+            entry = self.calc.history.get(self.results[self.top
+                                                       + selection[0]])
+            result = entry.result
+            keysyms = text_to_keysyms(result.lstrip('-'))
+            if result.startswith('-'):
+                keysyms.append('F9')
+        except (IndexError, ValueError):
+            self.window.bell()
+            return None
+
+        # Clear the entry first, so the result replaces the displayed value.
+        self.calc.queue_keys(['Delete'] + keysyms)
@@ -0,0 +1,352 @@
+"""
+calc_history_search module
+
+This module provides the indexes used to search the history tape of the
+calculator (see calc_history module) by result value range, operator and
+substring of the result.
+
+A HistoryIndex keeps three indexes over the entries of a History:
+
+    - A sorted value index: the numeric result values in ascending order
+      along with the number of their entry, in two parallel arrays, so a
+      value range is found with two binary searches.
+    - An operator index: the numbers of the entries of every operator.
+    - An n-gram index: the numbers of the entries whose result contains
+      every substring of up to GRAM_SIZE characters. A query of up to
+      GRAM_SIZE characters is answered by one posting list without reading
+      the history, a longer query by the shortest posting list of its
+      n-grams, verified against the history.
+
+Entry numbers only grow, so the operator and n-gram posting lists are kept
+sorted by appending to them, and the overwritten entries of the ring buffer
+are at their start, where they are skipped with a binary search and
+trimmed once every capacity entries. The indexes are brought up to date
+with the history by sync(), which indexes only the entries appended since
+the previous call, and is called by every search.
+
+Classes:
+    HistoryIndex: Indexes the entries of a History for search.
+
+Imports:
+    array: For the compact posting lists and value index.
+    bisect: For the binary searches in the sorted arrays.
+    math: For the NaN value of the entries whose result is not a number.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_history import History
+    >>> from calc_history_search import HistoryIndex
+    >>> history = History()
+    >>> history.append('15', '*', '4', '60')
+    >>> history.append('60', '+%', '10', '66')
+    >>> history.append('5', '/', '0', 'Div. by 0 Error!')
+    >>> index = HistoryIndex(history)
+    >>> list(index.search(low=50, high=70))
+    [0, 1]
+    >>> list(index.search(text='6'))
+    [1, 0]
+    >>> list(index.search(operator='/'))
+    [2]
+"""
+
+# Importing required modules
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+
+from calc_history import TEXT_SIZE
+
+# Longest substring indexed by the n-gram index.
+GRAM_SIZE = 3
+
+# Slices of the n-grams of a text, by length of the text. Results are at
+# most TEXT_SIZE characters long.
+GRAM_SLICES = [[slice(start, start + size)
+                for size in range(1, GRAM_SIZE + 1)
+                for start in range(length - size + 1)]
+               for length in range(TEXT_SIZE + 1)]
+
+# Number of new entries above which sync() rebuilds the value index with
+# one sort instead of inserting the entries one by one.
+BULK_SIZE = 1024
+
+
+class HistoryIndex:
+    """
+    Indexes the entries of a History for search.
+
+    Attributes:
+        history (History): The indexed history.
+        count (int): Number of the next entry to index, the count of the
+            history when it was last synced.
+        generation (int): Generation of the history when the indexes were
+            last emptied.
+        values (array.array): Numeric result values, in ascending order.
+        numbers (array.array): Entry number of every value of values.
+        slot_values (array.array): Result value of the entry kept in every
+            slot of the ring buffer, NaN if it is not a number.
+        slot_operators (bytearray): Operator code of the entry kept in every
+            slot of the ring buffer.
+        operator_codes (dict): Code of every operator seen so far.
+        operators (dict): Posting list of the entry numbers of every
+            operator.
+        grams (dict): Posting list of the entry numbers of every substring of
+            up to GRAM_SIZE characters of the results.
+        trimmed (int): Entry count at which the posting lists were last
+            trimmed.
+        unsorted (bool): True if entries have been indexed in bulk and the
+            value index is to be rebuilt when the indexes are up to date.
+    """
+
+    def __init__(self, history):
+        """
+        Initialize the HistoryIndex class.
+
+        The entries of history are indexed by the first call of sync() or
+        search().
+
+        Args:
+            history (History): The history to index.
+
+        Returns:
+            None
+        """
+        self.history = history
+        self.reset()
+
+    def reset(self):
+        """
+        Empty the indexes, so the next sync() indexes every kept entry.
+
+        Returns:
+            None
+        """
+        capacity = self.history.capacity
+        self.count = self.history.first
+        self.generation = self.history.generation
+        self.values = array('d')
+        self.numbers = array('q')
+        self.slot_values = array('d', [math.nan]) * capacity
+        self.slot_operators = bytearray(capacity)
+        self.operator_codes = {}
+        self.operators = {}
+        self.grams = {}
+        self.trimmed = self.count
+        self.unsorted = False
+
+    def sync(self, limit=None):
+        """
+        Index the entries appended to the history since the last call.
+
+        The indexes are rebuilt when the history has been cleared or when
+        more than its capacity has been appended since the last call.
+
+        Args:
+            limit (int, optional): Most entries to index, so that a large
+                history can be indexed in steps. Defaults to None (all).
+
+        Returns:
+            bool: True if the indexes are up to date with the history.
+        """
+        history = self.history
+        if (history.generation != self.generation
+                or history.count < self.count
+                or history.count - self.count > history.capacity):
+            self.reset()
+
+        stop = history.count
+        if limit is not None:
+            stop = min(stop, self.count + limit)
+        if history.count - self.count > BULK_SIZE:
+            self.unsorted = True
+
+        for number in range(self.count, stop):
+            self._add(number, history.get(number), self.unsorted)
+        self.count = stop
+
+        if self.count - self.trimmed >= history.capacity:
+            self._trim()
+        if self.count < history.count:
+            return False
+
+        if self.unsorted:
+            self._sort_values()
+            self.unsorted = False
+        return True
+
+    def _add(self, number, entry, bulk):
+        """
+        Index one entry.
+
+        Args:
+            number (int): Number of the entry.
+            entry (HistoryEntry): The entry.
+            bulk (bool): If True, the value index is left to _sort_values().
+
+        Returns:
+            None
+        """
+        capacity = self.history.capacity
+        slot = number % capacity
+
+        # The entry overwrites the entry number - capacity in the ring
+        # buffer, which is removed from the value index.
+        evicted = self.slot_values[slot]
+        if not bulk and number >= capacity and evicted == evicted:
+            position = bisect_left(self.values, evicted)
+            while self.numbers[position] != number - capacity:
+                position += 1
+            del self.values[position]
+            del self.numbers[position]
+
+        result = entry.result
+        try:
+            value = float(result)
+        except ValueError:
+            value = math.nan
+        self.slot_values[slot] = value
+        if not bulk and value == value:
+            position = bisect_right(self.values, value)
+            self.values.insert(position, value)
+            self.numbers.insert(position, number)
+
+        operator = entry.operator
+        code = self.operator_codes.setdefault(operator,
+                                              len(self.operator_codes))
+        self.slot_operators[slot] = code
+        self.operators.setdefault(operator, array('q')).append(number)
+
+        grams = self.grams
+        for gram in {result[gram_slice]
+                     for gram_slice in GRAM_SLICES[len(result)]}:
+            try:
+                grams[gram].append(number)
+            except KeyError:
+                grams[gram] = array('q', [number])
+
+    def _sort_values(self):
+        """
+        Rebuild the value index from the values of the kept entries.
+
+        Returns:
+            None
+        """
+        capacity = self.history.capacity
+        slot_values = self.slot_values
+        numbers = [number for number in range(self.history.first, self.count)
+                   if slot_values[number % capacity]
+                   == slot_values[number % capacity]]
+        numbers.sort(key=lambda number: slot_values[number % capacity])
+        self.numbers = array('q', numbers)
+        self.values = array('d', [slot_values[number % capacity]
+                                  for number in numbers])
+
+    def _trim(self):
+        """
+        Remove the overwritten entries from the posting lists.
+
+        Returns:
+            None
+        """
+        first = self.history.first
+        for index in (self.operators, self.grams):
+            for key, postings in list(index.items()):
+                del postings[:bisect_left(postings, first)]
+                if not postings:
+                    del index[key]
+        self.trimmed = self.count
+
+    def _postings(self, index, key):
+        """
+        Return the kept entry numbers of a posting list, in ascending order.
+
+        Args:
+            index (dict): The operator or n-gram index.
+            key (str): The operator or n-gram.
+
+        Returns:
+            array.array: The entry numbers.
+        """
+        postings = index.get(key)
+        if postings is None:
+            return array('q')
+        return postings[bisect_left(postings, self.history.first):]
+
+    def search(self, low=None, high=None, operator=None, text=None):
+        """
+        Return the entries matching all the given criteria.
+
+        The criterion with the fewest candidate entries is read from its
+        index, and its candidates are checked against the other criteria.
+
+        Args:
+            low (float, optional): Smallest result value. Defaults to None.
+            high (float, optional): Largest result value. Defaults to None.
+            operator (str, optional): Operator of the entries (e.g. '+' or
+                '*%'). Defaults to None.
+            text (str, optional): Substring of the result text. Defaults to
+                None.
+
+        Returns:
+            array.array: Numbers of the matching entries, in ascending order
+            of their result value when low or high is given, newest first
+            otherwise.
+        """
+        self.sync()
+        capacity = self.history.capacity
+        slot_values = self.slot_values
+        by_value = low is not None or high is not None
+
+        candidates = []
+        if by_value:
+            start = 0 if low is None else bisect_left(self.values, low)
+            stop = (len(self.values) if high is None
+                    else bisect_right(self.values, high))
+            candidates.append(('value', self.numbers[start:stop]))
+        if operator is not None:
+            candidates.append(('operator',
+                               self._postings(self.operators, operator)))
+        if text:
+            grams = ([text] if len(text) <= GRAM_SIZE
+                     else [text[start:start + GRAM_SIZE]
+                           for start in range(len(text) - GRAM_SIZE + 1)])
+            text_numbers = min((self._postings(self.grams, gram)
+                                for gram in grams), key=len)
+            candidates.append(('text', text_numbers))
+        if not candidates:
+            candidates.append(('all', array('q', range(self.history.first,
+                                                       self.count))))
+
+        criterion, numbers = min(candidates, key=lambda item: len(item[1]))
+
+        checks = []
+        if by_value and criterion != 'value':
+            low = -math.inf if low is None else low
+            high = math.inf if high is None else high
+            checks.append(lambda number:
+                          low <= slot_values[number % capacity] <= high)
+        if operator is not None and criterion != 'operator':
+            code = self.operator_codes.get(operator)
+            slot_operators = self.slot_operators
+            checks.append(lambda number:
+                          slot_operators[number % capacity] == code)
+        if text and criterion != 'text':
+            text_set = set(text_numbers)
+            checks.append(text_set.__contains__)
+        if text and len(text) > GRAM_SIZE:
+            # The n-grams of the text do not tell where they are in the
+            # result, so the candidates are verified against the history.
+            get = self.history.get
+            checks.append(lambda number: text in get(number).result)
+        for check in checks:
+            numbers = array('q', [number for number in numbers
+                                  if check(number)])
+
+        if not by_value:
+            return numbers[::-1]
+        if criterion != 'value':
+            return array('q', sorted(
+                numbers, key=lambda number: slot_values[number % capacity]))
+        return numbers
@@ -0,0 +1,122 @@
+"""
+calc_icon module
+
+This module embeds the window icon of the calculator (static/calc_fevicon.png)
+as base64 encoded PNG data, so that the icon is loaded with the module
+instead of being read from a path relative to the working directory.
+
+Regenerate ICON_DATA after changing static/calc_fevicon.png:
+
+    $ python -c "import base64; print(base64.b64encode(
+    ...     open('static/calc_fevicon.png', 'rb').read()).decode())"
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+"""
+
+# Base64 encoded PNG data of static/calc_fevicon.png, to be passed as the
+# data option of tk.PhotoImage.
+ICON_DATA = (
+    'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAKN2lDQ1BzUkdCIElFQzYxOTY2LTIu'
+    'MQAAeJydlndUU9kWh8+9N71QkhCKlNBraFICSA29SJEuKjEJEErAkAAiNkRUcERRkaYIMijggKND'
+    'kbEiioUBUbHrBBlE1HFwFBuWSWStGd+8ee/Nm98f935rn73P3Wfvfda6AJD8gwXCTFgJgAyhWBTh'
+    '58WIjYtnYAcBDPAAA2wA4HCzs0IW+EYCmQJ82IxsmRP4F726DiD5+yrTP4zBAP+flLlZIjEAUJiM'
+    '5/L42VwZF8k4PVecJbdPyZi2NE3OMErOIlmCMlaTc/IsW3z2mWUPOfMyhDwZy3PO4mXw5Nwn4405'
+    'Er6MkWAZF+cI+LkyviZjg3RJhkDGb+SxGXxONgAoktwu5nNTZGwtY5IoMoIt43kA4EjJX/DSL1jM'
+    'zxPLD8XOzFouEiSniBkmXFOGjZMTi+HPz03ni8XMMA43jSPiMdiZGVkc4XIAZs/8WRR5bRmyIjvY'
+    'ODk4MG0tbb4o1H9d/JuS93aWXoR/7hlEH/jD9ld+mQ0AsKZltdn6h21pFQBd6wFQu/2HzWAvAIqy'
+    'vnUOfXEeunxeUsTiLGcrq9zcXEsBn2spL+jv+p8Of0NffM9Svt3v5WF485M4knQxQ143bmZ6pkTE'
+    'yM7icPkM5p+H+B8H/nUeFhH8JL6IL5RFRMumTCBMlrVbyBOIBZlChkD4n5r4D8P+pNm5lona+BHQ'
+    'llgCpSEaQH4eACgqESAJe2Qr0O99C8ZHA/nNi9GZmJ37z4L+fVe4TP7IFiR/jmNHRDK4ElHO7Jr8'
+    'WgI0IABFQAPqQBvoAxPABLbAEbgAD+ADAkEoiARxYDHgghSQAUQgFxSAtaAYlIKtYCeoBnWgETSD'
+    'NnAYdIFj4DQ4By6By2AE3AFSMA6egCnwCsxAEISFyBAVUod0IEPIHLKFWJAb5AMFQxFQHJQIJUNC'
+    'SAIVQOugUqgcqobqoWboW+godBq6AA1Dt6BRaBL6FXoHIzAJpsFasBFsBbNgTzgIjoQXwcnwMjgf'
+    'LoK3wJVwA3wQ7oRPw5fgEVgKP4GnEYAQETqiizARFsJGQpF4JAkRIauQEqQCaUDakB6kH7mKSJGn'
+    'yFsUBkVFMVBMlAvKHxWF4qKWoVahNqOqUQdQnag+1FXUKGoK9RFNRmuizdHO6AB0LDoZnYsuRleg'
+    'm9Ad6LPoEfQ4+hUGg6FjjDGOGH9MHCYVswKzGbMb0445hRnGjGGmsVisOtYc64oNxXKwYmwxtgp7'
+    'EHsSewU7jn2DI+J0cLY4X1w8TogrxFXgWnAncFdwE7gZvBLeEO+MD8Xz8MvxZfhGfA9+CD+OnyEo'
+    'E4wJroRIQiphLaGS0EY4S7hLeEEkEvWITsRwooC4hlhJPEQ8TxwlviVRSGYkNimBJCFtIe0nnSLd'
+    'Ir0gk8lGZA9yPFlM3kJuJp8h3ye/UaAqWCoEKPAUVivUKHQqXFF4pohXNFT0VFysmK9YoXhEcUjx'
+    'qRJeyUiJrcRRWqVUo3RU6YbStDJV2UY5VDlDebNyi/IF5UcULMWI4kPhUYoo+yhnKGNUhKpPZVO5'
+    '1HXURupZ6jgNQzOmBdBSaaW0b2iDtCkVioqdSrRKnkqNynEVKR2hG9ED6On0Mvph+nX6O1UtVU9V'
+    'vuom1TbVK6qv1eaoeajx1UrU2tVG1N6pM9R91NPUt6l3qd/TQGmYaYRr5Grs0Tir8XQObY7LHO6c'
+    'kjmH59zWhDXNNCM0V2ju0xzQnNbS1vLTytKq0jqj9VSbru2hnaq9Q/uE9qQOVcdNR6CzQ+ekzmOG'
+    'CsOTkc6oZPQxpnQ1df11Jbr1uoO6M3rGelF6hXrtevf0Cfos/ST9Hfq9+lMGOgYhBgUGrQa3DfGG'
+    'LMMUw12G/YavjYyNYow2GHUZPTJWMw4wzjduNb5rQjZxN1lm0mByzRRjyjJNM91tetkMNrM3SzGr'
+    'MRsyh80dzAXmu82HLdAWThZCiwaLG0wS05OZw2xljlrSLYMtCy27LJ9ZGVjFW22z6rf6aG1vnW7d'
+    'aH3HhmITaFNo02Pzq62ZLde2xvbaXPJc37mr53bPfW5nbse322N3055qH2K/wb7X/oODo4PIoc1h'
+    '0tHAMdGx1vEGi8YKY21mnXdCO3k5rXY65vTW2cFZ7HzY+RcXpkuaS4vLo3nG8/jzGueNueq5clzr'
+    'XaVuDLdEt71uUnddd457g/sDD30PnkeTx4SnqWeq50HPZ17WXiKvDq/XbGf2SvYpb8Tbz7vEe9CH'
+    '4hPlU+1z31fPN9m31XfKz95vhd8pf7R/kP82/xsBWgHcgOaAqUDHwJWBfUGkoAVB1UEPgs2CRcE9'
+    'IXBIYMj2kLvzDecL53eFgtCA0O2h98KMw5aFfR+OCQ8Lrwl/GGETURDRv4C6YMmClgWvIr0iyyLv'
+    'RJlESaJ6oxWjE6Kbo1/HeMeUx0hjrWJXxl6K04gTxHXHY+Oj45vipxf6LNy5cDzBPqE44foi40V5'
+    'iy4s1licvvj4EsUlnCVHEtGJMYktie85oZwGzvTSgKW1S6e4bO4u7hOeB28Hb5Lvyi/nTyS5JpUn'
+    'PUp2Td6ePJninlKR8lTAFlQLnqf6p9alvk4LTduf9ik9Jr09A5eRmHFUSBGmCfsytTPzMoezzLOK'
+    's6TLnJftXDYlChI1ZUPZi7K7xTTZz9SAxESyXjKa45ZTk/MmNzr3SJ5ynjBvYLnZ8k3LJ/J9879e'
+    'gVrBXdFboFuwtmB0pefK+lXQqqWrelfrry5aPb7Gb82BtYS1aWt/KLQuLC98uS5mXU+RVtGaorH1'
+    'futbixWKRcU3NrhsqNuI2ijYOLhp7qaqTR9LeCUXS61LK0rfb+ZuvviVzVeVX33akrRlsMyhbM9W'
+    'zFbh1uvb3LcdKFcuzy8f2x6yvXMHY0fJjpc7l+y8UGFXUbeLsEuyS1oZXNldZVC1tep9dUr1SI1X'
+    'TXutZu2m2te7ebuv7PHY01anVVda926vYO/Ner/6zgajhop9mH05+x42Rjf2f836urlJo6m06cN+'
+    '4X7pgYgDfc2Ozc0tmi1lrXCrpHXyYMLBy994f9Pdxmyrb6e3lx4ChySHHn+b+O31w0GHe4+wjrR9'
+    'Z/hdbQe1o6QT6lzeOdWV0iXtjusePhp4tLfHpafje8vv9x/TPVZzXOV42QnCiaITn07mn5w+lXXq'
+    '6enk02O9S3rvnIk9c60vvG/wbNDZ8+d8z53p9+w/ed71/LELzheOXmRd7LrkcKlzwH6g4wf7HzoG'
+    'HQY7hxyHui87Xe4Znjd84or7ldNXva+euxZw7dLI/JHh61HXb95IuCG9ybv56Fb6ree3c27P3Flz'
+    'F3235J7SvYr7mvcbfjT9sV3qID0+6j068GDBgztj3LEnP2X/9H686CH5YcWEzkTzI9tHxyZ9Jy8/'
+    'Xvh4/EnWk5mnxT8r/1z7zOTZd794/DIwFTs1/lz0/NOvm1+ov9j/0u5l73TY9P1XGa9mXpe8UX9z'
+    '4C3rbf+7mHcTM7nvse8rP5h+6PkY9PHup4xPn34D94Tz+49wZioAAAAJcEhZcwAALiMAAC4jAXil'
+    'P3YAAAxCSURBVHicxVtPrFZHFT8z7ysV5HWldYG0lLhoSlyUmGja11gTWQk0qTzSKJXIoi5dtXtd'
+    'tiuXbRRtRUN4SFpo3EAiJI+4EqzR2IW2VONCa9KGR6Hw4I5n5s45c86Z+b7vfg/fY977cv/NvXd+'
+    'v/mdPzP33lEIAWYti2+s7IAOvgkBFvD8Xbh8CHdvxUttgXy50NEK6OWQ4vTSecfbrl+9juvXnHP/'
+    'wOVfwMMyLs8tPT9/ZVYso6EVF3+5MkIQz+HvBwj+SQTuIqggACrQBngYQgThNASkTqJ9kQyXiN4C'
+    'LjyI619xwR1GEgJ2zEXcftV5OH7iu/O3h+AaRACCfxZv+AoC30lAK+AEWgJW2zNIwJUeF72e1omM'
+    'qIqQ749E4C6s5WABiVgIHfzo4LGVF08cmj817VYTCcCLfA7vdxSB78Nff/NQwFngQa2PMYEBCggu'
+    'qO3EgCSjRUSXt1GYSMLO4OE32P4zuH7kxHfm/zszAXjy48jkWwh8OwHC7QKuM8A7A/ouFOCMAhIh'
+    'kgxviPCCJI9q6FzfLg/7cO3SwV+tPIMmcXkwASj5r+MFTiOoB6iXVa8zEWIf4ZMkERkwmw8AowDH'
+    '4IoKsy/oiUhgQ6+GLp+fDid1bMfFeSRhP5JwYSoBCH53C7wE3oMWQIMBzpGggJ7ZB3AEEHIPgghs'
+    'TyQm7fJQFOh7chIvXfINcR9igdNIwjeQhEtjCUDZf74CTxcmgJ24WQN45QfWEAaVDyDQ6aeJiL3O'
+    'dbwgIt4s+kSvSYjYDv565XH0CR82CUBw0eFtU+C7ArTyAdYxtvwANJaTSpY0LVv2r4jwWf5o90ko'
+    'XpKoScA92/CMo3hgX0UASv8AAtg7CbzcrhyjjAiWANo1gADCyue6sjOBEvavHR4R1cufzKQiwcFe'
+    'VPoBDJEnmYCU5HTwsvTqUuI1GYUkJfXK8xswAxgIMgLQIoBgRth/6Ekgh6dAEwmpba5cJ7bfw8vo'
+    'D96MydIoN/A5PPBI6lHp8KaArxIgCTwIwJaQCcWZCBCyQ1REqNBY2bomAbJP8Clm9opxiLVDzADH'
+    'egI6eEHKWTq8QeC7BvAW6AEEBLHSh7iQARsiyNYbMlckuNw+lxVLZuPhhUTA4usrD+MFF0p40/Ku'
+    'wN8BsIkQA5U5g0Q0kwJoxZKRifAaVF8vy3xOk0A4mBzvpFoX0PQfjra/Bw86tnuhAtoeFxJ12DPg'
+    '7fGBDEgfQNlen/Hl3o/jEKkGyG2NvqCzDo8l39dxPVHQ8dhhzwgBLXAjpfQtUCJiDHiZ9FTEDMcP'
+    'juUiZM893e93PnBNRQIUcygOrxDDppAbg+QsxCHuo2nbpLxSBS2HV0izI0MN3CpiWgki7PXjbUGE'
+    'B7blZBLekEAm3CcJpfdze10+7ubYFB5FBcAO68lZ+tIxTgPfGUVY4OwHxrOQcn5CJHwAweyBQw5v'
+    'uN4ZEmxHUIIUyQhOY+gbsyNGgTrnbxFCJsKgGuA70ev2fNFL40oQ8ndiCMyCj//RCXaChEA9ntuX'
+    'Y38FOA2XnVXBA9EENqtwJqVvCWFwwuZb4FsjQnn+mKIjQFBEBBoCR9VJErreJ8QJKhoZSsAc+4UP'
+    '4PY42DxSvW8bbOQvQx3VU+CVgwz6PENEq7D9B+n4cljrQIz8Mgmh1Od9dB8wgIHaVFQQb0KZoDqJ'
+    'e1+muKJemQeQFweYwwvOifSzcqrUiDHFToTIMEhKuJOwBr5/CntgMkUDmFUwBxWekQVnnRYdY+lX'
+    '9ft9e3Z/Bn747a2JgPUsdxD0T05dg3OXPgXhINgfBMr7Sx7cxpWXIyX/lhm05GsJwd8TuzatO/hY'
+    '4j2eeGwTnP3Dp8kxhmBMwa4LNUTHaM2gmIBYciKkJC8k0VCIGKxtbJGg07ZQAXVo16fJFmcso2kS'
+    'UfcyhFj73tASCHdRQdq2PTHJxMO4WWFLwjhToIYgE//+qIONKv/56I7pdail78xyTBlZ+1fef1oR'
+    'ZPz0zDX483urcP9c3kX5QaoXVN1WIFBPg1zZQZkfTXDcWgX4/V9v1tKf0EYVDYwfmPxkqCH3Sv65'
+    '3FoNcCF65uxcSmoceCKVwXcNBmiYm4G6PNfPBNA0uM/broTZygxa0WBMGTXlPkOpnhaNGRYr8PI4'
+    'mAzPyJgHMSEPcWkbQskbBjW0vRz8cHRNxSrHjjhFW3isT3P6Ief5s4BcQ1lfAhqlZJGFAXq+t85Y'
+    'm2XDCVBliBNb53JvCbjH4GPZcAJ4zsML9O7eyD+W9SUghbHAj/eig+snJHWw4VEfRQEeCa4/KyOW'
+    'oV0OLOkJDf7NzTn48pfug/vvc3pCFUI1bG6GWqkCivc000NxH/9v3Q7wp/dXB02w2uu3lpMVQD1H'
+    'PQlZwq5/1BhEVx751mfhwNObZ2zV2srJ8zfgZ7/9RCnFKodVNaWM6IQ0cej62VTanpoUiRmc7Q/O'
+    '3R2qGcoX470GAqTJFCcmVZwgqK0AKRMKVa11cYMNL86s27EENJaNMiqDj8bJRgHswaUZ5LobPiIe'
+    'J/9GPV42fqOqEmQHFBw/gSU/wJ6noYJ3/rYKX3ts0/8T4tjyzt9Xy4Y1BWn/JHcv6oKuP5JMkh/g'
+    'FxPHSd/VKnjz4g04/8ebsCkblXqgAmKIPUkqotFq2xM2BzcxCnx8vWs7u9a6K+da+4+5yKh5QsWq'
+    'iQaSEMgkYCM//qRTI0I18JFEjMM/YFa4vCLnDMAGIZNw5eVIVYJ8g2CiAYBSAQvBl57uFUHXZu9Q'
+    'LCWvONU6y4AFZMBLOydlGKI0gcL7+/oeyQegDG5gr2xmM5Dyp6esdEMo2ZwyBcrwPA17BQmZSzm+'
+    'H4u/IeWq52PxDel7bfvcfnMtKX9cvxFN4Cr+NivAUgXp5cNQepBs3+cML9btBAmJkFyXHo5kIlIj'
+    'pvkAJsMpMBV48gty5kiQlwGW3reE9PWvRhO4gpW/kGZcMpMMWEgpmYJ8vgbCH0gSaIqKGiOIAAA2'
+    'jSZ+4wOsfTMRvt7fk1Paa+3eed37+T5XYib4LjbpqxVgn5+weuH0cuPYrtNDSkFCyD4hGwCAtv9e'
+    'QRN8gARPAGlF2Dwfk6/LVoBL7zcJ6XG+G01gGRt2OM3KZBXwQ8rUsz0JqV87IWVJAk18UiOT9y9q'
+    'oBOGDGAUP64BEIrsW+BTTwvwyoR078ffMirAnY0IUlvJdikR8sLZ5dFZknBnSIDeJ0AoPU6OLwj5'
+    'uwnyrxhoAeftBnhfwKt9TuwTUcNF+/VwdrT0/fkPFn++sowO7CnI0gd2btkUcu8rYgQJfe+6MtaX'
+    'IVPlAFPkL/CrcCXB+9rhWaCpl60KqE45vrz0vfkPKA94DX9P0cnJFLwA4qGQEAd9XVYCgcuvrrAT'
+    'FA9W2AcATI4AjHQcGaLXAbS8fQ1e+gLer83ltXiZUb7YcXR4P0Zbf4RCG3RC9l3QJMj91BhyD07I'
+    'niKLJGMafgmadjhLxnTwyhx4H6vifdw+zgSgFG4vvr7yEkp+iWO/yOQmkWBT34oIgdzN4gWd3qy9'
+    'uKt72IKnp0h1TvDS0vP9R1U8H7B0eP7k4i9W3saDe12+M8X+Fgn5GVT/lkZwap6fvKOT2zCjD5Dn'
+    'GhLkYzKZKVbgXbF74S/eRvAn6fJ6QsTDEax+GcFsq+WfWxA72/VOkEMkTRJM+V5gOnwD1hBQ4noB'
+    'x70sFdEwg6yQf2G1I/J2igA0hQ8X31jZj6f9DoE/wCRkUMnRZeD0fj69rw80hhCvp7FpkB8YxIAG'
+    'Xw2E5D6Z+fED1UKIAX8Vt/efOFS+FqkIyCRcyiScZhJCif98E/pQIc8dKiKo57viA2b+aox6XYzi'
+    'msCFH1D5gDQXn8Y7Efwle6/mnCCScAFJeBov8xaSsD21JdsdPfqmMMn2T/k5EROCeS1FO8Q2ciLA'
+    'bgvgRIZNg329L4P/J64/g3Y//LO5TMJlJGE3knAUG72PnvOnPIF8AA9zhf1n0OpNzQR8RgUQAfJH'
+    'x4QfkJJvOMYzLn44eWgNH05mEuKJ+zFEPos9+wo6vJ09KKGGAOItLWP/UAhwMyjALlt+oIoI2jG+'
+    'h78Xsdfv7tNZJuLw/ClUw2kkIX88HZ5MA7v81rUiQkpepcFrV0ArF+DMDoDS25iHX0Tgr8Ykh+L8'
+    'tDL42WBMlnBxLP5w7LADEfWfzwPsQiIewvWtSMSWVJnIyOv9cu0+QJlAD/w6rl7DeunzeSRsGYGf'
+    'w466MhQPlf8BXeiIOYw3UusAAAAASUVORK5CYII=')
@@ -0,0 +1,259 @@
+"""
+calc_kernels module
+
+This module contains the operator kernels of the calculator and the
+dispatch table used to look them up.
+
+Each binary operator of the calculator is an OperatorKernel holding its
+arithmetic, its optional percent variant (used when % is pressed after the
+operand, e.g. 1250 + 10%) and its error policy. CalcEngine.do_equal(), the
+batch evaluation of calc_batch module and the expressions of
+calc_expression module look the kernels up in the OPERATORS table, so they
+share the same arithmetic, and a new binary operator only needs a new entry
+in the table.
+
+The kernel functions use only Python operators, so they work on Decimal,
+float, numpy float64 arrays and Decimal object arrays alike. The kernels
+of integer functions (permutations and combinations) and of the exact
+powers of Fractions are applied to arrays element by element.
+
+Classes:
+    OperatorKernel: A class representing the arithmetic and error policy of
+        a binary operator.
+
+Functions:
+    get_operation: Return the kernel function for a batch operator string
+        like '+', '+%' or '%'.
+
+Imports:
+    decimal: This module provides functionality for precise arithmetic
+      operations using the Decimal data type from the decimal module.
+    calc_scientific: A custom module providing the comb(), perm() and
+      power() functions.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from decimal import Decimal
+    >>> from calc_kernels import OPERATORS
+    >>> OPERATORS['+'].percent(Decimal('1250'), Decimal('10'))
+    Decimal('1375.0')
+"""
+
+# Importing required modules
+from decimal import Decimal, InvalidOperation
+
+from calc_scientific import comb, perm, power
+
+
+class OperatorKernel:
+    """
+    A class representing the arithmetic and error policy of a binary
+    operator.
+
+    Attributes:
+        symbol (str): Symbol of the operator shown in the secondary display.
+        operation (function): Function (accumulator, operand) -> result
+            performed when = or another operator is pressed.
+        percent (function): Function (accumulator, operand) -> result
+            performed when % is pressed after the operand.
+        errors (tuple): Exception classes which put the calculator into
+            error state.
+        error (str): Name of the CalcEngine attribute holding the error
+            message shown in the display.
+        undefined (function): Function (accumulator, operand) -> bool
+            telling for which operands the operation raises one of errors.
+            It is used by the batch evaluation to mask error rows without
+            raising. None if the operation never fails.
+        percent_undefined (function): Same as undefined but for the percent
+            variant.
+    """
+
+    __slots__ = ('symbol', 'operation', 'percent', 'errors', 'error',
+                 'undefined', 'percent_undefined')
+
+    def __init__(self, symbol, operation, percent=None, errors=(),
+                 error='error', undefined=None):
+        """
+        Initialize the OperatorKernel class.
+
+        Args:
+            symbol (str): Symbol of the operator.
+            operation (function): Function (accumulator, operand) -> result.
+            percent (function, optional): Percent variant of the operation.
+                Defaults to the operation applied on operand / 100.
+            errors (tuple, optional): Exception classes which put the
+                calculator into error state. Defaults to ().
+            error (str, optional): Name of the CalcEngine attribute holding
+                the error message. Defaults to 'error'.
+            undefined (function, optional): Function (accumulator, operand)
+                -> bool telling for which operands the operation fails.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        self.symbol = symbol
+        self.operation = operation
+        self.errors = errors
+        self.error = error
+        self.undefined = undefined
+
+        if percent is not None:
+            self.percent = percent
+            self.percent_undefined = undefined
+        else:
+            self.percent = lambda acc, value: operation(acc, value/100)
+            self.percent_undefined = undefined and (
+                lambda acc, value: undefined(acc, value/100))
+
+
+def _elementwise(function, vectorized=None):
+    """
+    Return a kernel function applying a function of two numbers to every
+    element of arrays.
+
+    Args:
+        function (function): Function (accumulator, operand) -> result of
+            two numbers.
+        vectorized (function, optional): Function applied to whole float64
+            arrays instead. Defaults to None (element by element).
+
+    Returns:
+        function: Function (accumulator, operand) -> result of numbers or
+        arrays.
+    """
+    def apply(acc, value):
+        if not getattr(acc, 'ndim', 0):
+            return function(acc, value)
+        if vectorized is not None and acc.dtype != object:
+            return vectorized(acc, value)
+        result = acc.copy()
+        result[...] = [function(*pair) for pair in zip(acc, value)]
+        return result
+
+    return apply
+
+
+def _not_integer(value):
+    """
+    Tell which numbers are not integers.
+
+    Decimal % 1 raises InvalidOperation once the integer part has more
+    digits than the precision, so Decimals are compared with their integral
+    value instead.
+
+    Args:
+        value (object): A number or an array.
+
+    Returns:
+        bool | numpy.ndarray: True where the number is not an integer.
+    """
+    if getattr(value, 'dtype', None) == object:
+        result = value.copy()
+        result[...] = [_not_integer(number) for number in value]
+        return result
+    if isinstance(value, Decimal):
+        return value != value.to_integral_value()
+    return value % 1 != 0
+
+
+def _natural_undefined(acc, value):
+    """
+    Tell for which operands an integer function fails.
+
+    Args:
+        acc (object): The accumulator, a number or an array.
+        value (object): The operand, a number or an array.
+
+    Returns:
+        bool | numpy.ndarray: True where an operand is negative or not an
+        integer.
+    """
+    return ((acc < 0) | (value < 0) | _not_integer(acc)
+            | _not_integer(value))
+
+
+# Dispatch table of binary operators. The '' entry holds the percentage of
+# the accumulator when % is pressed without a previous operation (e.g.
+# 1250%).
+OPERATORS = {
+    '': OperatorKernel(
+        '', None,
+        percent=lambda acc, value: acc / 100),
+    '+': OperatorKernel(
+        '+', lambda acc, value: acc + value,
+        percent=lambda acc, value: acc + (acc * (value/100))),
+    '-': OperatorKernel(
+        '-', lambda acc, value: acc - value,
+        percent=lambda acc, value: acc - (acc * (value/100))),
+    '*': OperatorKernel(
+        '*', lambda acc, value: acc * value,
+        percent=lambda acc, value: acc * (value/100)),
+    # Decimal raises InvalidOperation instead of ZeroDivisionError for 0/0.
+    '/': OperatorKernel(
+        '/', lambda acc, value: acc / value,
+        percent=lambda acc, value: acc / value * 100,
+        errors=(ZeroDivisionError, InvalidOperation),
+        undefined=lambda acc, value: value == 0),
+    '^': OperatorKernel(
+        '^', _elementwise(power, lambda acc, value: acc ** value),
+        errors=(ZeroDivisionError, InvalidOperation),
+        error='invalid_error',
+        undefined=lambda acc, value: ((acc == 0) & (value < 0))
+        | ((acc < 0) & _not_integer(value))),
+    # The remainder follows the % operator of the number type, so its sign
+    # is the sign of the accumulator for Decimal and of the operand for
+    # float.
+    'mod': OperatorKernel(
+        'mod', lambda acc, value: acc % value,
+        errors=(ZeroDivisionError, InvalidOperation),
+        undefined=lambda acc, value: value == 0),
+    'yroot': OperatorKernel(
+        'yroot', lambda acc, value: acc ** (1 / value),
+        errors=(ZeroDivisionError, InvalidOperation),
+        error='invalid_error',
+        undefined=lambda acc, value: (value == 0) | (acc < 0)),
+    # Permutations and combinations of value items out of acc.
+    'P': OperatorKernel(
+        'P', _elementwise(perm),
+        errors=(ValueError, InvalidOperation),
+        error='invalid_error',
+        undefined=_natural_undefined),
+    'C': OperatorKernel(
+        'C', _elementwise(comb),
+        errors=(ValueError, InvalidOperation),
+        error='invalid_error',
+        undefined=_natural_undefined),
+}
+
+
+def get_operation(operator):
+    """
+    Return the kernel function and its error predicate for a batch operator
+    string.
+
+    Batch operator strings are the symbol of a kernel (e.g. '+'), the symbol
+    followed by '%' for its percent variant (e.g. '+%'), or '%' alone for the
+    percentage of the accumulator.
+
+    Args:
+        operator (str): The batch operator string.
+
+    Raises:
+        KeyError: If the operator is not in OPERATORS.
+
+    Returns:
+        tuple: (kernel, function, undefined) where function is the kernel
+        function (accumulator, operand) -> result and undefined is its error
+        predicate or None.
+    """
+    if operator.endswith('%'):
+        kernel = OPERATORS[operator[:-1]]
+        return kernel, kernel.percent, kernel.percent_undefined
+
+    if operator == '':
+        raise KeyError(operator)
+    kernel = OPERATORS[operator]
+    return kernel, kernel.operation, kernel.undefined
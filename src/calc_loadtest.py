@@ -0,0 +1,157 @@
+"""
+calc_loadtest module
+
+This module load tests the calculation server of calc_server module.
+
+It opens a CalcClient, keeps a fixed number of requests in flight for a
+given duration, and reports the throughput and the p50/p99 latency of the
+requests. Without an address, it starts a server in the same process on a
+free localhost port.
+
+Functions:
+    percentile: Return a percentile of sorted samples.
+    run_load: Run the load and return the latencies.
+    main: Command line entry point.
+
+Imports:
+    argparse: For parsing the command line arguments.
+    asyncio: For running the client.
+    time: For measuring the latencies.
+    calc_client: A custom module providing the CalcClient class.
+    calc_server: A custom module providing the CalcServer class.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    $ python calc_loadtest.py --duration 5 --concurrency 256
+"""
+
+# Importing required modules
+import argparse
+import asyncio
+import time
+
+from calc_client import CalcClient
+from calc_server import CalcServer
+
+# Requests sent by the load test, in turn.
+REQUESTS = ({'expr': '12.5*(3+4)%'},
+            {'expr': '895 + 94.5 - 45 / 2 * 3 + 10%'},
+            {'keys': ['1', '2', '5', '0', 'plus', '1', '0', 'percent']},
+            {'keys': ['2', '2', 'slash', '7', 'Return']})
+
+
+def percentile(samples, percent):
+    """
+    Return a percentile of sorted samples (nearest rank method).
+
+    Args:
+        samples (list): Sorted samples.
+        percent (float): The percentile, from 0 to 100.
+
+    Returns:
+        float: The sample at the percentile, or 0.0 without samples.
+    """
+    if not samples:
+        return 0.0
+    rank = max(0, min(len(samples) - 1,
+                      round(percent / 100 * len(samples) + 0.5) - 1))
+    return samples[rank]
+
+
+async def run_load(client, duration, concurrency):
+    """
+    Keep concurrency requests in flight for duration seconds.
+
+    Args:
+        client (CalcClient): A connected client.
+        duration (float): Duration of the load in seconds.
+        concurrency (int): Number of requests in flight.
+
+    Returns:
+        list: Latency of every request in seconds.
+    """
+    latencies = []
+    deadline = time.perf_counter() + duration
+
+    async def worker(offset):
+        n_requests = offset
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await client.request(REQUESTS[n_requests % len(REQUESTS)])
+            latencies.append(time.perf_counter() - start)
+            n_requests += 1
+
+    await asyncio.gather(*[worker(offset) for offset in range(concurrency)])
+    return latencies
+
+
+async def load_test(args):
+    """
+    Run the load test described by the command line arguments.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        None
+    """
+    server = None
+    port = args.port
+    if args.unix is None and port is None:
+        server = CalcServer()
+        listening = await server.start(port=0)
+        port = listening.sockets[0].getsockname()[1]
+
+    try:
+        async with CalcClient(args.host, port, args.unix,
+                              pool_size=args.connections) as client:
+            start = time.perf_counter()
+            latencies = await run_load(client, args.duration,
+                                       args.concurrency)
+            elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    print(f'requests:   {len(latencies)}')
+    print(f'throughput: {len(latencies) / elapsed:.0f} req/s')
+    print(f'p50:        {percentile(latencies, 50) * 1e3:.3f} ms')
+    print(f'p99:        {percentile(latencies, 99) * 1e3:.3f} ms')
+
+
+def main(argv=None):
+    """
+    Run the load test given on the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description='Load test the calculation server.')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='TCP host of the server (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=None,
+                        help='TCP port of the server (default: start a '
+                             'server in process)')
+    parser.add_argument('--unix', metavar='PATH',
+                        help='Unix socket of the server')
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help='duration of the load in seconds (default: 5)')
+    parser.add_argument('--concurrency', type=int, default=64,
+                        help='requests in flight (default: 64)')
+    parser.add_argument('--connections', type=int, default=4,
+                        help='connections of the client pool (default: 4)')
+    args = parser.parse_args(argv)
+
+    asyncio.run(load_test(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+"""
+calc_number_panel module
+
+This module contains the number theory panel of the calculator.
+
+The panel computes the greatest common divisor, the least common multiple
+and the modular power of integers, tests their primality and factors them,
+with the functions of calc_number_theory module. Its first integer is taken
+from the primary display of the calculator, and a numeric result is entered
+into the primary display with CalcEngine.enter_value(), so the panel and
+the keypad work on the same numbers.
+
+The factorization, and any function of integers of more than INLINE_BITS
+bits, runs in a worker process by a BackgroundJob of calc_worker module, so
+the calculator keeps responding while a 40 digit number is factored. Esc
+cancels the running job, and closes the panel when none is running.
+
+Classes:
+    NumberPanel: A window of number theory functions.
+
+Imports:
+    time: For the time shown in the status line.
+    tkinter: For creating the GUI components of the panel.
+    calc_backends: A custom module providing the int_to_text() function.
+    calc_number_theory: A custom module providing the number theory
+        functions.
+    calc_worker: A custom module providing the BackgroundJob class.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_number_panel import NumberPanel
+    >>> panel = NumberPanel(calc)
+"""
+
+# Importing required modules
+import time
+import tkinter as tk
+
+from calc_backends import int_to_text
+from calc_number_theory import (factorize, format_factors, gcd, is_prime, lcm,
+                                mod_pow)
+from calc_worker import BackgroundJob
+
+# Size in bits of the integers above which every function runs in a worker
+# process. The factorization always does.
+INLINE_BITS = 2048
+
+# Button text of every function, with the function, the names of its
+# integers and True if its result is an integer which can be entered into
+# the calculator.
+OPERATIONS = {'gcd(a, b)': (gcd, ('a', 'b'), True),
+              'lcm(a, b)': (lcm, ('a', 'b'), True),
+              'aᵇ mod m': (mod_pow, ('a', 'b', 'm'), True),
+              'Is a prime?': (is_prime, ('a',), False),
+              'Factor a': (factorize, ('a',), False)}
+
+
+class NumberPanel:
+    """
+    A window of number theory functions.
+
+    Attributes:
+        calc (Calculator): The calculator whose display the panel reads and
+            writes.
+        window (tk.Toplevel): The window of the panel.
+        variables (dict): tk.StringVar of the text of every integer, by
+            name ('a', 'b' and 'm').
+        result_var (tk.StringVar): Text of the result.
+        status_var (tk.StringVar): Text of the status line.
+        value (int): The last integer result, entered into the calculator by
+            to_display(), or None.
+        job (BackgroundJob): The function running in a worker process, or
+            None.
+        started (float): perf_counter() when the last function was started.
+    """
+
+    def __init__(self, calc):
+        """
+        Initialize the NumberPanel class and open its window.
+
+        Args:
+            calc (Calculator): The calculator whose display the panel reads
+                and writes.
+
+        Returns:
+            None
+        """
+        self.calc = calc
+        self.value = None
+        self.job = None
+        self.started = 0.0
+
+        self.window = tk.Toplevel(calc.window)
+        self.window.title('Number theory')
+        self.window.config(padx=10, pady=10, bg=calc.win_bg_color)
+
+        self.create_entries()
+        self.create_buttons()
+
+        self.window.bind('<Escape>', self.cancel_or_close)
+        self.window.protocol('WM_DELETE_WINDOW', self.close)
+        self.from_display(bell=False)
+
+    def create_entries(self):
+        """
+        Create the entries of the integers and the result lines.
+
+        Returns:
+            None
+        """
+        bg = self.calc.win_bg_color
+        self.variables = {}
+        for row, name in enumerate(('a', 'b', 'm')):
+            self.variables[name] = tk.StringVar(self.window)
+            tk.Label(self.window, text=name, bg=bg).grid(row=row, column=0,
+                                                         sticky=tk.W)
+            tk.Entry(self.window, textvariable=self.variables[name],
+                     width=48, font=('Courier New', '11')).grid(
+                row=row, column=1, columnspan=4, padx=(4, 0), pady=2)
+        tk.Button(self.window, text='From display',
+                  command=self.from_display).grid(row=0, column=5,
+                                                  padx=(8, 0))
+
+        self.result_var = tk.StringVar(self.window)
+        tk.Label(self.window, textvariable=self.result_var, bg=bg,
+                 anchor=tk.W, justify=tk.LEFT, wraplength=480,
+                 font=('Courier New', '11')).grid(row=4, column=0,
+                                                  columnspan=5, pady=(8, 4),
+                                                  sticky=tk.W + tk.E)
+        tk.Button(self.window, text='To display',
+                  command=self.to_display).grid(row=4, column=5,
+                                                padx=(8, 0))
+        self.status_var = tk.StringVar(self.window)
+        tk.Label(self.window, textvariable=self.status_var, bg=bg,
+                 anchor=tk.W).grid(row=5, column=0, columnspan=6,
+                                   sticky=tk.W + tk.E)
+
+    def create_buttons(self):
+        """
+        Create the buttons of the functions of OPERATIONS.
+
+        Returns:
+            None
+        """
+        buttons = tk.Frame(self.window, bg=self.calc.win_bg_color)
+        buttons.grid(row=3, column=0, columnspan=6, pady=(8, 0))
+        for column, btn_text in enumerate(OPERATIONS):
+            tk.Button(buttons, text=btn_text, width=10,
+                      command=lambda btn_text=btn_text: self.run(btn_text)
+                      ).grid(row=0, column=column, padx=2)
+
+    def read_integer(self, name):
+        """
+        Return the integer of an entry.
+
+        Spaces, commas and underscores between the digits are ignored.
+
+        Args:
+            name (str): Name of the integer, 'a', 'b' or 'm'.
+
+        Raises:
+            ValueError: If the entry does not hold an integer.
+
+        Returns:
+            int: The integer.
+        """
+        text = self.variables[name].get()
+        for separator in ' ,_':
+            text = text.replace(separator, '')
+        try:
+            return int(text)
+        except ValueError:
+            raise ValueError(f'{name} must be an integer') from None
+
+    def run(self, btn_text):
+        """
+        Compute a function of OPERATIONS on the integers of the entries.
+
+        The function runs in a worker process if it is the factorization or
+        an integer has more than INLINE_BITS bits, replacing the job running
+        if any.
+
+        Args:
+            btn_text (str): Button text of the function.
+
+        Returns:
+            None
+        """
+        function, names, numeric = OPERATIONS[btn_text]
+        try:
+            args = tuple(self.read_integer(name) for name in names)
+        except ValueError as error:
+            self.status_var.set(str(error))
+            return None
+
+        self.cancel()
+        self.value = None
+        self.result_var.set('')
+        self.started = time.perf_counter()
+
+        def done(result):
+            self.job = None
+            self.show_result(btn_text, result, numeric)
+
+        if (function is factorize
+                or max(abs(arg).bit_length() for arg in args) > INLINE_BITS):
+            self.job = BackgroundJob(self.window, function, args,
+                                     on_done=done, on_error=self.show_error)
+            self.status_var.set('Working... (Esc to cancel)')
+            return None
+
+        try:
+            result = function(*args)
+        except ValueError as error:
+            self.show_error(error)
+            return None
+        done(result)
+
+    def show_result(self, btn_text, result, numeric):
+        """
+        Show the result of a function.
+
+        Args:
+            btn_text (str): Button text of the function.
+            result (int | bool | list): The result.
+            numeric (bool): True if the result is an integer which can be
+                entered into the calculator.
+
+        Returns:
+            None
+        """
+        elapsed = time.perf_counter() - self.started
+        if numeric:
+            self.value = result
+            text = f'{btn_text} = {int_to_text(result)}'
+        elif isinstance(result, bool):
+            text = 'a is prime' if result else 'a is not prime'
+        else:
+            text = f'a = {format_factors(result)}'
+        self.result_var.set(text)
+        self.status_var.set(f'Done in {elapsed * 1e3:.1f} ms')
+
+    def show_error(self, error):
+        """
+        Show the error of a function, or of its worker process.
+
+        Args:
+            error (Exception): The exception raised by the function, or None
+                if the worker process died without a result.
+
+        Returns:
+            None
+        """
+        self.job = None
+        self.status_var.set(str(error) if error is not None
+                            else 'The calculation failed')
+
+    def from_display(self, bell=True):
+        """
+        Copy the number of the primary display of the calculator to a.
+
+        Args:
+            bell (bool, optional): Ring the bell if the display does not
+                show an integer, e.g. an error message. Defaults to True.
+
+        Returns:
+            None
+        """
+        calc = self.calc
+        if calc.job is None and calc.state.btn_state != tk.DISABLED:
+            value = calc.read_entry()
+            integer = int(value)
+            if integer == value:
+                self.variables['a'].set(str(integer))
+                return None
+        if bell:
+            self.window.bell()
+
+    def to_display(self):
+        """
+        Enter the last integer result into the calculator.
+
+        The entry can be undone like a key. The bell rings if there is no
+        integer result, or the calculator is busy with a key.
+
+        Returns:
+            None
+        """
+        calc = self.calc
+        if self.value is None or calc.job is not None:
+            self.window.bell()
+            return None
+
+        before = calc.snapshot()
+        calc.enter_value(self.value)
+        calc.record_undo(before)
+
+    def cancel(self):
+        """
+        Cancel the running job, if any.
+
+        Returns:
+            bool: True if a job was cancelled.
+        """
+        if self.job is None:
+            return False
+        self.job.cancel()
+        self.job = None
+        self.status_var.set('Cancelled')
+        return True
+
+    def cancel_or_close(self, event=None):
+        """
+        Cancel the running job, or close the panel if none is running.
+
+        Args:
+            event (tk.Event, optional): The Escape key event. Defaults to
+                None.
+
+        Returns:
+            None
+        """
+        if not self.cancel():
+            self.close()
+
+    def close(self):
+        """
+        Cancel the running job and close the panel.
+
+        Returns:
+            None
+        """
+        self.cancel()
+        self.window.destroy()
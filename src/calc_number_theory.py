@@ -0,0 +1,374 @@
+"""
+calc_number_theory module
+
+This module provides the integer functions of the number theory panel of
+the calculator (see calc_number_panel module): greatest common divisor,
+least common multiple, modular exponentiation, primality test and prime
+factorization.
+
+The primes below SIEVE_LIMIT are found once by a sieve of Eratosthenes, the
+first time they are needed, and kept by small_primes(). They answer the
+primality of small numbers by a binary search and strip the small factors
+of a number by trial division.
+
+is_prime() is a Miller-Rabin test with the prime bases up to 41, which is
+deterministic (proven to have no false positive) below MILLER_RABIN_LIMIT,
+about 3.3e24. Larger numbers passing it are also checked by a strong Lucas
+test, which makes it the Baillie-PSW test, for which no composite passing
+both tests is known.
+
+factorize() divides out the primes of the sieve, then splits what is left
+with Pollard's rho method in Brent's variant, which accumulates the
+differences of the sequence in batches of RHO_BATCH multiplications per
+gcd. It finds a factor p in about sqrt(p) steps, so a 40 digit number
+whose factors but the largest have up to 12 digits is factored in about a
+second, but a 40 digit product of two 20 digit primes would take days. The
+panel runs the factorization in a worker process, which is cancelled with
+Esc.
+
+Functions:
+    small_primes: Return the primes below SIEVE_LIMIT, sieved once.
+    gcd: Greatest common divisor of two integers.
+    lcm: Least common multiple of two integers.
+    mod_pow: Modular exponentiation.
+    is_prime: Tell whether an integer is prime.
+    pollard_rho: Return a nontrivial factor of an odd composite integer.
+    factorize: Return the prime factorization of a positive integer.
+    format_factors: Return a prime factorization as text.
+
+Imports:
+    bisect: For the primality of the numbers below SIEVE_LIMIT.
+    functools: For the cache of the sieve.
+    math: For the gcd and the integer square root.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_number_theory import (factorize, format_factors, gcd,
+    ...                                 is_prime, lcm, mod_pow)
+    >>> gcd(84, 36), lcm(4, 6), mod_pow(4, 13, 497)
+    (12, 12, 445)
+    >>> is_prime(2 ** 89 - 1), is_prime(3215031751)
+    (True, False)
+    >>> format_factors(factorize(600851475143))
+    '71 × 839 × 1471 × 6857'
+    >>> format_factors(factorize(2 ** 10 * 10007 ** 2))
+    '2^10 × 10007^2'
+"""
+
+# Importing required modules
+import math
+from bisect import bisect_left
+from functools import lru_cache
+
+# Bound of the primes of the sieve.
+SIEVE_LIMIT = 1 << 16
+
+# Bases of the Miller-Rabin test, and the bound below which they leave no
+# composite undetected.
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MILLER_RABIN_LIMIT = 3317044064679887385961981
+
+# Number of the small primes trial divided by is_prime() before the
+# Miller-Rabin test.
+TRIAL_PRIMES = 64
+
+# Multiplications of the rho sequence per gcd in pollard_rho().
+RHO_BATCH = 128
+
+
+@lru_cache(maxsize=None)
+def small_primes():
+    """
+    Return the primes below SIEVE_LIMIT, sieved once.
+
+    Returns:
+        tuple: The primes, in ascending order.
+    """
+    sieve = bytearray([1]) * SIEVE_LIMIT
+    sieve[0] = sieve[1] = 0
+    for number in range(2, math.isqrt(SIEVE_LIMIT - 1) + 1):
+        if sieve[number]:
+            sieve[number * number::number] = bytes(
+                len(range(number * number, SIEVE_LIMIT, number)))
+    return tuple(number for number, flag in enumerate(sieve) if flag)
+
+
+def gcd(a, b):
+    """
+    Greatest common divisor of two integers.
+
+    Args:
+        a (int): An integer.
+        b (int): An integer.
+
+    Returns:
+        int: The greatest common divisor, 0 if both are 0.
+    """
+    return math.gcd(a, b)
+
+
+def lcm(a, b):
+    """
+    Least common multiple of two integers.
+
+    Args:
+        a (int): An integer.
+        b (int): An integer.
+
+    Returns:
+        int: The least common multiple, 0 if either is 0.
+    """
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // math.gcd(a, b) * b)
+
+
+def mod_pow(base, exponent, modulus):
+    """
+    Modular exponentiation.
+
+    Args:
+        base (int): The base.
+        exponent (int): The exponent. A negative exponent is a power of the
+            modular inverse of the base.
+        modulus (int): The modulus, at least 1.
+
+    Raises:
+        ValueError: If the modulus is below 1, or the exponent is negative
+            and the base has no inverse modulo the modulus.
+
+    Returns:
+        int: base ** exponent % modulus.
+    """
+    if modulus < 1:
+        raise ValueError('the modulus must be at least 1')
+    return pow(base, exponent, modulus)
+
+
+def _is_strong_probable_prime(n, base):
+    """
+    Miller-Rabin test of an odd integer to one base.
+
+    Args:
+        n (int): An odd integer above base.
+        base (int): The base.
+
+    Returns:
+        bool: False if base proves n composite.
+    """
+    d = n - 1
+    shift = (d & -d).bit_length() - 1
+    d >>= shift
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(shift - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a, n):
+    """
+    Jacobi symbol (a/n).
+
+    Args:
+        a (int): An integer.
+        n (int): An odd positive integer.
+
+    Returns:
+        int: -1, 0 or 1.
+    """
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _is_strong_lucas_probable_prime(n):
+    """
+    Strong Lucas test of an odd integer, with the parameters of Selfridge.
+
+    Args:
+        n (int): An odd integer above the primes of MILLER_RABIN_BASES,
+            which is not a perfect square.
+
+    Returns:
+        bool: False if the test proves n composite.
+    """
+    d_value = 5
+    while True:
+        symbol = _jacobi(d_value, n)
+        if symbol == -1:
+            break
+        if symbol == 0:
+            # d_value shares a factor with n.
+            return False
+        d_value = -d_value - 2 if d_value > 0 else -d_value + 2
+    q_value = (1 - d_value) // 4
+
+    d = n + 1
+    shift = (d & -d).bit_length() - 1
+    d >>= shift
+
+    def half(value):
+        # Division by 2 modulo the odd n.
+        return (value if value % 2 == 0 else value + n) // 2 % n
+
+    # U and V of the Lucas sequences of P = 1 and Q = q_value at k, and
+    # Q ** k, for the leading bits k of d.
+    u_value, v_value, q_power = 1, 1, q_value % n
+    for bit in bin(d)[3:]:
+        u_value = u_value * v_value % n
+        v_value = (v_value * v_value - 2 * q_power) % n
+        q_power = q_power * q_power % n
+        if bit == '1':
+            u_value, v_value = (half(u_value + v_value),
+                                half(d_value * u_value + v_value))
+            q_power = q_power * q_value % n
+
+    if u_value == 0 or v_value == 0:
+        return True
+    for _ in range(shift - 1):
+        v_value = (v_value * v_value - 2 * q_power) % n
+        q_power = q_power * q_power % n
+        if v_value == 0:
+            return True
+    return False
+
+
+def is_prime(n):
+    """
+    Tell whether an integer is prime.
+
+    Args:
+        n (int): An integer.
+
+    Returns:
+        bool: True if n is prime. The answer is proven below
+        MILLER_RABIN_LIMIT; above, no composite number is known for which
+        it is wrong.
+    """
+    if n < SIEVE_LIMIT:
+        primes = small_primes()
+        position = bisect_left(primes, n)
+        return position < len(primes) and primes[position] == n
+
+    for prime in small_primes()[:TRIAL_PRIMES]:
+        if n % prime == 0:
+            return False
+    if not all(_is_strong_probable_prime(n, base)
+               for base in MILLER_RABIN_BASES):
+        return False
+    if n < MILLER_RABIN_LIMIT:
+        return True
+    return (math.isqrt(n) ** 2 != n
+            and _is_strong_lucas_probable_prime(n))
+
+
+def pollard_rho(n):
+    """
+    Return a nontrivial factor of an odd composite integer, by Pollard's rho
+    method in Brent's variant.
+
+    The sequences are x ** 2 + c for c = 1, 2, ... from 2, so the factor
+    found is always the same.
+
+    Args:
+        n (int): An odd composite integer, not a power of a prime below
+            SIEVE_LIMIT.
+
+    Returns:
+        int: A factor of n, above 1 and below n, not always prime.
+    """
+    c = 0
+    while True:
+        c += 1
+        y, power, product, factor = 2, 1, 1, 1
+        while factor == 1:
+            x = y
+            for _ in range(power):
+                y = (y * y + c) % n
+            done = 0
+            while done < power and factor == 1:
+                saved = y
+                for _ in range(min(RHO_BATCH, power - done)):
+                    y = (y * y + c) % n
+                    product = product * (x - y) % n
+                factor = math.gcd(product, n)
+                done += RHO_BATCH
+            power *= 2
+
+        if factor == n:
+            # The batch went past the factor, which is found again step by
+            # step from the start of the batch.
+            factor = 1
+            while factor == 1:
+                saved = (saved * saved + c) % n
+                factor = math.gcd(x - saved, n)
+        if factor != n:
+            return factor
+
+
+def factorize(n):
+    """
+    Return the prime factorization of a positive integer.
+
+    Args:
+        n (int): A positive integer.
+
+    Raises:
+        ValueError: If n is below 1.
+
+    Returns:
+        list: (prime, exponent) tuples, in ascending order of the primes.
+        It is empty for 1.
+    """
+    if n < 1:
+        raise ValueError('only positive integers have a prime factorization')
+
+    factors = {}
+    for prime in small_primes():
+        if prime * prime > n:
+            break
+        while n % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            n //= prime
+
+    # n has no factor below SIEVE_LIMIT, so it is prime below its square.
+    pending = [n] if n > 1 else []
+    while pending:
+        number = pending.pop()
+        if number < SIEVE_LIMIT * SIEVE_LIMIT or is_prime(number):
+            factors[number] = factors.get(number, 0) + 1
+            continue
+        factor = pollard_rho(number)
+        pending += (factor, number // factor)
+
+    return sorted(factors.items())
+
+
+def format_factors(factors):
+    """
+    Return a prime factorization as text.
+
+    Args:
+        factors (list): (prime, exponent) tuples, as returned by
+            factorize().
+
+    Returns:
+        str: The factors, e.g. '2^3 × 3 × 5', or '1' if there are none.
+    """
+    return ' × '.join(f'{prime}^{exponent}' if exponent > 1 else f'{prime}'
+                      for prime, exponent in factors) or '1'
@@ -8,17 +8,57 @@ This module provides the CalcOperations class, which implements methods for
 Standard and Scientifc calculator operations such as addition, subtraction,
 multiplication, division, percentage calculations, and more.
 
-The CalcOperations class handle internal logic of the calculator, including
-parsing user input, performing calculations, handling errors, and updating
-the calculator's display.
+The CalcOperations class wraps the headless CalcEngine class of calc_engine
+module, which handle internal logic of the calculator, including parsing
+user input, performing calculations and handling errors. CalcOperations
+connects the engine to the calculator's display and buttons.
+
+The displays are rendered through a RenderScheduler: the callbacks only
+update the in-memory display state, and a single after_idle() flush per
+burst of events pushes the values that changed to the tk.StringVar objects
+of the display labels.
+
+Keyboard input and pasted text go through an input queue, which is drained
+in batches of up to INPUT_BATCH keysyms per tick of the event loop. A burst
+of auto-repeated keys or a long pasted sequence is therefore processed by
+the engine in a few ticks and rendered once at the end, while the window
+keeps handling its events between the batches.
+
+Mouse clicks on the buttons go through a single dispatcher, bound once to
+the CLICK_TAG binding tag of every button. The dispatcher ignores the
+disabled buttons while the calculator is in error state, as press_key()
+does for the keys, so entering and leaving the error state does not unbind
+or rebind anything: it only sets the state of the engine and switches the
+style of the disabled buttons with one prepared Tcl script.
+
+Keystrokes are recorded for undo and redo by CalcEngine.press_key(), and
+mouse clicks by the click dispatcher.
+
+The keys estimated to be slow by CalcEngine.is_slow() (big factorials,
+high precision functions, huge exact Fractions) are pressed in a worker
+process by a BackgroundJob of calc_worker module. The primary display shows
+BUSY_TEXT until the result is marshalled back to the main loop, the keys
+typed meanwhile wait in the input queue, and Esc (the key of do_clear())
+kills the worker and restores the calculator as it was before the key.
+
+The display shows only the leading digits of a result. Copying it puts
+every digit into the clipboard, converted by value_to_text() of calc_engine
+module. An exact Fraction result can have hundreds of thousands of digits,
+which take seconds to convert, so such a result is converted in a worker
+process and copied once done, while the window keeps responding.
 
 Classes:
+    RenderScheduler: Coalesces display updates into one idle time flush.
+    ScheduledDisplayText: A display state that schedules a render when set.
     CalcOperations: A class containing methods for calculator operations.
 
 Imports:
+    collections: For the input queue.
+    fractions: For the size of the Fraction results copied.
     tkinter: For creating the GUI components of the calculator.
-    decimal: This module provides functionality for precise arithmetic
-      operations using the Decimal data type from the decimal module.
+    calc_engine: A custom module providing the headless arithmetic state
+        machine of the calculator and the value_to_text() function.
+    calc_worker: A custom module providing the BackgroundJob class.
 
 Author:
     Ashish Kumar (ashish.bmistry@gmail.com)
@@ -26,22 +66,162 @@ Author:
 
 # Importing required modules
 import tkinter as tk
-from decimal import Decimal
+from collections import deque
+from fractions import Fraction
 
+from calc_engine import (CalcEngine, DisplayText, press_detached,
+                         text_to_keysyms, value_to_text)
+from calc_worker import BackgroundJob
 
-class CalcOperations:
+# Maximum number of queued keysyms pressed per tick of the event loop.
+INPUT_BATCH = 4096
+
+# Size in bits (numerator and denominator) of the Fraction results above
+# which do_copy() converts the result in a worker process.
+COPY_INLINE_BITS = 1 << 16
+
+# Text of the primary display while a key is pressed in a worker process.
+BUSY_TEXT = 'Working...'
+
+# Binding tag of the calculator buttons, whose mouse clicks are bound to
+# CalcOperations.dispatch_click().
+CLICK_TAG = 'CalcButton'
+
+
+class RenderScheduler:
+    """
+    Coalesces display updates into one idle time flush.
+
+    Every display state registered with add() schedules a flush when it is
+    set. The flush runs once the event loop is idle, so any number of
+    updates made by the callbacks of a burst of events result in at most
+    one write per tk.StringVar, and only if the text actually changed.
+
+    Attributes:
+        widget (tk.Misc): Widget whose after_idle() schedules the flush.
+        targets (list): [display state, tk.StringVar, last rendered text]
+            of every registered display.
+        pending (str): Id of the scheduled flush, or None.
     """
-    A class to perform Standard & Scientific calculator operations.
 
-    This class defines methods for various arithmetic operations such as
-    addition, subtraction, multiplication, and division. It also include
-    methods for handling user input and error conditions. In future
-    development, it will also have methods for scientific calculation
-    operations.
+    def __init__(self, widget):
+        """
+        Initialize the RenderScheduler class.
+
+        Args:
+            widget (tk.Misc): Widget whose after_idle() schedules the flush.
+
+        Returns:
+            None
+        """
+        self.widget = widget
+        self.targets = []
+        self.pending = None
+
+    def add(self, display_text, variable):
+        """
+        Render a display state to a tk.StringVar.
+
+        Args:
+            display_text (ScheduledDisplayText): The display state.
+            variable (tk.StringVar): The variable of the display label.
+
+        Returns:
+            None
+        """
+        variable.set(display_text.value)
+        self.targets.append([display_text, variable, display_text.value])
+
+    def schedule(self):
+        """
+        Schedule a flush, unless one is already pending.
+
+        Returns:
+            None
+        """
+        if self.pending is None:
+            self.pending = self.widget.after_idle(self.flush)
+
+    def flush(self):
+        """
+        Push the display texts that changed to their tk.StringVar.
+
+        It can also be called directly to render the displays at once.
+
+        Returns:
+            None
+        """
+        if self.pending is not None:
+            self.widget.after_cancel(self.pending)
+            self.pending = None
+
+        for target in self.targets:
+            value = target[0].value
+            if value != target[2]:
+                target[1].set(value)
+                target[2] = value
+
+
+class ScheduledDisplayText(DisplayText):
+    """
+    A display state that schedules a render when it is set, a subclass of
+    DisplayText of calc_engine module.
 
     Attributes:
-        pri_display_text (tk.StringVar): String var for primary display.
-        sec_display_text (tk.StringVar): String var for secondary display.
+        value (str): Text of the display.
+        scheduler (RenderScheduler): The scheduler rendering the display.
+    """
+
+    __slots__ = ('scheduler',)
+
+    def __init__(self, scheduler, value='0'):
+        """
+        Initialize the ScheduledDisplayText class.
+
+        Args:
+            scheduler (RenderScheduler): The scheduler rendering the display.
+            value (str, optional): Initial text of the display. Defaults to
+                '0'.
+
+        Returns:
+            None
+        """
+        super().__init__(value)
+        self.scheduler = scheduler
+
+    def set(self, value):
+        """
+        Set the text of the display and schedule a render.
+
+        Args:
+            value (str): New text of the display.
+
+        Returns:
+            None
+        """
+        self.value = value
+        self.scheduler.schedule()
+
+
+class CalcOperations(CalcEngine):
+    """
+    A class to perform Standard & Scientific calculator operations, a
+    subclass of CalcEngine of calc_engine module.
+
+    The arithmetic operations such as addition, subtraction, multiplication,
+    and division, and the methods for handling user input and error
+    conditions are inherited from CalcEngine. This class renders the
+    engine's display state to tk.StringVar objects through a RenderScheduler
+    and reflects the error state of the engine in the button widgets.
+
+    Attributes:
+        render (RenderScheduler): Scheduler rendering the displays.
+        pri_display_text (ScheduledDisplayText): Display state of primary
+            display.
+        sec_display_text (ScheduledDisplayText): Display state of secondary
+            display.
+        pri_display_var (tk.StringVar): String var for primary display.
+        sec_display_var (tk.StringVar): String var for secondary display.
         pri_display_width (int): Width of primary display.
         sec_display_width (int): Width of secondary display.
         btn_disabled_bg (str): Background color of disabled buttons.
@@ -50,84 +230,113 @@ class CalcOperations:
         btn_equal_fg (str): Foreground color of equal button.
         buttons_dict (dict): A dictionary to store button objects with their
             respective text as keys.
+        btn_keysyms (dict): A dictionary representing button's text and the
+            keysym of their respective key.
         btn_key_events (dict): A dictionary representing button's text and
             their respective keyboard event name.
         btn_callbacks (dict): A dictionary representing button's text and
             reference to their respective callback.
+        sci_btn_texts (list): A list of text of buttons which are only part
+            of the scientific calculator.
         disabled_btn_texts (list): A list of text of buttons which are to be
             disabled when error message is present in the display.
-        btn_state (str): Represents certain button widgets state which changes
-            when error message is present in the display.
-        last_operation (str): String to store the last operation performed.
-        accumulator (float): Accumulator to store temporary results.
-        switch (boolean): A switch variable to track the state of operator
-            buttons. By default, the switch is set to False. When a user
-            presses an operator button (e.g., +, -, x, /), the switch
-            transitions to True. Once in the True state, subsequent presses
-            of operator buttons merely switch the operator sign without
-            executing additional code associated with the operation (e.g., the
-            do_plus method). This design ensures seamless handling of
-            consecutive operator inputs while maintaining the expected
-            functionality of the calculator. Defaults to False.
-        last_oper_eq_state (boolean): A boolean variable to track whether the
-            last operation performed was the equals (=) operation. This is
-            used to control the behavior of the calculator after the equals
-            operation, ensuring that subsequent numerical inputs after
-            pressing equals don't append to the previous result. Defaults to
-            False.
-        curr_value (float): Represent the current value displayed on the
-            primary display.
-        error (str): Error message for division by zero.
+        error_styles (tuple): Tcl scripts switching the disabled buttons of
+            the shown keypad to and from their error state style, as made by
+            build_error_styles().
+        input_queue (collections.deque): Keysyms waiting to be pressed.
+        input_pending (str): Id of the scheduled drain_input(), or None.
+        job (BackgroundJob): The key being pressed in a worker process, or
+            None.
+        job_snapshot (tuple): Snapshot of the calculator before the key of
+            job, restored if it is cancelled.
+        copy_job (BackgroundJob): The conversion of the last huge result
+            copied, or None.
 
     Note:
         - This class defines methods that can be bound as callbacks with
           widgets created in its subclass named Calculator of calculator
           module.
+        - The state of the arithmetic state machine (btn_state,
+          last_operation, accumulator, switch, last_oper_eq_state,
+          curr_value and error) is documented in CalcEngine class.
         """
 
-    def __init__(self):
+    def __init__(self, backend=None, context=None):
         """
         Initialize the CalcOperations class.
 
+        Args:
+            backend (str, optional): Numeric backend of the engine, one of
+                'float', 'decimal' or 'fraction'. Defaults to 'decimal'.
+            context (decimal.Context, optional): Decimal context of the
+                engine. Defaults to calc_backends.make_context().
+
         Returns:
             None
         """
-        self.pri_display_text = tk.StringVar()
-        self.pri_display_text.set('0')
-        self.sec_display_text = tk.StringVar()
-        self.sec_display_text.set('0')
-        self.pri_display_width = 16
-        self.sec_display_width = 34
+        # Calling CalcEngine's __init__() to inherit its properties.
+        super().__init__(backend, context)
+
+        # Replace the engine's plain display state with display states
+        # rendered to tk.StringVar objects, so that the display labels follow
+        # the calculator state with one redraw per burst of events.
+        self.render = RenderScheduler(self.window)
+        self.pri_display_text = ScheduledDisplayText(self.render)
+        self.sec_display_text = ScheduledDisplayText(self.render)
+        self.pri_display_var = tk.StringVar()
+        self.sec_display_var = tk.StringVar()
+        self.render.add(self.pri_display_text, self.pri_display_var)
+        self.render.add(self.sec_display_text, self.sec_display_var)
         self.btn_disabled_bg = '#F1F1F1'
         self.btn_operator_bg = '#F3FAFE'
         self.btn_equal_bg = '#7DB8FF'
         self.btn_equal_fg = '#FFFFFF'
         # Empty dictionary to store buttons object.
         self.buttons_dict = {}
+        # A dictionary containing all button's text and the keysym of their
+        # respective key. Order of items in the dictionary decides the way
+        # buttons are placed inside the window.
+        self.btn_keysyms = {'Back': 'BackSpace',
+                            'C': 'Escape',
+                            'CE': 'Delete',
+                            '%': 'percent',
+                            '/': 'slash',
+                            '7': '7',
+                            '8': '8',
+                            '9': '9',
+                            'x': 'asterisk',
+                            '4': '4',
+                            '5': '5',
+                            '6': '6',
+                            '-': 'minus',
+                            '1': '1',
+                            '2': '2',
+                            '3': '3',
+                            '+': 'plus',
+                            '+/-': 'F9',
+                            '0': '0',
+                            '.': 'period',
+                            '=': 'equal',
+                            'sin': 's',
+                            'cos': 'o',
+                            'tan': 't',
+                            'π': 'p',
+                            'ln': 'n',
+                            'log': 'l',
+                            'eˣ': 'x',
+                            'e': 'e',
+                            'x²': 'q',
+                            '√': 'at',
+                            'xʸ': 'asciicircum',
+                            '1/x': 'r',
+                            'n!': 'exclam',
+                            'nPr': 'P',
+                            'nCr': 'C'}
         # A dictionary containing all button's text and their respective
-        # keyboard event name. Order of items in the dictionary decides the
-        # way buttons are placed inside the window.
-        self.btn_key_events = {'Back': '<BackSpace>',
-                               'C': '<Escape>',
-                               'CE': '<Delete>',
-                               '%': '<KeyPress-percent>',
-                               '/': '<KeyPress-/>',
-                               '7': '<KeyPress-7>',
-                               '8': '<KeyPress-8>',
-                               '9': '<KeyPress-9>',
-                               'x': '<KeyPress-asterisk>',
-                               '4': '<KeyPress-4>',
-                               '5': '<KeyPress-5>',
-                               '6': '<KeyPress-6>',
-                               '-': '<KeyPress-minus>',
-                               '1': '<KeyPress-1>',
-                               '2': '<KeyPress-2>',
-                               '3': '<KeyPress-3>',
-                               '+': '<KeyPress-plus>',
-                               '+/-': '<F9>',
-                               '0': '<KeyPress-0>',
-                               '.': '<KeyPress-period>',
-                               '=': '<KeyPress-equal>'}
+        # keyboard event name.
+        self.btn_key_events = {
+            btn_text: f'<KeyPress-{keysym}>'
+            for btn_text, keysym in self.btn_keysyms.items()}
         # A dictionary containing all button's text and reference to their
         # respective callback. Order of items in the dictionary decides the
         # way buttons are bound to the callbacks.
@@ -151,313 +360,144 @@ class CalcOperations:
                               '+/-': self.do_plusminus,
                               '0': self.do_digit_0,
                               '.': self.do_dot,
-                              '=': self.do_equal}
+                              '=': self.do_equal,
+                              'sin': self.do_sin,
+                              'cos': self.do_cos,
+                              'tan': self.do_tan,
+                              'π': self.do_pi,
+                              'ln': self.do_ln,
+                              'log': self.do_log,
+                              'eˣ': self.do_exp,
+                              'e': self.do_e,
+                              'x²': self.do_square,
+                              '√': self.do_sqrt,
+                              'xʸ': self.do_power,
+                              '1/x': self.do_reciprocal,
+                              'n!': self.do_factorial,
+                              'nPr': self.do_perm,
+                              'nCr': self.do_comb}
+        # Text of the buttons which are only part of the scientific
+        # calculator, in the order they are placed.
+        self.sci_btn_texts = ['sin', 'cos', 'tan', 'π', 'ln', 'log', 'eˣ',
+                              'e', 'x²', '√', 'xʸ', '1/x', 'n!', 'nPr',
+                              'nCr']
         # A list containing text of buttons that are to be disabled when error
         # message is present in the display.
-        self.disabled_btn_texts = ['%', '/', 'x', '-', '+', '+/-', '.', '=']
-        self.btn_state = tk.NORMAL
-
-        self.last_operation = ''
-        self.accumulator = 0.
-        self.switch = False
-        self.last_oper_eq_state = False
-        self.curr_value = 0.0
-        self.error = 'Div. by 0 Error!'
-
-    def str_to_float(self, str_value):
-        """
-        Convert a string to a floating-point number.
-
-        Args:
-            str_value (str): The string value to convert.
-
-        Raises:
-            ValueError: If the input parameters are not valid.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - num_value (float): Stores the converted float value.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
+        self.disabled_btn_texts = ['%', '/', 'x', '-', '+', '+/-', '.', '=',
+                                   'sin', 'cos', 'tan', 'ln', 'log', 'eˣ',
+                                   'x²', '√', 'xʸ', '1/x', 'n!', 'nPr',
+                                   'nCr']
+        self.error_styles = ('', '')
+        # Mouse clicks of all buttons are handled by one dispatcher.
+        self.window.bind_class(CLICK_TAG, '<Button-1>', self.dispatch_click)
+        # Keysyms of keyboard events and pasted text waiting to be pressed.
+        self.input_queue = deque()
+        self.input_pending = None
+        self.job = None
+        self.job_snapshot = None
+        self.copy_job = None
+
+    def build_error_styles(self):
+        """
+        Return the Tcl scripts switching the style of the disabled buttons.
+
+        The scripts configure every button of disabled_btn_texts in the
+        shown keypad, so a switch to or from the error state is a single
+        Tcl evaluation whatever the number of buttons.
 
         Returns:
-            float or None: The converted floating-point number if successful,
-            None otherwise.
+            tuple: (disable, enable) Tcl scripts.
         """
-        try:
-            num_value = Decimal(str_value)
-
-            return num_value
-        except ValueError:
-            return None
-
-    def float_to_str(self, num_value):
-        """
-        Convert a floating-point number to a string.
-
-        Depending on length of the num_value, and presence of 'E' & '.', it
-        convert the floating-point number to a string. Depending on the
-        context, It also converts the floating-point number to a string
-        representing scientific notation.
+        disable = []
+        enable = []
+        for btn_text in self.disabled_btn_texts:
+            btn = self.buttons_dict.get(btn_text)
+            if btn is None:
+                continue
+            # Below conditional check ensures that equal button get its
+            # original color when returning to its normal state.
+            normal_bg = (self.btn_equal_bg if btn_text == '='
+                         else self.btn_operator_bg)
+            disable.append(f'{btn} configure -state {tk.DISABLED} '
+                           f'-bg {self.btn_disabled_bg}')
+            enable.append(f'{btn} configure -state {tk.NORMAL} '
+                          f'-bg {normal_bg}')
+
+        return '\n'.join(disable), '\n'.join(enable)
+
+    def dispatch_click(self, event):
+        """
+        Call the callback of a clicked button.
+
+        It is bound once to the mouse click of CLICK_TAG, the binding tag of
+        every button. Clicks on the buttons of disabled_btn_texts are
+        ignored while the calculator is in error state. While a key is
+        pressed in a worker process, the C button cancels it and the other
+        buttons ring the bell. A click estimated to be slow is queued, to be
+        pressed in a worker process by drain_input(). Other clicks are
+        recorded in the undo stack.
 
         Args:
-            num_value (float): The number to convert.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - str_value (str): The converted string value.
-                - sci_notation_len (int): The desired length of the scientific
-                  notation string representation. The resulting string length
-                  may vary depending on whether the number is negative or
-                  positive, as the representation includes a sign for
-                  negative numbers.
-                - int_part (str): String representing integer part of the
-                  str_value when lenght of the str_value is greater than
-                  primary display width and '.' is present.
-                - n_digits (int): Remaining number of digits after duducting
-                  (lenght of int_part + 1 for dot) from primary display width.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
+            event (tk.Event): The mouse click event.
 
         Returns:
-            str: The converted string representation of the number.
-        """
-        str_value = str(num_value)
-
-        # Sometimes, in the % operations, when digits after decimal point
-        # are more than 6 in the accumulator, python converts it to the
-        # scientific notation (like 0.00000008 becomes 8E-8), but since we
-        # want to convert only when length of the whole value becomes more
-        # than primary display width, so we check the presence of 'E' in the
-        # num_value and format it to the regular decimal number. After
-        # converting it back to the regular decimal number, if length of the
-        # value becomes greater than the primary display size, futher
-        # operations are performed below.
-        if 'E' in str(num_value):
-            str_value = f'{num_value:f}'
-
-        # Remove all trailing zero when '.' is present in the string str_value.
-        if '.' in str_value:
-            while str_value[-1] == '0':
-                str_value = str_value[0:-1]
-
-        # Remove '.' from the string str_value when it is not followed by any
-        # digit.
-        if str_value[-1] == '.':
-            str_value = str_value[0:-1]
-
-        # If length of str_value is greater than primary display width.
-        if len(str_value) > self.pri_display_width:
-            sci_notation_len = 9 if '-' in str_value else 10
-
-            # If '.' is present in the str_value, split the str_value into
-            # integer and decimal part.
-            if '.' in str_value:
-                # Split the string into two part and storing integer part
-                # into int_part variable.
-                int_part = str_value.split('.')[0]
-                str_value = Decimal(str_value)
-
-                # If integer part is equal to the zero then convert the
-                # str_value to the scientific notation.
-                if int_part == '0':
-                    str_value = f"{str_value:.{sci_notation_len}E}"
-                # If lenght of integer part is greater than primary display
-                # width, convert the str_value into scientific notation.
-                elif len(int_part) > self.pri_display_width:
-                    str_value = f"{str_value:.{sci_notation_len}E}"
-                else:
-                    # If length of integer parts is less than or equal to
-                    # primary display width, round off the str_value upto
-                    # n_digits.
-                    # Subtract 1 for the dicimal point in n_digits expresssion.
-                    n_digits = self.pri_display_width - len(int_part) - 1
-                    str_value = f"{str_value:.{max(0, n_digits)}f}"
-
-                    # If rounded off str_value become longer than primary
-                    # display width (eg. 9999999999999999.8 becomes
-                    # 10000000000000000), which may not fit into primary
-                    # display, so convert it into scientific notation.
-                    if len(str_value) > self.pri_display_width:
-                        str_value = f"{Decimal(str_value):.{sci_notation_len}E}"
+            str: 'break' if the click is ignored, None otherwise.
+        """
+        btn_text = event.widget.cget('text')
+        if (self.state.btn_state == tk.DISABLED
+                and btn_text in self.disabled_btn_texts):
+            return 'break'
+        if self.job is not None:
+            if btn_text == 'C':
+                self.cancel_job()
             else:
-                str_value = Decimal(str_value)
-                # When lenght of str_value is greater than primary display
-                # width and '.' is not present into str_value then directly
-                # convert it into scientific notation.
-                str_value = f"{str_value:.{sci_notation_len}E}"
-
-        return str_value
-
-    def clear_if_error(self):
-        """
-        Clear the display if an error message is present in the display.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - str_value (str): The current string retrieved from primary
-                  display.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
-
-        Returns:
-            None
-        """
-        str_value = self.pri_display_text.get()
-
-        if str_value == self.error:
-            self.do_clear()
-            return True
-
-    def clear_if_last_oper_equal(self):
-        """
-        Reset the calculator state if the last operation performed was the
-        equals (=) operation and subsequent numerical key is pressed.
-
-        This method checks if the last operation performed was the equals
-        operation (=) (Note: last_operation is always equal when = button is
-        pressed or % operation is performed). It is used to control the
-        behavior of the calculator after the equals operation, ensuring that
-        subsequent numerical inputs after pressing equals don't append to the
-        previous result.
+                self.window.bell()
+            return 'break'
+        keysym = self.btn_keysyms[btn_text]
+        if self.is_slow(keysym):
+            self.queue_keys((keysym,))
+            return None
 
-        Returns:
-            None
-        """
-        if self.last_operation == '' and self.last_oper_eq_state is True:
-            self.do_clear()
-            self.last_oper_eq_state = False
-            return True
+        before = self.snapshot()
+        self.btn_callbacks[btn_text](event)
+        self.record_undo(before)
 
     def disable_if_error(self):
         """
         Disable certain calculator buttons(operator buttons) if an error
         message is present in the display.
 
-        Note:
-            - This method relies on the 'buttons_dict' attribute of the
-              this class to access the buttons.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - btn_texts(str): A string representing button text from
-                  disabled_btn_texts list.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
+        The style of the buttons is switched by one Tcl evaluation of the
+        script prepared by build_error_styles(). No event is unbound, as
+        dispatch_click() and press_key() ignore the disabled buttons and
+        their keys in error state.
 
         Returns:
             None
         """
-        # Set certain buttons state to DISABLED and unbind the callback
-        # assigned for mouse and keyboard event for DISABLED button.
-        for btn_text in self.disabled_btn_texts:
-            self.buttons_dict[btn_text].config(state=tk.DISABLED,
-                                               bg=self.btn_disabled_bg)
-            self.buttons_dict[btn_text].unbind('<Button-1>')
-            self.window.unbind(self.btn_key_events[btn_text])
-
-        # Unbind the callback (self.do_equal()) assigned for Enter key.
-        self.window.unbind('<Return>')
+        self.window.tk.eval(self.error_styles[0])
 
         # btn_state changes when certain buttons are set to disabled due to
         # error message present in the display.
-        self.btn_state = tk.DISABLED
-
-    def do_clear(self, event=None):
-        """
-        Clear the calculator display and reset internal state.
-
-        This method clears primary and secondary displays of the calculator,
-        resetting them to '0'. Additionally, it resets the internal state of
-        the calculator by initializing the 'last_operation' to an empty string,
-        resetting the 'accumulator' to 0, and setting the 'switch' and
-        'last_oper_eq_state' to False.
-
-        Args:
-            event(tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the clear display
-                event. Defaults to None.
-
-        Note:
-            - This method affects the appearance and behavior of certain
-              calculator buttons, such as resetting their state and background
-              color to default values.
-            - It relies on the 'buttons_dict', 'last_operation', 'accumulator',
-              'switch', 'pri_display_text', and 'sec_display_text' attributes
-              of the CalcOperations class to perform its operation.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - btn_texts (str): A string representing button text from
-                  disabled_btn_texts list.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
-
-        Returns:
-            None
-        """
-        self.last_operation = ""
-        self.accumulator = 0.
-        self.switch = False
-        self.last_oper_eq_state = False
-        self.pri_display_text.set('0')
-        self.sec_display_text.set('0')
-
-        if self.btn_state == tk.DISABLED:
-            for btn_text in self.disabled_btn_texts:
-                # Below conditional check ensures that equal button get its
-                # original color when returning to its normal state.
-                if btn_text != '=':
-                    self.buttons_dict[btn_text].config(state=tk.NORMAL,
-                                                       bg=self.btn_operator_bg)
-                else:
-                    self.buttons_dict[btn_text].config(state=tk.NORMAL,
-                                                       bg=self.btn_equal_bg)
-
-                # Bind callback to mouse left click event.
-                self.buttons_dict[btn_text].bind('<Button-1>',
-                                                 self.btn_callbacks[btn_text])
-
-                # Bind callback to keyboard event.
-                self.window.bind(self.btn_key_events[btn_text],
-                                 self.btn_callbacks[btn_text])
-
-            # Bind callback for Enter key additionally which is already
-            # assigned for <KeyPress-equal> event.
-            self.window.bind('<Return>', self.do_equal)
+        super().disable_if_error()
 
-            # Set btn_state to tk.NORMAL once disabled buttons' state are set
-            # to tk.NORMAL.
-            self.btn_state = tk.NORMAL
-
-    def do_clear_entry(self, event=None):
+    def enable_after_error(self):
         """
-        Clear the current entry on the calculator display.
-
-        It clears the current entry on the display if no error message is
-        present in the dipslay otherwise reset the calculator's internal state
-        to initial state.
+        Enable the calculator buttons disabled by disable_if_error() once the
+        calculator is cleared.
 
-        Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the clear entry
-                event. Defaults to None.
-
-        Note:
-            - It also reset the calculator state if error is present in the
-              primary display or the last_operation is = (equal)
-              (last_operation is always equal when =  button is pressed or %
-              operation is performed).
+        It is called by do_clear() when btn_state is tk.DISABLED. It restores
+        the state and background color of the buttons with one Tcl
+        evaluation.
 
         Returns:
             None
         """
-        # If here is an error in the display or last performed operation was
-        # equal (=), reset the caculator's state and do nothing.
-        if self.clear_if_error() or self.clear_if_last_oper_equal():
-            return None
+        self.window.tk.eval(self.error_styles[1])
 
-        self.pri_display_text.set('0')
+        # Set btn_state to tk.NORMAL once disabled buttons' state are set
+        # to tk.NORMAL.
+        super().enable_after_error()
 
     def do_digit_x(self, event=None):
         """
@@ -473,8 +513,6 @@ class CalcOperations:
 
         Note:
             - This method utilizes the following locally declared variables:
-                - str_value (str): The current value displayed on the
-                  calculator.
                 - digit (str): The pressed (by mouse or keyboard) numerical
                   button's text (0 to 9).
             - These variables are used internally within the method and are
@@ -483,416 +521,242 @@ class CalcOperations:
         Returns:
             None
         """
-        self.switch = False
-
-        self.clear_if_error()
-        self.clear_if_last_oper_equal()
-
-        str_value = self.pri_display_text.get()
-
         if event.type == '4':   # If mouse click event is triggerred.
             digit = event.widget.cget('text')
         elif event.type == '2':    # If keyboard event is triggerred.
             digit = event.keysym
 
-        # Set the input value to the display.
-        if len(str_value) < self.pri_display_width:
-            if str_value == "0":
-                self.pri_display_text.set(digit)
-            else:
-                self.pri_display_text.set(str_value + digit)
+        self.enter_digit(digit)
 
-    def do_dot(self, event=None):
+    def queue_keys(self, keysyms):
         """
-        Handle decimal point input for the calculator.
-
-        This method handles decimal point input for the calculator, updating
-        the display accordingly.
+        Queue keysyms to be pressed by drain_input().
 
         Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the decimal point
-                event. Defaults to None.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - str_value (str): The current value displayed on the
-                  calculator.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
+            keysyms (iterable): Keysyms accepted by press_key().
 
         Returns:
             None
         """
-        # switch (boolean): A variable that ensures that code inside the
-        # operation functions like 'do_plus' works only if there is input in
-        # the screen.
-        self.switch = False
-
-        self.clear_if_error()
-        self.clear_if_last_oper_equal()
+        self.input_queue.extend(keysyms)
+        if self.input_pending is None and self.input_queue:
+            self.input_pending = self.window.after(0, self.drain_input)
 
-        str_value = self.pri_display_text.get()
-
-        if len(str_value) < self.pri_display_width and '.' not in str_value:
-            self.pri_display_text.set(str_value + '.')
-
-    def do_digit_0(self, event=None):
+    def queue_key_event(self, event):
         """
-        Handle zero digit input for the calculator.
+        Queue the key of a keyboard event.
 
-        This method handles zero digit ('0') input for the calculator,
-        updating the display accordingly.
+        It is bound to the keyboard events of the buttons, so that keys are
+        pressed in batches by drain_input().
 
         Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the zero digit
-                input event. Defaults to None.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - str_value (str): The current value displayed on the
-                  calculator.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
+            event (tk.Event): The keyboard event.
 
         Returns:
             None
         """
-        self.switch = False
-
-        self.clear_if_error()
-        self.clear_if_last_oper_equal()
-
-        str_value = self.pri_display_text.get()
-
-        if len(str_value) < self.pri_display_width and str_value != '0':
-            self.pri_display_text.set(str_value + '0')
+        self.input_queue.append(event.keysym)
+        if self.input_pending is None:
+            self.input_pending = self.window.after(0, self.drain_input)
 
-    def do_operation(self, curr_operation):
+    def drain_input(self):
         """
-        Handle addition, subtraction, multiplication and division operation
-        for the calculator.
+        Press up to INPUT_BATCH queued keysyms.
 
-        This method handles the addition, subtraction, multiplication and
-        division operation for the calculator, updating the display and
-        internal state accordingly.
+        If keysyms are left in the queue, another batch is scheduled for the
+        next tick of the event loop, so the window handles its events between
+        the batches. The displays are rendered once the queue is empty.
 
-        Args:
-            curr_operation (str): A string representing current operation.
+        A key estimated to be slow is pressed in a worker process by
+        start_job(), and the keys after it wait in the queue until the job
+        is over. An Escape queued meanwhile cancels the job, along with the
+        keys queued before it.
 
         Returns:
             None
         """
-        # If here is an error in the display, reset the calculator state and do
-        # nothing.
-        if self.clear_if_error():
-            return None
-
-        # Ensures that pressing + or - or x or / button subsequently has no
-        # effect as switch is set to True once any of the above mentioned
-        # button is clicked. It only helps to replace current operation to be
-        # performed.
-        if self.switch is False:
-            if self.last_operation == '':
-                self.accumulator = self.str_to_float(
-                    self.pri_display_text.get())
-                # Current operation becomes the last operation for any
-                # subsequent operation.
-                self.last_operation = curr_operation
-                self.pri_display_text.set('0')
-                self.sec_display_text.set(self.float_to_str(
-                    self.accumulator) + self.last_operation)
-            else:
-                self.do_equal(curr_operation=curr_operation)
-                # Current operation becomes the last operation for any
-                # subsequent operation.
-                self.last_operation = curr_operation
-
-        # This condition sets last_operation when user switch operations
-        # (eg. from + to x, etc) without any current value as input.
-        if self.switch is True:
-            self.last_operation = curr_operation
-            self.sec_display_text.set(self.float_to_str(
-                self.accumulator) + self.last_operation)
+        self.input_pending = None
+        queue = self.input_queue
+        if self.job is not None:
+            if 'Escape' not in queue:
+                # finish_job() drains the queue once the job is done.
+                return None
+            while queue.popleft() != 'Escape':
+                pass
+            self.cancel_job()
+
+        press_key = self.press_key
+        is_slow = self.is_slow
+        for _ in range(min(len(queue), INPUT_BATCH)):
+            keysym = queue.popleft()
+            if is_slow(keysym):
+                self.start_job(keysym)
+                return None
+            press_key(keysym)
 
-        self.switch = True
+        if queue:
+            self.input_pending = self.window.after(0, self.drain_input)
 
-    def do_plus(self, event=None):
+    def start_job(self, keysym):
         """
-        Handle addition operation for the calculator.
+        Press a key in a worker process, with press_detached() of
+        calc_engine module.
+
+        The primary display shows BUSY_TEXT and the window the busy cursor
+        until finish_job() or cancel_job().
 
         Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the addition event.
-                Defaults to None.
+            keysym (str): Keysym of the key.
 
         Returns:
             None
         """
-        self.do_operation(curr_operation='+')
+        before = self.snapshot()
+        self.job_snapshot = before
+        self.job = BackgroundJob(
+            self.window, press_detached,
+            (self.backend.name, self.context, before, keysym),
+            on_done=self.finish_job, on_error=self.fail_job)
+        self.pri_display_text.set(BUSY_TEXT)
+        self.window.config(cursor='watch')
 
-    def do_minus(self, event=None):
+    def end_job(self):
         """
-        Handle subtraction operation for the calculator.
-
-        Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the substraction
-                event. Defaults to None.
+        Forget the job once it is over and restore the cursor.
 
         Returns:
-            None
+            tuple: The snapshot of the calculator before the key of the job.
         """
-        self.do_operation(curr_operation='-')
+        before = self.job_snapshot
+        self.job = None
+        self.job_snapshot = None
+        self.window.config(cursor='')
+        return before
 
-    def do_multi(self, event=None):
+    def finish_job(self, result):
         """
-        Handle multiplication operation for the calculator.
+        Show the result of the key pressed in the worker process.
+
+        The snapshot of the calculator after the key is restored, the
+        entries it completed are appended to the history, the key is
+        recorded in the undo stack and the keys queued meanwhile are
+        pressed.
 
         Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the multiplication
-                event. Defaults to None.
+            result (tuple): (snapshot, entries) as returned by
+                press_detached().
 
         Returns:
             None
         """
-        self.do_operation(curr_operation='*')
+        before = self.end_job()
+        after, entries = result
+        self.restore(after)
+        if self.history is not None:
+            for entry in entries:
+                self.history.append(*entry)
+        self.record_undo(before)
+        self.queue_keys(())
 
-    def do_divd(self, event=None):
+    def fail_job(self, error):
         """
-        Handle division operation for the calculator.
+        Restore the calculator when the worker process failed, e.g. it ran
+        out of memory, and ring the bell.
 
         Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the division event.
-                Defaults to None.
+            error (Exception): The exception raised in the worker process,
+                or None if it died.
 
         Returns:
             None
         """
-        self.do_operation(curr_operation='/')
+        self.restore(self.end_job())
+        self.window.bell()
+        self.queue_keys(())
 
-    def do_percent(self, event=None):
+    def cancel_job(self):
         """
-        Handle percentage operation for the calculator.
-
-        This method calculates the percentage of the current value displayed
-        on the calculator. If no previous operation has been performed, it
-        calculates the percentage of the current value relative to zero. It
-        then updates the display and internal state accordingly.
+        Kill the worker process of the running job and restore the
+        calculator as it was before its key.
 
-        Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the percentage
-                event. Defaults to None.
+        It is called by the Escape key and the C button while a job is
+        running, instead of do_clear().
 
         Returns:
             None
         """
-        # If here is an error in the display, reset the calculator state and do
-        # nothing.
-        if self.clear_if_error():
-            return None
-
-        if self.last_operation == '':
-            self.accumulator = self.str_to_float(
-                self.pri_display_text.get())
+        self.job.cancel()
+        self.restore(self.end_job())
 
-        self.do_equal(curr_operation='%')
-        self.last_operation = ''
-
-    def do_equal(self, event=None, curr_operation='='):
+    def do_paste(self, event=None):
         """
-        Handle the equal sign button press to perform arithmetic calculations.
+        Type a number or an operation sequence from the clipboard.
 
-        This method performs arithmetic calculations based on the last
-        operation and the current value displayed on the calculator. It
-        updates the secondary display with the operation and operand, performs
-        the calculation, updates the primary display with the result, and
-        resets the internal state accordingly.
+        The text is translated with text_to_keysyms() of calc_engine module
+        and queued. The bell rings if the clipboard does not hold text the
+        calculator can type.
 
         Args:
             event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the equal event.
+                when the method is called as a callback for the paste event.
                 Defaults to None.
-            curr_operation (str, optional): A string representing the
-                curr_operation. Defaults to '='.
-
-        Raises:
-            ZeroDivisionError: If division by zero occur during division and
-                percentage operation.
 
         Returns:
             None
         """
-        # If here is an error in the display, reset the calculator state and do
-        # nothing.
-        if self.clear_if_error():
-            return None
-
-        # If last_operaton is set to '' and curr_operation is not set to '%',
-        # then do nothing. It also works when there is an error in the display
-        # which is reset by clear_if_error() as the same has been called above.
-        if self.last_operation == '' and curr_operation != '%':
+        try:
+            keysyms = text_to_keysyms(self.window.clipboard_get())
+        except (tk.TclError, ValueError):
+            self.window.bell()
             return None
 
-        self.curr_value = self.str_to_float(
-            self.pri_display_text.get())
-
-        self.switch = False
-
-        # Set secondary display for three different conditions i.e. 5+8=, 5%,
-        # and 100*5% or 100/5% or 100-5% or 100+5%.
-
-        # Set the last_oper_eq_state to True if the last operation performed
-        # was the equals operation(=) (last_operation is always equal when =
-        # button is pressed or % operation is performed). It is used to
-        # control the behavior of the calculator after the equals operation,
-        # ensuring that subsequent numerical inputs after pressing equals don't
-        # append to the previous result.
-        if curr_operation == '=':
-            self.sec_display_text.set(self.float_to_str(self.accumulator)
-                                      + self.last_operation
-                                      + self.float_to_str(self.curr_value)
-                                      + '=')
-            self.last_oper_eq_state = True
-        elif self.last_operation == '' and curr_operation == '%':
-            self.sec_display_text.set(self.float_to_str(self.accumulator)
-                                      + curr_operation)
-            self.last_oper_eq_state = True
-        elif self.last_operation != '' and curr_operation == '%':
-            self.sec_display_text.set(self.float_to_str(self.accumulator)
-                                      + self.last_operation
-                                      + self.float_to_str(self.curr_value)
-                                      + curr_operation
-                                      + '=')
-            self.last_oper_eq_state = True
-
-        # Below code perform calculation based on last_operation &
-        # curr_operation.
-        if self.last_operation == '*' and curr_operation != '%':
-            self.accumulator *= self.curr_value
-        elif self.last_operation == "-" and curr_operation != '%':
-            self.accumulator -= self.curr_value
-        elif self.last_operation == "+" and curr_operation != '%':
-            self.accumulator += self.curr_value
-        elif self.last_operation == "/" and curr_operation != '%':
-
-            # Handle ZeroDivsionError that may occur during division operation.
-            try:
-                self.accumulator /= self.curr_value
-            except ZeroDivisionError:
-                self.pri_display_text.set(self.error)
-                # Set secondary display in case of ZeroDivisionError occurred
-                # during series of operations like (5+8)/0+.
-                if curr_operation != '=':
-                    self.sec_display_text.set(self.float_to_str(self.accumulator)
-                                              + self.last_operation
-                                              + self.float_to_str(self.curr_value)
-                                              + '=')
-                self.disable_if_error()
-                return None
+        self.queue_keys(keysyms)
 
-        elif self.last_operation == '' and curr_operation == '%':
-            self.accumulator /= 100
-        elif self.last_operation == '*' and curr_operation == '%':
-            self.accumulator = self.accumulator * (self.curr_value/100)
-        elif self.last_operation == '/' and curr_operation == '%':
-
-            # Handle ZeroDivsionError that may occur during percentage
-            # operation.
-            try:
-                self.accumulator = self.accumulator / self.curr_value * 100
-            except ZeroDivisionError:
-                self.pri_display_text.set(self.error)
-                self.disable_if_error()
-                return None
+    def do_copy(self, event=None):
+        """
+        Copy every digit of the number of the primary display to the
+        clipboard.
 
-        elif self.last_operation == '+' and curr_operation == '%':
-            self.accumulator += (self.accumulator * (self.curr_value/100))
-        elif self.last_operation == '-' and curr_operation == '%':
-            self.accumulator -= (self.accumulator * (self.curr_value/100))
-
-        # Set primary display.
-        # Excecuted when user presses equal (=) button.
-        if curr_operation == '=':
-            self.pri_display_text.set(
-                self.float_to_str(self.accumulator))
-            self.last_operation = ''
-        # Set primary display when curr_operation is %.
-        elif curr_operation == '%':
-            self.pri_display_text.set(
-                self.float_to_str(self.accumulator))
-        else:
-            # Executed when user want to calculated series of operations such
-            # as 10 + 20 + 30 - 23 * 4 etc.
-            self.pri_display_text.set('0')
-            self.sec_display_text.set(
-                self.float_to_str(self.accumulator)+curr_operation)
-
-    def do_plusminus(self, event=None):
-        """
-        Toggle the sign of the number displayed on the calculator.
-
-        It changes the sign of the number displayed on the calculator's
-        primary display. If the number is positive, it becomes negative, and
-        vice versa.
+        The number is the full precision result when the display shows one
+        (see read_entry()), as text made by value_to_text(). A Fraction of
+        more than COPY_INLINE_BITS bits is converted by a BackgroundJob and
+        copied when done. The bell rings if the display shows an error
+        message or a key is being pressed in a worker process.
 
         Args:
             event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the plusminus (+/-)
-                event. Defaults to None.
+                when the method is called as a callback for the copy event.
+                Defaults to None.
 
         Returns:
             None
         """
-        # If here is an error in the display we need to clear the error and do
-        # nothing.
-        if self.clear_if_error():
+        if self.state.btn_state == tk.DISABLED or self.job is not None:
+            self.window.bell()
             return None
 
-        self.pri_display_text.set(
-            self.float_to_str(-self.str_to_float(self.pri_display_text.get())))
-
-    def do_backspace(self, event=None):
-        """
-        Perform backspace operation on the calculator display.
+        value = self.read_entry()
+        if (isinstance(value, Fraction)
+                and value.numerator.bit_length()
+                + value.denominator.bit_length() > COPY_INLINE_BITS):
+            # Only the last copy is kept.
+            if self.copy_job is not None:
+                self.copy_job.cancel()
+            self.copy_job = BackgroundJob(self.window, value_to_text, (value,),
+                                          on_done=self.set_clipboard)
+            return None
 
-        This method removes the last character from the number displayed on
-        the calculator's primary display. If the displayed number has only one
-        digit after backspacing, it sets the display to '0'.
+        self.set_clipboard(value_to_text(value))
 
-        Note: It also reset the calculator state if error is present in the
-        primary display or the last_operation is = (equal) (last_operation is
-        always equal when =  button is pressed or % operation is performed).
+    def set_clipboard(self, text):
+        """
+        Replace the content of the clipboard with a text.
 
         Args:
-            event (tk.Event, optional): An event parameter that can be provided
-                when the method is called as a callback for the backspace
-                event. Defaults to None.
-
-        Note:
-            - This method utilizes the following locally declared variables:
-                - str_value (str): A string variable to store primary display
-                  value.
-            - These variables are used internally within the method and are
-              not exposed to the method's caller.
+            text (str): The text.
 
         Returns:
             None
         """
-        # If here is an error in the display or last performed operation was
-        # equal (=), reset the caculator's state and do nothing.
-        if self.clear_if_error() or self.clear_if_last_oper_equal():
-            return None
-
-        self.clear_if_last_oper_equal()
-
-        str_value = self.pri_display_text.get()
-
-        if str_value != '0':
-            self.pri_display_text.set(str_value[0:-1])
-            if len(str_value) == 1:
-                self.pri_display_text.set('0')
+        self.window.clipboard_clear()
+        self.window.clipboard_append(text)
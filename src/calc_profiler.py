@@ -0,0 +1,209 @@
+"""
+calc_profiler module
+
+This module provides optional latency instrumentation for the callbacks of
+the calculator.
+
+A CallbackProfiler wraps the callbacks registered in btn_callbacks and
+records the time spent in every call in a fixed-bucket histogram, one per
+callback. The histogram buckets are powers of two of nanoseconds, so
+recording a call is a bit_length() and a list increment, and the memory
+used does not grow with the number of events. The profiler also counts the
+writes to the Tk variables of the displays made by every event.
+
+The profiler is only installed when profiling is enabled. When it is not,
+the callbacks are bound unwrapped and cost nothing extra.
+
+Classes:
+    Histogram: A fixed-bucket latency histogram.
+    CallbackProfiler: Wraps callbacks and collects their latency histograms
+        and Tk variable write counts.
+
+Imports:
+    functools: For keeping the name of the wrapped callbacks.
+    sys: For the default output stream of the report.
+    time: For the nanosecond clock.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    $ python calculator.py --profile
+"""
+
+# Importing required modules
+import functools
+import sys
+import time
+
+# Number of histogram buckets. Bucket i counts the calls that took less
+# than 2**i nanoseconds (and at least 2**(i-1)), the last bucket counts
+# everything slower than about 1 second.
+N_BUCKETS = 32
+
+
+class Histogram:
+    """
+    A fixed-bucket latency histogram with power of two buckets.
+
+    Attributes:
+        buckets (list): Number of calls per bucket.
+        count (int): Total number of calls.
+        total_ns (int): Total time of the calls in nanoseconds.
+        max_ns (int): Slowest call in nanoseconds.
+        writes (int): Total Tk variable writes made by the calls.
+        max_writes (int): Most Tk variable writes made by a single call.
+    """
+
+    __slots__ = ('buckets', 'count', 'total_ns', 'max_ns', 'writes',
+                 'max_writes')
+
+    def __init__(self):
+        """
+        Initialize the Histogram class.
+
+        Returns:
+            None
+        """
+        self.buckets = [0] * N_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.writes = 0
+        self.max_writes = 0
+
+    def record(self, elapsed_ns, writes=0):
+        """
+        Record one call.
+
+        Args:
+            elapsed_ns (int): Time of the call in nanoseconds.
+            writes (int, optional): Tk variable writes made by the call.
+                Defaults to 0.
+
+        Returns:
+            None
+        """
+        self.buckets[min(elapsed_ns.bit_length(), N_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.writes += writes
+        if writes > self.max_writes:
+            self.max_writes = writes
+
+    def percentile(self, percent):
+        """
+        Return the upper bound of the bucket holding a percentile.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            int: Upper bound of the bucket in nanoseconds, at most max_ns,
+            or 0 without calls.
+        """
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, n_calls in enumerate(self.buckets):
+            seen += n_calls
+            if n_calls and seen >= rank:
+                return min(1 << index, self.max_ns)
+        return 0
+
+
+class CallbackProfiler:
+    """
+    Wraps callbacks and collects their latency histograms and Tk variable
+    write counts.
+
+    Attributes:
+        histograms (dict): Histogram of every wrapped callback, by name.
+        writes (int): Number of writes to the counted Tk variables so far.
+    """
+
+    def __init__(self):
+        """
+        Initialize the CallbackProfiler class.
+
+        Returns:
+            None
+        """
+        self.histograms = {}
+        self.writes = 0
+
+    def wrap(self, name, callback):
+        """
+        Return callback wrapped to record its latency under name.
+
+        Callbacks wrapped with the same name share their histogram.
+
+        Args:
+            name (str): Name of the histogram.
+            callback (callable): The callback to wrap.
+
+        Returns:
+            callable: The wrapped callback.
+        """
+        histogram = self.histograms.setdefault(name, Histogram())
+        clock = time.perf_counter_ns
+
+        @functools.wraps(callback)
+        def wrapper(*args, **kwargs):
+            writes = self.writes
+            start = clock()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                histogram.record(clock() - start, self.writes - writes)
+
+        return wrapper
+
+    def count_writes(self, variable):
+        """
+        Count the writes to a Tk variable.
+
+        The set() method of the variable is replaced on the instance, so
+        only the given variable is affected.
+
+        Args:
+            variable (tk.Variable): The variable to count the writes of.
+
+        Returns:
+            None
+        """
+        set_value = variable.set
+
+        def set_counted(value):
+            self.writes += 1
+            return set_value(value)
+
+        variable.set = set_counted
+
+    def report(self, file=None):
+        """
+        Write a table of the collected histograms.
+
+        Args:
+            file (io.TextIOBase, optional): Stream to write to. Defaults to
+                sys.stdout.
+
+        Returns:
+            None
+        """
+        file = file or sys.stdout
+        print(f"{'callback':<16}{'calls':>8}{'mean us':>10}{'p50 us':>10}"
+              f"{'p99 us':>10}{'max us':>10}{'writes':>8}{'max/ev':>8}",
+              file=file)
+
+        for name, histogram in sorted(self.histograms.items()):
+            if not histogram.count:
+                continue
+            print(f'{name:<16}{histogram.count:>8}'
+                  f'{histogram.total_ns / histogram.count / 1e3:>10.1f}'
+                  f'{histogram.percentile(50) / 1e3:>10.1f}'
+                  f'{histogram.percentile(99) / 1e3:>10.1f}'
+                  f'{histogram.max_ns / 1e3:>10.1f}'
+                  f'{histogram.writes:>8}{histogram.max_writes:>8}',
+                  file=file)
@@ -0,0 +1,173 @@
+"""
+calc_replay module
+
+This module replays recorded keystroke logs through the calculator logic
+without opening a window.
+
+A keystroke log is a whitespace separated stream of keysyms, the same
+keysyms bound by the calculator GUI (digits, 'period', 'plus', 'minus',
+'asterisk', 'slash', 'percent', 'equal', 'Return', 'F9', 'BackSpace',
+'Escape' and 'Delete'). The log is read in fixed size chunks and processed
+by a generator pipeline, so the replay runs in constant memory even on
+multi-gigabyte logs, whether the keysyms are one per line or all on a
+single line.
+
+After every 'equal' or 'Return' keysym, the secondary and primary display
+are written as one tab separated line.
+
+Functions:
+    read_chunks: Read a text stream in fixed size chunks.
+    iter_keysyms: Split a stream of text chunks into keysyms.
+    replay: Feed keysyms to a CalcEngine and yield the displays after
+        every equal.
+    main: Command line entry point.
+
+Imports:
+    argparse: For parsing the command line arguments.
+    sys: For the standard input, output and error streams.
+    calc_engine: A custom module providing the headless CalcEngine class.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    $ printf '1 2 5 asterisk 8 Return' | python calc_replay.py -
+    125*8=	1000
+"""
+
+# Importing required modules
+import argparse
+import sys
+
+from calc_engine import CalcEngine
+
+# Number of characters read from the log at a time.
+CHUNK_SIZE = 1 << 16
+
+# Keysyms after which the displays are emitted.
+EQUAL_KEYSYMS = ('equal', 'Return')
+
+
+def read_chunks(stream, chunk_size=CHUNK_SIZE):
+    """
+    Read a text stream in fixed size chunks.
+
+    Args:
+        stream (io.TextIOBase): The stream to read.
+        chunk_size (int, optional): Number of characters per chunk.
+            Defaults to CHUNK_SIZE.
+
+    Raises:
+        ValueError: If chunk_size is less than 1.
+
+    Yields:
+        str: The next chunk of the stream.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, not {chunk_size}')
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_keysyms(chunks):
+    """
+    Split a stream of text chunks into whitespace separated keysyms.
+
+    A keysym split across two chunks is joined back, so only one partial
+    keysym is kept in memory at a time.
+
+    Args:
+        chunks (iterable): Text chunks of the log.
+
+    Yields:
+        str: The next keysym.
+    """
+    partial = ''
+    for chunk in chunks:
+        words = (partial + chunk).split()
+        # The last word may continue in the next chunk unless the chunk
+        # ends with whitespace.
+        if words and not chunk[-1].isspace():
+            partial = words.pop()
+        else:
+            partial = ''
+        yield from words
+
+    if partial:
+        yield partial
+
+
+def replay(keysyms, engine=None):
+    """
+    Feed keysyms to a CalcEngine and yield the displays after every equal.
+
+    Args:
+        keysyms (iterable): Keysyms to press.
+        engine (CalcEngine, optional): The engine to drive. Defaults to a new
+            CalcEngine.
+
+    Raises:
+        ValueError: If a keysym is not bound by the calculator.
+
+    Yields:
+        tuple: (secondary display, primary display) after every 'equal' or
+        'Return' keysym.
+    """
+    engine = engine or CalcEngine()
+    press_key = engine.press_key
+
+    for keysym in keysyms:
+        press_key(keysym)
+        if keysym in EQUAL_KEYSYMS:
+            yield engine.sec_display_text.get(), engine.pri_display_text.get()
+
+
+def main(argv=None):
+    """
+    Replay a keystroke log given on the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        int: Exit status of the program.
+    """
+    parser = argparse.ArgumentParser(
+        description='Replay a keystroke log through the calculator and print '
+                    'the secondary and primary display after every equal.')
+    parser.add_argument('log', nargs='?', default='-',
+                        help="keystroke log file, or '-' for standard input "
+                             "(default)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file, or '-' for standard output "
+                             "(default)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help='number of characters read at a time')
+    args = parser.parse_args(argv)
+
+    log = sys.stdin if args.log == '-' else open(args.log, encoding='utf-8')
+    output = (sys.stdout if args.output == '-'
+              else open(args.output, 'w', encoding='utf-8'))
+
+    try:
+        for sec_display, pri_display in replay(
+                iter_keysyms(read_chunks(log, args.chunk_size))):
+            output.write(f'{sec_display}\t{pri_display}\n')
+    except ValueError as error:
+        print(f'calc_replay: {error}', file=sys.stderr)
+        return 1
+    finally:
+        if log is not sys.stdin:
+            log.close()
+        if output is not sys.stdout:
+            output.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,754 @@
+"""
+calc_scientific module
+
+This module provides the functions of the scientific calculator: sin, cos,
+tan, natural and common logarithm, exponential, square, square root,
+reciprocal and factorial, the powers, permutations and combinations of its
+binary operators, along with the constants pi and e.
+
+The transcendental functions of Decimal numbers are computed in the current
+decimal context with a few guard digits, by short series after argument
+reduction:
+
+    - sin, cos and tan: x is reduced to r = x - n * pi/2 with |r| <= pi/4,
+      and the Taylor series of sin(r) or cos(r) is picked by the quadrant n.
+      Angles of more than REDUCTION_MARGIN integer digits beyond the
+      precision are rejected, as their reduction would need thousands of
+      digits of pi for 10 ** 9000.
+    - ln: x = m * 10 ** a with 1 <= m < 10, and ln(m) is found from its
+      float estimate g, as m * exp(-g) is within 1e-15 of 1: ln(x) =
+      g + ln(m * exp(-g)) + a * ln10.
+    - log10: ln(x) / ln10, exact for powers of ten.
+
+The constants pi, e and ln10 are computed once per precision and cached by
+constants(), so a sin() at 28 digits costs a short series instead of
+computing pi again. Exponentials, square roots and powers use the correctly
+rounded methods of Decimal, which are faster than a series in Python.
+
+Floats use the math module. Fractions are computed as Decimal in the current
+context and converted back, except for the square and the reciprocal, which
+are exact.
+
+Factorials, permutations and combinations are computed on exact ints by the
+divide and conquer products of math.factorial(), math.perm() and
+math.comb(), after their number of digits has been estimated from lgamma(),
+so an argument whose result would overflow the context is rejected at once
+instead of after minutes of multiplication. Their results are rounded to
+Decimal from their leading bits by calc_backends.int_to_decimal(), without
+converting every digit of e.g. 3000!. The last factorials computed are kept,
+so pressing n! again or undoing and redoing it costs nothing.
+
+Powers of Fractions with an integer exponent are exact, computed by squaring
+on their ints, unless the exact result would be too large to store; they are
+then computed as Decimal, as are the other powers. Decimal powers with an
+integer exponent are computed by squaring by the decimal module itself.
+
+Classes:
+    Constants: A named tuple of the constants of one precision.
+    ScientificFunction: A class representing a function of one number for
+        every numeric backend.
+
+Functions:
+    constants: Return the constants of a precision, computed once.
+    constant: Return a constant in the current decimal context.
+    sin: Sine of a Decimal in radians.
+    cos: Cosine of a Decimal in radians.
+    tan: Tangent of a Decimal in radians.
+    ln: Natural logarithm of a Decimal.
+    log10: Common logarithm of a Decimal.
+    int_factorial: Return the factorial of an int, keeping the last
+        results.
+    factorial: Factorial of a natural number of any backend.
+    perm: Number of permutations of k items out of n.
+    comb: Number of combinations of k items out of n.
+    power: Power of two numbers of any backend.
+
+Imports:
+    collections: For the Constants named tuple.
+    functools: For the cache of the constants.
+    math: For the float functions, the estimates of the logarithms and the
+      integer factorials, permutations and combinations.
+    decimal: This module provides functionality for precise arithmetic
+      operations using the Decimal data type from the decimal module.
+    fractions: For the Fraction backend.
+    calc_backends: A custom module providing the int_to_decimal() and
+      to_decimal() functions.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from decimal import Decimal
+    >>> from calc_scientific import FUNCTIONS, constant
+    >>> FUNCTIONS['sin'](constant('pi') / 6)
+    Decimal('0.5000000000000000000000000000')
+    >>> FUNCTIONS['log'](Decimal('1000'))
+    Decimal('3')
+    >>> FUNCTIONS['fact'](Decimal('3000'))
+    Decimal('4.149359603437854085556867093E+9130')
+"""
+
+# Importing required modules
+import math
+from collections import namedtuple
+from decimal import (Context, Decimal, InvalidOperation, getcontext,
+                     localcontext)
+from fractions import Fraction
+from functools import lru_cache
+
+from calc_backends import MAX_FRACTION_BITS, int_to_decimal, to_decimal
+
+# Extra digits the functions are computed with, so that their results are
+# accurate to the precision of the context they are called in.
+GUARD_DIGITS = 5
+
+# Number of precisions whose constants are cached.
+CACHE_SIZE = 32
+
+# Integer digits of the largest angle, beyond the precision of the result,
+# reduced by sin, cos and tan. Larger angles are rejected, as their
+# reduction would need pi to as many digits as the angle has.
+REDUCTION_MARGIN = 32
+
+# The precision of the reduction of an angle is raised by its integer
+# digits rounded up to a multiple of REDUCTION_STEP, so that few precisions
+# of pi are computed and cached.
+REDUCTION_STEP = 32
+
+# Number of the last factorials kept by int_factorial().
+FACTORIAL_CACHE = 16
+
+LN10 = math.log(10)
+
+Constants = namedtuple('Constants', 'pi e ln10')
+Constants.__doc__ = """
+The constants of one precision.
+
+Attributes:
+    pi (Decimal): The ratio of a circle's circumference to its diameter.
+    e (Decimal): The base of the natural logarithm.
+    ln10 (Decimal): The natural logarithm of 10.
+"""
+
+
+def _arctan_inverse(x, one):
+    """
+    Return arctan(1 / x) in fixed point.
+
+    Args:
+        x (int): The inverse of the argument, greater than 1.
+        one (int): The fixed point unit (a power of ten).
+
+    Returns:
+        int: arctan(1 / x) * one, truncated.
+    """
+    x_squared = x * x
+    power = one // x
+    total = power
+    n = 1
+    while power:
+        power //= x_squared
+        n += 2
+        total += -(power // n) if n % 4 == 3 else power // n
+    return total
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def constants(precision):
+    """
+    Return the constants of a precision, computed once.
+
+    Pi is computed with Machin's formula in integer fixed point, e and ln10
+    with the correctly rounded methods of Decimal.
+
+    Args:
+        precision (int): Number of significant digits.
+
+    Returns:
+        Constants: The constants, rounded to precision digits.
+    """
+    digits = precision + GUARD_DIGITS
+    one = 10 ** digits
+    pi = 4 * (4 * _arctan_inverse(5, one) - _arctan_inverse(239, one))
+
+    context = Context(prec=precision)
+    return Constants(context.plus(Decimal(pi).scaleb(-digits)),
+                     Decimal(1).exp(context),
+                     Decimal(10).ln(context))
+
+
+def constant(name):
+    """
+    Return a constant in the current decimal context.
+
+    Args:
+        name (str): One of 'pi', 'e' or 'ln10'.
+
+    Returns:
+        Decimal: The constant, to the precision of the context.
+    """
+    return getattr(constants(getcontext().prec), name)
+
+
+def _sin_series(r):
+    """
+    Return the Taylor series of sin(r) in the current context.
+
+    Args:
+        r (Decimal): The argument, at most pi/4 in magnitude.
+
+    Returns:
+        Decimal: sin(r).
+    """
+    r_squared = -r * r
+    term = total = r
+    n = 1
+    while True:
+        term = term * r_squared / ((n + 1) * (n + 2))
+        n += 2
+        new_total = total + term
+        if new_total == total:
+            return total
+        total = new_total
+
+
+def _cos_series(r):
+    """
+    Return the Taylor series of cos(r) in the current context.
+
+    Args:
+        r (Decimal): The argument, at most pi/4 in magnitude.
+
+    Returns:
+        Decimal: cos(r).
+    """
+    r_squared = -r * r
+    term = total = Decimal(1)
+    n = 0
+    while True:
+        term = term * r_squared / ((n + 1) * (n + 2))
+        n += 2
+        new_total = total + term
+        if new_total == total:
+            return total
+        total = new_total
+
+
+def _reduce_quadrant(x, precision):
+    """
+    Reduce an angle to r = x - n * pi/2 in the current context.
+
+    The context precision is raised by the number of integer digits of x,
+    rounded up to a multiple of REDUCTION_STEP, so the digits of r are not
+    lost to the subtraction. An r smaller than the last digit of a result
+    of precision digits below 1 is not distinguishable from zero and is
+    returned as zero, so that e.g. sin(pi) is 0 and not the rounding error
+    of pi.
+
+    Args:
+        x (Decimal): The angle in radians, finite.
+        precision (int): Precision of the result of the calling function.
+
+    Raises:
+        decimal.InvalidOperation: If x has more than precision +
+            REDUCTION_MARGIN integer digits.
+
+    Returns:
+        tuple: (r, quadrant) where |r| <= pi/4 and quadrant is n % 4.
+    """
+    digits = x.adjusted() + 1
+    if digits > precision + REDUCTION_MARGIN:
+        raise InvalidOperation(x)
+    with localcontext() as context:
+        if digits > 0:
+            context.prec += -(-digits // REDUCTION_STEP) * REDUCTION_STEP
+        half_pi = constant('pi') / 2
+        n = (x / half_pi).to_integral_value()
+        r = x - n * half_pi
+    if r.copy_abs() < Decimal(1).scaleb(min(x.adjusted(), 0) - precision + 1):
+        r = Decimal(0)
+    return +r, int(n) % 4
+
+
+def _check_finite(x):
+    """
+    Raise InvalidOperation if x is an infinity or a NaN.
+
+    Args:
+        x (Decimal): The argument.
+
+    Raises:
+        decimal.InvalidOperation: If x is not finite.
+
+    Returns:
+        None
+    """
+    if not x.is_finite():
+        raise InvalidOperation(x)
+
+
+def sin(x):
+    """
+    Return the sine of a Decimal in radians.
+
+    Args:
+        x (Decimal): The angle in radians.
+
+    Raises:
+        decimal.InvalidOperation: If x is not finite, or has more than
+            REDUCTION_MARGIN integer digits beyond the precision.
+
+    Returns:
+        Decimal: sin(x) in the current context.
+    """
+    _check_finite(x)
+    with localcontext() as context:
+        context.prec += GUARD_DIGITS
+        r, quadrant = _reduce_quadrant(x, context.prec - GUARD_DIGITS)
+        if quadrant == 0:
+            result = _sin_series(r)
+        elif quadrant == 1:
+            result = _cos_series(r)
+        elif quadrant == 2:
+            result = -_sin_series(r)
+        else:
+            result = -_cos_series(r)
+    return +result
+
+
+def cos(x):
+    """
+    Return the cosine of a Decimal in radians.
+
+    Args:
+        x (Decimal): The angle in radians.
+
+    Raises:
+        decimal.InvalidOperation: If x is not finite, or has more than
+            REDUCTION_MARGIN integer digits beyond the precision.
+
+    Returns:
+        Decimal: cos(x) in the current context.
+    """
+    _check_finite(x)
+    with localcontext() as context:
+        context.prec += GUARD_DIGITS
+        r, quadrant = _reduce_quadrant(x, context.prec - GUARD_DIGITS)
+        if quadrant == 0:
+            result = _cos_series(r)
+        elif quadrant == 1:
+            result = -_sin_series(r)
+        elif quadrant == 2:
+            result = -_cos_series(r)
+        else:
+            result = _sin_series(r)
+    return +result
+
+
+def tan(x):
+    """
+    Return the tangent of a Decimal in radians.
+
+    Args:
+        x (Decimal): The angle in radians.
+
+    Raises:
+        decimal.InvalidOperation: If x is not finite, is an odd multiple
+            of pi/2, or has more than REDUCTION_MARGIN integer digits beyond
+            the precision.
+
+    Returns:
+        Decimal: tan(x) in the current context.
+    """
+    _check_finite(x)
+    with localcontext() as context:
+        context.prec += GUARD_DIGITS
+        r, quadrant = _reduce_quadrant(x, context.prec - GUARD_DIGITS)
+        sin_r = _sin_series(r)
+        cos_r = _cos_series(r)
+        if quadrant % 2 and not sin_r:
+            raise InvalidOperation(x)
+        result = sin_r / cos_r if quadrant % 2 == 0 else -cos_r / sin_r
+    return +result
+
+
+def ln(x):
+    """
+    Return the natural logarithm of a Decimal.
+
+    Args:
+        x (Decimal): The argument.
+
+    Raises:
+        decimal.InvalidOperation: If x is not positive or not finite.
+
+    Returns:
+        Decimal: ln(x) in the current context.
+    """
+    if x <= 0 or not x.is_finite():
+        raise InvalidOperation(x)
+
+    with localcontext() as context:
+        context.prec += GUARD_DIGITS
+        adjusted = x.adjusted()
+        mantissa = x.scaleb(-adjusted)
+        estimate = Decimal(math.log(mantissa))
+
+        # t is within 1e-15 of 0, so a few terms of ln(1 + t) are enough.
+        t = mantissa * (-estimate).exp() - 1
+        power = t
+        total = t
+        n = 1
+        while True:
+            n += 1
+            power *= -t
+            new_total = total + power / n
+            if new_total == total:
+                break
+            total = new_total
+
+        result = estimate + total
+        if adjusted:
+            result += adjusted * constant('ln10')
+    return +result
+
+
+def log10(x):
+    """
+    Return the common logarithm of a Decimal.
+
+    Args:
+        x (Decimal): The argument.
+
+    Raises:
+        decimal.InvalidOperation: If x is not positive or not finite.
+
+    Returns:
+        Decimal: log10(x) in the current context, exact for powers of ten.
+    """
+    if x > 0 and x.is_finite() and x.scaleb(-x.adjusted()) == 1:
+        return Decimal(x.adjusted())
+
+    with localcontext() as context:
+        context.prec += GUARD_DIGITS
+        result = ln(x) / constant('ln10')
+    return +result
+
+
+def _exp(x):
+    """
+    Return the exponential of a Decimal.
+
+    Args:
+        x (Decimal): The exponent.
+
+    Raises:
+        decimal.Overflow: If the result is above the Emax of the context.
+
+    Returns:
+        Decimal: The correctly rounded e ** x in the current context.
+    """
+    return x.exp()
+
+
+def _sqrt(x):
+    """
+    Return the square root of a Decimal.
+
+    Args:
+        x (Decimal): The argument.
+
+    Raises:
+        decimal.InvalidOperation: If x is negative.
+
+    Returns:
+        Decimal: The correctly rounded square root in the current context.
+    """
+    return x.sqrt()
+
+
+def _natural(x):
+    """
+    Return a natural number of any backend as an int.
+
+    Args:
+        x (Decimal | float | Fraction): The number.
+
+    Raises:
+        ValueError: If x is negative or not an integer.
+        OverflowError: If x is an infinity.
+
+    Returns:
+        int: The number.
+    """
+    n = int(x)
+    if x < 0 or n != x:
+        raise ValueError(f'{x} is not a natural number')
+    return n
+
+
+def _from_int(result, like):
+    """
+    Convert an int result to the number type of an argument.
+
+    Args:
+        result (int): The result.
+        like (Decimal | float | Fraction): The argument.
+
+    Raises:
+        OverflowError: If result is too large for a float.
+
+    Returns:
+        Decimal | float | Fraction: The result, rounded to the current
+        context for Decimal.
+    """
+    if isinstance(like, Decimal):
+        return int_to_decimal(result)
+    if isinstance(like, float):
+        return float(result)
+    return Fraction(result)
+
+
+def _log10_factorial(n):
+    """
+    Return an estimate of log10(n!).
+
+    Args:
+        n (int): A natural number.
+
+    Returns:
+        float: log10(n!), inf if n is too large for a float.
+    """
+    try:
+        return math.lgamma(n + 1) / LN10
+    except OverflowError:
+        return math.inf
+
+
+def _check_digits(log10_result):
+    """
+    Raise OverflowError if a result is above the Emax of the context.
+
+    Args:
+        log10_result (float): Estimate of log10 of the result.
+
+    Raises:
+        OverflowError: If the result has more than Emax + 1 integer digits.
+
+    Returns:
+        None
+    """
+    if log10_result > getcontext().Emax + 1:
+        raise OverflowError('result is too large')
+
+
+@lru_cache(maxsize=FACTORIAL_CACHE)
+def int_factorial(n):
+    """
+    Return the factorial of an int, keeping the last results.
+
+    Args:
+        n (int): A natural number.
+
+    Returns:
+        int: n!
+    """
+    return math.factorial(n)
+
+
+def factorial(x):
+    """
+    Return the factorial of a natural number of any backend.
+
+    Args:
+        x (Decimal | float | Fraction): The number.
+
+    Raises:
+        ValueError: If x is negative or not an integer.
+        OverflowError: If the result overflows the context or a float.
+
+    Returns:
+        Decimal | float | Fraction: x!, of the type of x.
+    """
+    n = _natural(x)
+    _check_digits(_log10_factorial(n))
+    return _from_int(int_factorial(n), x)
+
+
+def perm(n, k):
+    """
+    Return the number of permutations of k items out of n.
+
+    Args:
+        n (Decimal | float | Fraction): Number of items, a natural number.
+        k (Decimal | float | Fraction): Number of items picked, a natural
+            number.
+
+    Raises:
+        ValueError: If n or k is negative or not an integer.
+        OverflowError: If the result overflows the context or a float.
+
+    Returns:
+        Decimal | float | Fraction: n! / (n - k)!, 0 if k > n, of the type
+        of n.
+    """
+    n_int, k_int = _natural(n), _natural(k)
+    if 0 < k_int <= n_int:
+        # Every factor is at least n - k + 1, the lgamma estimate is lost
+        # to cancellation when k is much smaller than n.
+        _check_digits(max(k_int * math.log10(n_int - k_int + 1),
+                          _log10_factorial(n_int)
+                          - _log10_factorial(n_int - k_int)))
+    return _from_int(math.perm(n_int, k_int), n)
+
+
+def comb(n, k):
+    """
+    Return the number of combinations of k items out of n.
+
+    Args:
+        n (Decimal | float | Fraction): Number of items, a natural number.
+        k (Decimal | float | Fraction): Number of items picked, a natural
+            number.
+
+    Raises:
+        ValueError: If n or k is negative or not an integer.
+        OverflowError: If the result overflows the context or a float.
+
+    Returns:
+        Decimal | float | Fraction: n! / (k! * (n - k)!), 0 if k > n, of
+        the type of n.
+    """
+    n_int, k_int = _natural(n), _natural(k)
+    smaller = min(k_int, n_int - k_int)
+    if smaller > 0:
+        # The result is at least (n / smaller) ** smaller.
+        _check_digits(max(smaller * (math.log10(n_int)
+                                     - math.log10(smaller)),
+                          _log10_factorial(n_int)
+                          - _log10_factorial(k_int)
+                          - _log10_factorial(n_int - k_int)))
+    return _from_int(math.comb(n_int, k_int), n)
+
+
+def power(base, exponent):
+    """
+    Return the power of two numbers of any backend.
+
+    Fractions with an integer exponent are raised exactly unless the
+    numerator or denominator of the result would have more than
+    MAX_FRACTION_BITS bits, which would take long to compute for an
+    exponent like 10 ** 9. Their other powers are computed as Decimal in
+    the current context. The other types, arrays included, use their **
+    operator.
+
+    Args:
+        base (Decimal | float | Fraction | numpy.ndarray): The base.
+        exponent (Decimal | float | Fraction | numpy.ndarray): The exponent.
+
+    Raises:
+        ZeroDivisionError: For a negative power of zero.
+        decimal.InvalidOperation: For a non-integer power of a negative
+            number.
+        decimal.Overflow: If a Decimal result overflows.
+        OverflowError: If a float result overflows.
+
+    Returns:
+        Decimal | float | Fraction | numpy.ndarray: base ** exponent.
+    """
+    if not isinstance(base, Fraction):
+        return base ** exponent
+    if (exponent.denominator == 1 and abs(exponent) * max(
+            base.numerator.bit_length(), base.denominator.bit_length())
+            <= MAX_FRACTION_BITS):
+        return base ** exponent.numerator
+    if not base:
+        # Not computed as Decimal, which raises InvalidOperation for 0 ** 0.
+        return Fraction(base ** exponent)
+    return Fraction(to_decimal(base) ** to_decimal(exponent))
+
+
+class ScientificFunction:
+    """
+    A class representing a function of one number for every numeric
+    backend.
+
+    Attributes:
+        name (str): Name of the function, also its operator in the history.
+        symbol (str): Symbol shown in the secondary display, before the
+            argument in parentheses.
+        decimal (function): The function of Decimal numbers, also used for
+            Fractions unless exact is given.
+        real (function): The function of floats.
+        exact (function): Function working on every number type with
+            Python operators, or None.
+    """
+
+    __slots__ = ('name', 'symbol', 'decimal', 'real', 'exact')
+
+    def __init__(self, name, symbol, decimal=None, real=None, exact=None):
+        """
+        Initialize the ScientificFunction class.
+
+        Args:
+            name (str): Name of the function.
+            symbol (str): Symbol of the function.
+            decimal (function, optional): The function of Decimal numbers.
+                Defaults to exact.
+            real (function, optional): The function of floats. Defaults to
+                exact.
+            exact (function, optional): Function working on every number
+                type. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.symbol = symbol
+        self.decimal = decimal or exact
+        self.real = real or exact
+        self.exact = exact
+
+    def __call__(self, value):
+        """
+        Apply the function in the current decimal context.
+
+        Args:
+            value (Decimal | float | Fraction): The argument.
+
+        Raises:
+            ValueError: If a float is out of the domain of the function.
+            decimal.InvalidOperation: If a Decimal or Fraction is out of the
+                domain of the function.
+            ZeroDivisionError: For the reciprocal of zero.
+            OverflowError: If a float result overflows.
+            decimal.Overflow: If a Decimal result overflows.
+
+        Returns:
+            Decimal | float | Fraction: The result, of the type of value.
+        """
+        if isinstance(value, Decimal):
+            return self.decimal(value)
+        if isinstance(value, float):
+            return self.real(value)
+        if self.exact is not None:
+            return self.exact(value)
+        return Fraction(self.decimal(to_decimal(value)))
+
+
+# Functions of the scientific calculator by name.
+FUNCTIONS = {
+    'sin': ScientificFunction('sin', 'sin', sin, math.sin),
+    'cos': ScientificFunction('cos', 'cos', cos, math.cos),
+    'tan': ScientificFunction('tan', 'tan', tan, math.tan),
+    'ln': ScientificFunction('ln', 'ln', ln, math.log),
+    'log': ScientificFunction('log', 'log', log10, math.log10),
+    'exp': ScientificFunction('exp', 'exp', _exp, math.exp),
+    'sqr': ScientificFunction('sqr', 'sqr', exact=lambda x: x * x),
+    'sqrt': ScientificFunction('sqrt', '√', _sqrt, math.sqrt),
+    'inv': ScientificFunction('inv', '1/', exact=lambda x: 1 / x),
+    'fact': ScientificFunction('fact', 'fact', exact=factorial),
+}
+
+# Errors of the functions for arguments out of their domain.
+DOMAIN_ERRORS = (ValueError, InvalidOperation)
@@ -0,0 +1,369 @@
+"""
+calc_server module
+
+This module provides a local calculation server exposing the calculator
+logic through a JSON-lines protocol over asyncio streams.
+
+The server listens on a Unix socket or on a localhost TCP port and keeps a
+pool of headless CalcEngine sessions. Each request is a JSON object on its
+own line and gets exactly one JSON response line, in the same order as the
+requests of the connection, so clients can pipeline requests without
+waiting for the responses.
+
+Requests:
+    - {"id": 1, "keys": ["1", "plus", "2", "Return"]}: Press keysyms (see
+      CalcEngine.press_key()) on an engine and return its displays. With an
+      optional "session" name, the engine keeps its state across requests
+      of any connection, otherwise a fresh engine is used.
+    - {"id": 2, "expr": "12.5*(3+4)%"}: Evaluate an expression (see
+      calc_expression module).
+
+Responses:
+    - {"id": 1, "pri": "3", "sec": "1+2="} for keystroke requests.
+    - {"id": 2, "result": "0.875"} for expression requests.
+    - {"id": 3, "error": "..."} when the request is not valid. Request
+      lines longer than MAX_LINE bytes are answered with an error whose id
+      is null.
+
+Classes:
+    SessionPool: A pool of headless CalcEngine sessions.
+    CalcServer: The asyncio JSON-lines calculation server.
+
+Functions:
+    main: Command line entry point.
+
+Imports:
+    argparse: For parsing the command line arguments.
+    asyncio: For the streams based server.
+    json: For encoding and decoding the JSON-lines protocol.
+    collections: For the LRU order of the named sessions.
+    calc_engine: A custom module providing the headless CalcEngine class.
+    calc_expression: A custom module providing the expression evaluator.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    $ python calc_server.py --port 8765
+    $ python calc_server.py --unix /tmp/calc.sock
+"""
+
+# Importing required modules
+import argparse
+import asyncio
+import json
+from collections import OrderedDict
+
+from calc_engine import CalcEngine
+from calc_expression import evaluate
+
+# Default TCP port of the server.
+DEFAULT_PORT = 8765
+
+# Maximum number of named sessions kept alive by the pool.
+MAX_SESSIONS = 1024
+
+# Maximum length in bytes of a request line. Longer lines are skipped and
+# answered with an error response.
+MAX_LINE = 1 << 20
+
+# Output buffer size after which the server waits for the client to read
+# the responses.
+HIGH_WATER_MARK = 1 << 16
+
+# Errors of a request answered with an 'error' response: malformed keys or
+# expressions, arithmetic errors and expressions nested too deeply.
+REQUEST_ERRORS = (TypeError, ValueError, ArithmeticError, RecursionError)
+
+
+async def _read_line(reader):
+    """
+    Read a request line of at most MAX_LINE bytes.
+
+    Args:
+        reader (asyncio.StreamReader): Reader of the connection, with a
+            limit of MAX_LINE bytes.
+
+    Raises:
+        ValueError: If the line is longer than MAX_LINE bytes. The line is
+            skipped, so the next request can be read.
+
+    Returns:
+        bytes: The line, or the data left before the end of the stream
+        (b'' once it is exhausted).
+    """
+    try:
+        return await reader.readuntil(b'\n')
+    except asyncio.IncompleteReadError as error:
+        return error.partial
+    except asyncio.LimitOverrunError as error:
+        consumed = error.consumed
+
+    # Skip the rest of the line, a buffer full at a time.
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b'\n')
+            break
+        except asyncio.IncompleteReadError:
+            break
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+
+    raise ValueError(f'Request line is longer than {MAX_LINE} bytes.')
+
+
+class SessionPool:
+    """
+    A pool of headless CalcEngine sessions.
+
+    Named sessions keep their state across requests and are evicted in
+    least recently used order once there are more than max_sessions of
+    them. Anonymous requests borrow an engine from the free list, and every
+    engine is cleared before it goes back to the free list.
+
+    Attributes:
+        max_sessions (int): Maximum number of named sessions.
+        sessions (OrderedDict): Named sessions in least recently used order.
+        free (list): Cleared engines ready to be reused.
+    """
+
+    def __init__(self, max_sessions=MAX_SESSIONS):
+        """
+        Initialize the SessionPool class.
+
+        Args:
+            max_sessions (int, optional): Maximum number of named sessions.
+                Defaults to MAX_SESSIONS.
+
+        Returns:
+            None
+        """
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()
+        self.free = []
+
+    def acquire(self, session=None):
+        """
+        Return the engine of a named session, or a cleared engine.
+
+        Args:
+            session (str, optional): Name of the session. Defaults to None.
+
+        Returns:
+            CalcEngine: The engine to use for the request.
+        """
+        if session is not None and session in self.sessions:
+            self.sessions.move_to_end(session)
+            return self.sessions[session]
+
+        engine = self.free.pop() if self.free else CalcEngine()
+
+        if session is not None:
+            self.sessions[session] = engine
+            if len(self.sessions) > self.max_sessions:
+                _, evicted = self.sessions.popitem(last=False)
+                self.release(evicted)
+
+        return engine
+
+    def release(self, engine, session=None):
+        """
+        Return an engine to the pool.
+
+        Engines of named sessions stay with their session, other engines are
+        reset, along with their undo and redo stacks, and put on the free
+        list, so no state of a request reaches the next one.
+
+        Args:
+            engine (CalcEngine): The engine returned by acquire().
+            session (str, optional): Name of the session. Defaults to None.
+
+        Returns:
+            None
+        """
+        if session is None:
+            engine.reset()
+            self.free.append(engine)
+
+
+class CalcServer:
+    """
+    The asyncio JSON-lines calculation server.
+
+    Attributes:
+        pool (SessionPool): Pool of engine sessions shared by all
+            connections.
+        server (asyncio.Server): The listening server once started.
+    """
+
+    def __init__(self, pool=None):
+        """
+        Initialize the CalcServer class.
+
+        Args:
+            pool (SessionPool, optional): Pool of engine sessions. Defaults to
+                a new SessionPool.
+
+        Returns:
+            None
+        """
+        self.pool = pool or SessionPool()
+        self.server = None
+
+    def handle_request(self, request):
+        """
+        Handle one decoded request and return its response.
+
+        Args:
+            request (dict): The decoded request.
+
+        Note:
+            Errors of the request (REQUEST_ERRORS) are answered with an
+            'error' response, so they do not close the connection.
+
+        Returns:
+            dict: The response.
+        """
+        response = {'id': request.get('id')}
+
+        try:
+            if 'expr' in request:
+                response['result'] = evaluate(str(request['expr']))
+            elif 'keys' in request:
+                session = request.get('session')
+                engine = self.pool.acquire(session)
+                try:
+                    for keysym in request['keys']:
+                        engine.press_key(keysym)
+                    response['pri'] = engine.pri_display_text.get()
+                    response['sec'] = engine.sec_display_text.get()
+                finally:
+                    self.pool.release(engine, session)
+            else:
+                response['error'] = "Request needs 'keys' or 'expr'."
+        except REQUEST_ERRORS as error:
+            response['error'] = str(error) or type(error).__name__
+
+        return response
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve the pipelined requests of one connection.
+
+        Args:
+            reader (asyncio.StreamReader): Reader of the connection.
+            writer (asyncio.StreamWriter): Writer of the connection.
+
+        Returns:
+            None
+        """
+        try:
+            while True:
+                try:
+                    line = await _read_line(reader)
+                    if not line:
+                        break
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError('Request must be a JSON object.')
+                    response = self.handle_request(request)
+                except (ValueError, RecursionError) as error:
+                    # ValueError: line too long or not a JSON object.
+                    # RecursionError: JSON nested too deeply to decode.
+                    response = {'id': None, 'error': str(error)}
+
+                writer.write(json.dumps(response).encode() + b'\n')
+                # Only wait for the client when the responses pile up, so
+                # pipelined requests are answered without a round trip each.
+                if writer.transport.get_write_buffer_size() > HIGH_WATER_MARK:
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT, path=None):
+        """
+        Start listening on a Unix socket or a TCP port.
+
+        Args:
+            host (str, optional): Host of the TCP server. Defaults to
+                '127.0.0.1'.
+            port (int, optional): TCP port, 0 for any free port. Defaults to
+                DEFAULT_PORT.
+            path (str, optional): Path of the Unix socket. If given, host and
+                port are ignored. Defaults to None.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        if path is not None:
+            self.server = await asyncio.start_unix_server(
+                self.handle_connection, path=path, limit=MAX_LINE)
+        else:
+            self.server = await asyncio.start_server(
+                self.handle_connection, host=host, port=port, limit=MAX_LINE)
+
+        return self.server
+
+    async def close(self):
+        """
+        Stop listening and wait for the server to close.
+
+        Returns:
+            None
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+
+async def serve(host, port, path):
+    """
+    Run the server until it is cancelled.
+
+    Args:
+        host (str): Host of the TCP server.
+        port (int): TCP port.
+        path (str): Path of the Unix socket, or None for TCP.
+
+    Returns:
+        None
+    """
+    server = await CalcServer().start(host, port, path)
+    print(f"calc_server: listening on {path or f'{host}:{port}'}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """
+    Run the calculation server given on the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description='Serve the calculator logic over a JSON-lines protocol.')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='TCP host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'TCP port (default: {DEFAULT_PORT})')
+    parser.add_argument('--unix', metavar='PATH',
+                        help='listen on a Unix socket instead of TCP')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+calc_worker module
+
+This module runs the slow calculations of the calculator in a worker
+process, off the Tk main loop.
+
+A BackgroundJob starts a process running a function, and polls for its
+result with window.after(), so the window keeps handling its events while
+the function runs. The result (or the exception raised) is sent back
+through a pipe and handed to a callback on the main loop. Unlike a thread,
+whose C level big number arithmetic would hold the GIL and freeze the
+window anyway, the process runs in parallel and can be killed, so a job is
+cancelled at once whatever it is computing.
+
+Every job starts its own process, which costs a few milliseconds, so only
+operations estimated to take longer than that are run as jobs (see
+CalcEngine.is_slow() of calc_engine module).
+
+Classes:
+    BackgroundJob: A function running in a worker process, polled from the
+        Tk main loop.
+
+Imports:
+    multiprocessing: For the worker process and the pipe of its result.
+
+Author:
+    Ashish Kumar (ashish.bmistry@gmail.com)
+
+Example:
+    >>> from calc_engine import value_to_text
+    >>> from calc_worker import BackgroundJob
+    >>> job = BackgroundJob(window, value_to_text, (huge_fraction,),
+    ...                     on_done=calc.set_clipboard)
+    >>> job.cancel()
+"""
+
+# Importing required modules
+import multiprocessing
+
+# Milliseconds between the checks of a running job.
+POLL_MS = 20
+
+
+def _run(connection, function, args):
+    """
+    Run a function and send its outcome, in the worker process.
+
+    Args:
+        connection (multiprocessing.connection.Connection): Pipe to the main
+            process.
+        function (function): The function, defined at module level.
+        args (tuple): Arguments of the function.
+
+    Returns:
+        None
+    """
+    try:
+        outcome = (True, function(*args))
+    except Exception as error:    # Re-raised in the main process.
+        outcome = (False, error)
+    connection.send(outcome)
+    connection.close()
+
+
+class BackgroundJob:
+    """
+    A function running in a worker process, polled from the Tk main loop.
+
+    Attributes:
+        window (tk.Misc): Widget whose after() polls the job.
+        on_done (function): Called with the result of the function.
+        on_error (function): Called with the exception raised by the
+            function, or with None if the process died without a result.
+        process (multiprocessing.Process): The worker process.
+        connection (multiprocessing.connection.Connection): Pipe of the
+            result.
+        pending (str): Id of the scheduled poll(), or None once the job is
+            over.
+    """
+
+    def __init__(self, window, function, args, on_done, on_error=None):
+        """
+        Initialize the BackgroundJob class and start the worker process.
+
+        Args:
+            window (tk.Misc): Widget whose after() polls the job.
+            function (function): The function to run, defined at module
+                level so that it can be started with every start method of
+                multiprocessing.
+            args (tuple): Arguments of the function, which must be
+                picklable.
+            on_done (function): Called with the result of the function.
+            on_error (function, optional): Called with the exception raised
+                by the function, or None if the process died without a
+                result. Defaults to None, which ignores errors.
+
+        Returns:
+            None
+        """
+        self.window = window
+        self.on_done = on_done
+        self.on_error = on_error
+        self.connection, child_connection = multiprocessing.Pipe(
+            duplex=False)
+        self.process = multiprocessing.Process(
+            target=_run, args=(child_connection, function, args), daemon=True)
+        self.process.start()
+        # Only the worker writes to the pipe.
+        child_connection.close()
+        self.pending = window.after(POLL_MS, self.poll)
+
+    @property
+    def running(self):
+        """
+        bool: True until the job is over, done or cancelled.
+        """
+        return self.pending is not None
+
+    def poll(self):
+        """
+        Hand the outcome of the job to its callback once it has arrived.
+
+        The outcome is read as soon as it is available, as the worker
+        process waits for a large result to be read before exiting.
+
+        Returns:
+            None
+        """
+        ready = self.connection.poll()
+        if not ready:
+            if self.process.is_alive():
+                self.pending = self.window.after(POLL_MS, self.poll)
+                return None
+            # The worker may have sent its outcome and exited between the
+            # two checks, so the pipe is polled once more.
+            ready = self.connection.poll()
+
+        success, value = False, None
+        if ready:
+            try:
+                success, value = self.connection.recv()
+            except EOFError:
+                pass
+
+        self.pending = None
+        self.connection.close()
+        self.process.join()
+        if success:
+            self.on_done(value)
+        elif self.on_error is not None:
+            self.on_error(value)
+
+    def cancel(self):
+        """
+        Kill the worker process. The callbacks are not called.
+
+        Returns:
+            None
+        """
+        if self.pending is None:
+            return None
+        self.window.after_cancel(self.pending)
+        self.pending = None
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
@@ -13,11 +13,27 @@ Classes:
     ScientificCalc: A class representing a scientific calculator that performs
         scientific operations.
 
+Functions:
+    parse_args: Parse the command line arguments.
+
 Imports:
+    time: For the startup timing breakdown.
+    sys: For the command line arguments and the report stream.
     tkinter: For creating the GUI components for the calculator application.
-    tkinter.messagebox: For creating messagebox model dialog window.
     calc_operations: A custom module providing additional methods for
         arithmetic operations for the calculator.
+    calc_icon: A custom module providing the embedded window icon.
+
+    Modules needed only by rarely used features are imported when the
+    feature is first used, to keep the time to the first keystroke short:
+        - tkinter.messagebox: For the About and Quit dialogs.
+        - argparse: For parsing command line arguments, if any are given.
+        - calc_profiler: For the optional callback latency instrumentation.
+        - calc_history: For the history tape, when the application is run
+          as a script.
+        - calc_history_panel: For the history search panel.
+        - calc_number_panel: For the number theory panel.
+        - calc_backends: For the decimal context of the --precision option.
 
 Author:
     Ashish Kumar (ashish.bmistry@gmail.com)
@@ -26,13 +42,25 @@ Example:
     >>> from calculator import Calculator
     >>> calc = Calculator()
     >>> calc.window.mainloop()
+
+    $ python calculator.py --profile
+    $ python calculator.py --startup-time
+    $ python calculator.py --history /tmp/calc_history
+    $ python calculator.py --precision 2000
 """
 
 # Importing required modules
+import sys
+import time
+
+# Taken before the heavier imports below, so that the startup report
+# includes the time spent importing tkinter and the calculator modules.
+IMPORT_START = time.perf_counter()
+
 import tkinter as tk
-from tkinter import messagebox
 
-from calc_operations import CalcOperations
+from calc_icon import ICON_DATA
+from calc_operations import CLICK_TAG, CalcOperations
 
 
 class Calculator(CalcOperations):
@@ -74,6 +102,19 @@ class Calculator(CalcOperations):
         stick (str): Sticky parameter for grid layout.
         calc_type (StandardCalc | ScientificCalc): Stores instance of
             either StandardCalc or ScientificCalc class.
+        keypads (dict): The (frame, calc_type, buttons_dict, error_styles)
+            of every keypad built so far, by StandardCalc or ScientificCalc
+            class.
+        profiler (CallbackProfiler): Profiler of the callbacks, or None when
+            profiling is disabled.
+        key_wrappers (dict): press_key() of the engine wrapped by the
+            profiler for every keysym pressed so far, by keysym.
+        history_index (HistoryIndex): Search index of the history, built
+            when the history panel is first opened, or None.
+        history_panel (HistoryPanel): The open history panel, or None.
+        number_panel (NumberPanel): The open number theory panel, or None.
+        startup_times (list): (phase, time.perf_counter()) at the end of
+            every startup phase, in order.
 
     Note:
         - Calculator class inherits attributes and methods from its parent
@@ -84,7 +125,8 @@ class Calculator(CalcOperations):
           itself with additional attributes and methods of component class.
     """
 
-    def __init__(self, calc_type):
+    def __init__(self, calc_type, profiler=None, backend=None, history=None,
+                 context=None):
         """
         Initialize the Calculator class.
 
@@ -92,12 +134,24 @@ class Calculator(CalcOperations):
         to create the calculator.
 
         Args:
-            calc_types (StandardCalc | ScientificCalc): An instance of either
-                StandardCalc or ScientificCalc class.
+            calc_type (type): Either StandardCalc or ScientificCalc class,
+                the type of calculator shown first.
+            profiler (CallbackProfiler, optional): If given, the callbacks of
+                btn_callbacks are wrapped to record their latency and the
+                display writes they make. Defaults to None, which binds the
+                callbacks unwrapped.
+            backend (str, optional): Numeric backend of the calculations,
+                one of 'float', 'decimal' or 'fraction'. Defaults to
+                'decimal'.
+            history (History, optional): History tape the completed
+                calculations are appended to. Defaults to None.
+            context (decimal.Context, optional): Decimal context of the
+                calculations. Defaults to calc_backends.make_context().
 
         Returns:
             None
         """
+        self.startup_times = [('imports', time.perf_counter())]
         self.app_name = 'Calculator'
         self.app_ver = 1.0
         self.app_copyright = 'Copyright 2024 © Ashish Kumar'
@@ -108,14 +162,41 @@ class Calculator(CalcOperations):
         self.win_padx = 20
         self.win_pady = 20
         self.win_bg_color = '#ECEFFB'
+        self.profiler = profiler
+        self.key_wrappers = {}
 
         # Calling create_main_window create the main window.
         self.create_main_window()
+        self.startup_times.append(('window', time.perf_counter()))
         # Calling create_menu create the menu.
         self.create_menu()
+        self.startup_times.append(('menu', time.perf_counter()))
 
         # Calling CalcOperations's __init__() to inherit its properties.
-        super().__init__()
+        super().__init__(backend, context)
+        self.history = history
+        self.history_index = None
+        self.history_panel = None
+        self.number_panel = None
+
+        # Wrap the callbacks before any of them is bound, so that both
+        # buttons and keys go through the profiler.
+        if self.profiler is not None:
+            self.btn_callbacks = {
+                btn_text: self.profiler.wrap(callback.__name__, callback)
+                for btn_text, callback in self.btn_callbacks.items()}
+            # The display labels are written by the render scheduler, so
+            # the writes are counted under 'render'.
+            self.render.flush = self.profiler.wrap('render',
+                                                   self.render.flush)
+            # Keyboard events and pasted text are pressed in batches, each
+            # key recording its latency by press_key(), and each batch as a
+            # whole under 'drain_input'.
+            self.drain_input = self.profiler.wrap('drain_input',
+                                                  self.drain_input)
+            self.profiler.count_writes(self.pri_display_var)
+            self.profiler.count_writes(self.sec_display_var)
+        self.startup_times.append(('engine', time.perf_counter()))
 
         self.display_bg = '#FFFFFF'
         self.pri_display_font = ('Courier New', '28', 'bold')
@@ -134,27 +215,15 @@ class Calculator(CalcOperations):
 
         # Calling create_display create the calculator display.
         self.create_display()
-        # Calling create_frame to create a frame for developer_label and
-        # buttons placement.
-        self.create_frame()
-        # Calling create_developer_label create the developer_label.
-        self.create_developer_label()
-
-        # calc_type stores object of either StandardCalc or ScientificCalc
-        # class. By default, it stores StandardCalc class object as it is
-        # the default calculator when the application start. If user selects
-        # Scientific Calculator option from File menu, value of calc_type
-        # will be replaced by ScientificCalc class object.
-        self.calc_type = calc_type()
-        # Calling create_button create calculator buttons.
-        self.create_buttons()
-        # Both standard and scientific calculator has differnt types of buttons
-        # and buttons layout, so button placement is done by place_buttons
-        # method of respective class. Note: self (reference to Calculator
-        # instance) argument passed into place_buttons() definition is to
-        # access its attributes inside place_buttons() method of eight
-        # StandardCalc or ScientificCalc class.
-        self.calc_type.place_buttons(self)
+        self.startup_times.append(('display', time.perf_counter()))
+
+        # Keypads are built the first time they are shown and kept alive, so
+        # switching between Standard and Scientific calculator only hides
+        # one frame and shows the other. Calling show_keypad builds the
+        # keypad of the calculator the application starts with.
+        self.keypads = {}
+        self.show_keypad(calc_type)
+        self.startup_times.append(('buttons', time.perf_counter()))
 
     def create_main_window(self):
         """
@@ -173,9 +242,11 @@ class Calculator(CalcOperations):
         self.window.config(padx=self.win_padx,
                            pady=self.win_padx,
                            bg=self.win_bg_color)
-        # Set non-default icon to the window.
+        # Set non-default icon to the window. The icon is embedded in
+        # calc_icon module, so it is found whatever the working directory is
+        # and no file is read from disk.
         self.window.tk.call('wm', 'iconphoto', self.window._w,
-                            tk.PhotoImage(file='.\\static\\calc_fevicon.png'))
+                            tk.PhotoImage(data=ICON_DATA))
 
     def create_menu(self):
         """
@@ -189,6 +260,7 @@ class Calculator(CalcOperations):
                 - main_menu (tk.Menu): The main menu bar of the calculator
                   window.
                 - sub_menu_file (tk.Menu): The submenu under the 'File' menu.
+                - sub_menu_edit (tk.Menu): The submenu under the 'Edit' menu.
             - These variables are used internally within the method and are
               not exposed to the method's caller.
 
@@ -202,6 +274,10 @@ class Calculator(CalcOperations):
                     Callback function for the 'Quit' menu option.
                 - about_app(self):
                     Callback function for the 'About' menu option.
+                - do_paste(self, event=None):
+                    Callback function for the 'Paste' menu option.
+                - show_history(self, event=None):
+                    Callback function for the 'History' menu option.
 
         Returns:
             None
@@ -229,11 +305,68 @@ class Calculator(CalcOperations):
         self.window.bind('<Control-Q>', self.are_you_sure)
         self.window.bind('<Control-q>', self.are_you_sure)
 
+        # Adding Edit menu to undo and redo keystrokes and to paste numbers
+        # and operation sequences. Undo and redo are queued like the other
+        # keys, so they apply after the keys typed before them.
+        sub_menu_edit = tk.Menu(main_menu, tearoff=0)
+        main_menu.add_cascade(label='Edit', menu=sub_menu_edit, underline=0)
+        sub_menu_edit.add_command(label='Undo',
+                                  command=lambda: self.queue_keys(['undo']),
+                                  underline=0,
+                                  accelerator='Ctrl-Z')
+        sub_menu_edit.add_command(label='Redo',
+                                  command=lambda: self.queue_keys(['redo']),
+                                  underline=0,
+                                  accelerator='Ctrl-Y')
+        # Bind Ctr-Z, Ctr-z, Ctr-Y and Ctr-y event to the undo and redo
+        # keysyms of the engine.
+        for sequence, keysym in (('<Control-Z>', 'undo'),
+                                 ('<Control-z>', 'undo'),
+                                 ('<Control-Y>', 'redo'),
+                                 ('<Control-y>', 'redo')):
+            self.window.bind(sequence, lambda event, keysym=keysym:
+                             self.queue_keys([keysym]))
+        sub_menu_edit.add_separator()    # Add line separator.
+        sub_menu_edit.add_command(label='Copy',
+                                  command=self.do_copy,
+                                  underline=0,
+                                  accelerator='Ctrl-C')
+        # Bind Ctr-C and Ctr-c event to the specified callback.
+        self.window.bind('<Control-C>', self.do_copy)
+        self.window.bind('<Control-c>', self.do_copy)
+        sub_menu_edit.add_command(label='Paste',
+                                  command=self.do_paste,
+                                  underline=0,
+                                  accelerator='Ctrl-V')
+        # Bind Ctr-V and Ctr-v event to the specified callback.
+        self.window.bind('<Control-V>', self.do_paste)
+        self.window.bind('<Control-v>', self.do_paste)
+        sub_menu_edit.add_command(label='History',
+                                  command=self.show_history,
+                                  underline=0,
+                                  accelerator='Ctrl-H')
+        # Bind Ctr-H and Ctr-h event to the specified callback.
+        self.window.bind('<Control-H>', self.show_history)
+        self.window.bind('<Control-h>', self.show_history)
+        sub_menu_edit.add_command(label='Number theory',
+                                  command=self.show_number_theory,
+                                  underline=0,
+                                  accelerator='Ctrl-T')
+        # Bind Ctr-T and Ctr-t event to the specified callback.
+        self.window.bind('<Control-T>', self.show_number_theory)
+        self.window.bind('<Control-t>', self.show_number_theory)
+
         # Adding options to the main menu bar with callback.
         main_menu.add_command(label='About',
                               command=self.about_app,
                               underline=0)
 
+        # Adding the profile report option only when profiling is enabled.
+        if self.profiler is not None:
+            main_menu.add_command(label='Profile',
+                                  command=self.profiler.report,
+                                  underline=0)
+
     def create_display(self):
         """
         Create the primary and secondary display for the calculator.
@@ -255,14 +388,14 @@ class Calculator(CalcOperations):
         secondary_display = tk.Label(master=self.window,
                                      width=self.sec_display_width,
                                      font=self.sec_display_font,
-                                     textvariable=self.sec_display_text,
+                                     textvariable=self.sec_display_var,
                                      anchor='e',
                                      bg=self.display_bg,
                                      padx=4)
         primary_display = tk.Label(master=self.window,
                                    width=self.pri_display_width,
                                    font=self.pri_display_font,
-                                   textvariable=self.pri_display_text,
+                                   textvariable=self.pri_display_var,
                                    anchor='e',
                                    bg=self.display_bg)
 
@@ -323,21 +456,18 @@ class Calculator(CalcOperations):
 
         Note:
             - This method utilizes the following locally declared variables:
-                - btn_bg_color (str): background color for buttons.
-                - btn_font (tuple): Font for buttons.
-                - btn (tk.Button): Button widget object.
                 - btn_text (str): A string representing button's text accessed
                   from btn_callbacks dictionary inherited from CalcOperations
                   class of calc_operations module.
-                - callback (str): Name reference to the callback function for
-                  each button respectively. It is accessed from btn_callbacks
-                  dictionary inherited from CalcOperations class of
-                  calc_operations module.
             - These variables are used internally within the method and are
               not exposed to the method's caller.
 
         Note:
-            - This method implements callback binding for the following
+            - The buttons are created by create_button(), the buttons of the
+              scientific calculator by create_buttons() of ScientificCalc
+              class.
+            - The mouse clicks of the buttons are bound through the CLICK_TAG
+              binding tag to dispatch_click(), which calls the following
               callbacks implemented in CalcOperations class of module
               calc_operations:
                 - do_backspace(self, event=None): Handle Backspace button
@@ -365,6 +495,10 @@ class Calculator(CalcOperations):
                   button press event.
                 - do_digit_x(self, event=None): Handle Digit buttons (1-9)
                   press event.
+                - do_sin, do_cos, do_tan, do_ln, do_log, do_exp, do_square,
+                  do_sqrt, do_reciprocal, do_power, do_pi and do_e (self,
+                  event=None): Handle the buttons of the scientific
+                  calculator.
 
         Returns:
             None
@@ -373,47 +507,179 @@ class Calculator(CalcOperations):
         # or scientific calculator, it set buttons_dict to empty dictionary.
         self.buttons_dict = {}
 
-        # Creating button objects with specified properties.
-        for btn_text, callback in self.btn_callbacks.items():
-            if btn_text in ['1', '2', '3', '4', '5',
-                            '6', '7', '8', '9', '0']:
-                btn_bg_color = self.btn_bg
-                btn_font = self.btn_digit_font
-            elif btn_text == '.':
-                btn_bg_color = self.btn_operator_bg
-                btn_font = self.btn_digit_font
-            else:
-                btn_bg_color = self.btn_operator_bg
-                btn_font = self.btn_operator_font
-
-            btn = tk.Button(master=self.frame,
-                            text=btn_text,
-                            height=self.btn_height,
-                            width=self.btn_width,
-                            bg=btn_bg_color,
-                            activebackground=self.btn_active_bg,
-                            font=btn_font,
-                            borderwidth=self.btn_borderwidth)
-            # Bind callback to mouse left click event.
-            btn.bind('<Button-1>', callback)
-            # Bind callback to keyboard event.
-            self.window.bind(self.btn_key_events[btn_text], callback)
-
-            if btn_text == '=':
-                btn.config(bg=self.btn_equal_bg,
-                           fg=self.btn_equal_fg)
-                # Bind callback for Enter key additionally which is already
-                # assigned for <KeyPress-equal> event.
-                self.window.bind('<Return>', self.do_equal)
-
-            # Store each button object to the dictionary to access them later.
-            self.buttons_dict.update([(btn_text, btn)])
+        # Creating button objects of the standard calculator. The buttons of
+        # sci_btn_texts are left to the ScientificCalc class.
+        for btn_text in self.btn_callbacks:
+            if btn_text not in self.sci_btn_texts:
+                self.create_button(btn_text)
 
         # If type of calculator is Scientific, then create additional buttons
         # by calling create_buttons() of ScientificCalc class.
         if isinstance(self.calc_type, ScientificCalc):
             self.calc_type.create_buttons(self)
 
+        # Prepare the style switch of the buttons disabled in error state.
+        self.error_styles = self.build_error_styles()
+
+        # Bind callbacks to keyboard events of the buttons.
+        self.bind_keys()
+
+    def create_button(self, btn_text):
+        """
+        Create a button widget for the calculator.
+
+        The button is created with the style of its kind (digit, operator or
+        equal) and added to the buttons_dict dictionary.
+
+        Args:
+            btn_text (str): Text of the button, a key of btn_callbacks.
+
+        Note:
+            - This method utilizes the following locally declared variables:
+                - btn_bg_color (str): background color for buttons.
+                - btn_font (tuple): Font for buttons.
+                - btn (tk.Button): Button widget object.
+            - These variables are used internally within the method and are
+              not exposed to the method's caller.
+
+        Returns:
+            tk.Button: The button.
+        """
+        if btn_text in ['1', '2', '3', '4', '5',
+                        '6', '7', '8', '9', '0']:
+            btn_bg_color = self.btn_bg
+            btn_font = self.btn_digit_font
+        elif btn_text == '.':
+            btn_bg_color = self.btn_operator_bg
+            btn_font = self.btn_digit_font
+        else:
+            btn_bg_color = self.btn_operator_bg
+            btn_font = self.btn_operator_font
+
+        btn = tk.Button(master=self.frame,
+                        text=btn_text,
+                        height=self.btn_height,
+                        width=self.btn_width,
+                        bg=btn_bg_color,
+                        activebackground=self.btn_active_bg,
+                        font=btn_font,
+                        borderwidth=self.btn_borderwidth)
+        # Mouse left click events are handled by the class binding of
+        # CLICK_TAG, which comes before the default Button bindings.
+        btn.bindtags((str(btn), CLICK_TAG) + btn.bindtags()[1:])
+
+        if btn_text == '=':
+            btn.config(bg=self.btn_equal_bg,
+                       fg=self.btn_equal_fg)
+
+        # Store each button object to the dictionary to access them later.
+        self.buttons_dict.update([(btn_text, btn)])
+
+        return btn
+
+    def bind_keys(self):
+        """
+        Bind the keyboard events of the buttons of the shown keypad.
+
+        All keyboard events are bound to the main window in a single pass,
+        so that the keys follow the keypad shown by show_keypad(): the keys
+        of the buttons which are not part of the shown keypad (e.g. sin on
+        the standard calculator) are unbound. The keys are queued by
+        queue_key_event() and pressed by drain_input().
+
+        Returns:
+            None
+        """
+        bind = self.window.bind
+        # Keys are queued and pressed in batches by drain_input().
+        for btn_text, key_event in self.btn_key_events.items():
+            if btn_text in self.buttons_dict:
+                bind(key_event, self.queue_key_event)
+            else:
+                self.window.unbind(key_event)
+
+        # Bind Enter key additionally which is already assigned for
+        # <KeyPress-equal> event.
+        bind('<Return>', self.queue_key_event)
+
+    def press_key(self, keysym):
+        """
+        Handle a keyboard event given by its keysym.
+
+        With a profiler, the latency of the key is recorded under the name
+        of its callback, the same as for its button (e.g. 'do_plus' for
+        'plus' and 'do_digit_x' for the digits 1 to 9).
+
+        Args:
+            keysym (str): Keysym of the pressed key (e.g. '7', 'plus',
+                'asterisk', 'Return').
+
+        Raises:
+            ValueError: If the keysym is not bound by the calculator.
+
+        Returns:
+            None
+        """
+        if self.profiler is None:
+            return super().press_key(keysym)
+
+        press_key = self.key_wrappers.get(keysym)
+        if press_key is None:
+            if keysym in '123456789' and len(keysym) == 1:
+                name = 'do_digit_x'
+            elif keysym in self.keysym_callbacks:
+                name = self.keysym_callbacks[keysym].__name__
+            else:
+                return super().press_key(keysym)
+            press_key = self.profiler.wrap(name, super().press_key)
+            self.key_wrappers[keysym] = press_key
+        return press_key(keysym)
+
+    def show_keypad(self, calc_class):
+        """
+        Show the keypad of a type of calculator, building it on first use.
+
+        The frame of the shown keypad is hidden with grid_remove(), which
+        keeps its grid options, so showing it again is a single grid() call
+        and no widget is created or destroyed.
+
+        Args:
+            calc_class (type): Either StandardCalc or ScientificCalc class.
+
+        Returns:
+            None
+        """
+        if self.keypads:
+            self.frame.grid_remove()
+
+        keypad = self.keypads.get(calc_class)
+        if keypad is None:
+            # Calling create_frame to create a frame for developer_label and
+            # buttons placement.
+            self.create_frame()
+            # Calling create_developer_label create the developer_label.
+            self.create_developer_label()
+            # calc_type stores object of either StandardCalc or
+            # ScientificCalc class.
+            self.calc_type = calc_class()
+            # Calling create_button create calculator buttons.
+            self.create_buttons()
+            # Both standard and scientific calculator has differnt types of
+            # buttons and buttons layout, so button placement is done by
+            # place_buttons method of respective class.
+            self.calc_type.place_buttons(self)
+            self.keypads[calc_class] = (self.frame, self.calc_type,
+                                        self.buttons_dict, self.error_styles)
+        else:
+            (self.frame, self.calc_type, self.buttons_dict,
+             self.error_styles) = keypad
+            self.frame.grid()
+            self.bind_keys()
+
+        # Only the scientific calculator chains the full precision results of
+        # = and %, the standard calculator the numbers it displays.
+        self.full_precision = isinstance(self.calc_type, ScientificCalc)
+
     def calc_type_switch(self, symbol):
         """
         A callback designed to switch between Standard and Scientific
@@ -428,46 +694,78 @@ class Calculator(CalcOperations):
             - This method performs following functionality.
                 - Set title of the main window depending on selected type of
                   calculator from the menu options.
-                - Depending on type of instance stored inside calc_type
-                  attribute, it resets the calculator's state to its initial
-                  state.
-                - It destroys the frame widget which is master widget for
-                  developer_label and button widgets, then create a new frame
-                  widget object. By destroying frame, it also recursively
-                  destroys all the button and developer_label widget, which
-                  ensures that resources are freed up with the help python
-                  garbadge collector.
-                - Create new developer_label for the calculator.
-                - Set calc_type to the instance of either StandardCalc or
-                  ScientificCalc class depending on the selected calculator
-                  type.
-                - Create new buttons for the specific type calculator.
-                - Places the developer_label and button widgets to the frame
-                  widget.
+                - Cancels the key running in a worker process, if any, and
+                  resets the calculator's state to its initial state.
+                - Hides the keypad of the current calculator and shows the
+                  keypad of the selected one with show_keypad(), which builds
+                  the keypad only the first time it is selected.
 
         Returns:
             None
         """
-        if not isinstance(self.calc_type,
-                          StandardCalc) and symbol == 'stand_calc':
-            self.window.title(self.win_title_st_calc)
+        if symbol == 'stand_calc':
+            calc_class, title = StandardCalc, self.win_title_st_calc
+        elif symbol == 'sci_calc':
+            calc_class, title = ScientificCalc, self.win_title_sci_calc
+        else:
+            return
+
+        if not isinstance(self.calc_type, calc_class):
+            # A key still running in a worker process would restore its
+            # result over the cleared calculator once done.
+            if self.job is not None:
+                self.cancel_job()
+            self.window.title(title)
             self.do_clear()
-            self.frame.destroy()
-            self.create_frame()
-            self.create_developer_label()
-            self.calc_type = StandardCalc()
-            self.create_buttons()
-            self.calc_type.place_buttons(self)
-        elif not isinstance(self.calc_type,
-                            ScientificCalc) and symbol == 'sci_calc':
-            self.window.title(self.win_title_sci_calc)
-            self.do_clear()
-            self.frame.destroy()
-            self.create_frame()
-            self.create_developer_label()
-            self.calc_type = ScientificCalc()
-            self.create_buttons()
-            self.calc_type.place_buttons(self)
+            self.show_keypad(calc_class)
+
+    def show_history(self, event=None):
+        """
+        Open the history search panel, or raise it if it is open.
+
+        The bell rings if the calculator keeps no history.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for history event.
+                Defaults to None.
+
+        Returns:
+            None
+        """
+        if self.history is None:
+            self.window.bell()
+            return None
+
+        if (self.history_panel is not None
+                and self.history_panel.window.winfo_exists()):
+            self.history_panel.window.lift()
+            return None
+
+        from calc_history_panel import HistoryPanel
+
+        self.history_panel = HistoryPanel(self)
+
+    def show_number_theory(self, event=None):
+        """
+        Open the number theory panel, or raise it if it is open.
+
+        Args:
+            event (tk.Event, optional): An event parameter that can be provided
+                when the method is called as a callback for number theory
+                event. Defaults to None.
+
+        Returns:
+            None
+        """
+        if (self.number_panel is not None
+                and self.number_panel.window.winfo_exists()):
+            self.number_panel.window.lift()
+            return None
+
+        from calc_number_panel import NumberPanel
+
+        self.number_panel = NumberPanel(self)
 
     def about_app(self):
         """
@@ -479,6 +777,8 @@ class Calculator(CalcOperations):
         Returns:
             None
         """
+        from tkinter import messagebox
+
         messagebox.showinfo('About',
                             f'{self.app_name}\n'
                             + f'Version: {self.app_ver}\n\n'
@@ -501,11 +801,39 @@ class Calculator(CalcOperations):
         Returns:
             None
         """
+        from tkinter import messagebox
+
         reply = messagebox.askyesno(title='Quit?',
                                     message='Are you sure you want to quit?')
         if reply:
             self.window.destroy()
 
+    def report_startup(self, file=None):
+        """
+        Write the startup timing breakdown.
+
+        It is meant to be scheduled with window.after_idle() before the main
+        loop starts, so the last phase ('first idle') ends when the
+        calculator is ready for the first keystroke.
+
+        Args:
+            file (io.TextIOBase, optional): Stream to write to. Defaults to
+                sys.stderr.
+
+        Returns:
+            None
+        """
+        file = file or sys.stderr
+        self.startup_times.append(('first idle', time.perf_counter()))
+
+        previous = IMPORT_START
+        for phase, timestamp in self.startup_times:
+            print(f'{phase:<12}{(timestamp - previous) * 1e3:>9.2f} ms',
+                  file=file)
+            previous = timestamp
+        print(f"{'total':<12}{(previous - IMPORT_START) * 1e3:>9.2f} ms",
+              file=file)
+
 
 class StandardCalc():
     """
@@ -560,7 +888,8 @@ class StandardCalc():
             btn.grid(row=(self.rows//4),
                      column=self.cols % 4,
                      sticky=calc.stick,
-                     pady=calc.btn_back_pady if btn_text == 'Back' else calc.btn_pady,
+                     pady=(calc.btn_back_pady if btn_text == 'Back'
+                           else calc.btn_pady),
                      padx=calc.btn_padx)
             self.rows += 1
             self.cols += 1
@@ -574,17 +903,17 @@ class ScientificCalc():
     This class defines additional methods required execlusively for Scientific
     calculator not defined in Calculator class.
 
+    The function buttons (sci_btn_texts of CalcOperations class) are placed
+    in SCI_ROWS rows above the buttons of the standard calculator.
+
     Attributes:
         rows (int): Represent row counter for button placement.
         cols (int): Represent column counter for button placement.
-
-    Todo:
-        - Implemention of functionality for Scientific calculator.
-
-    Note:
-        - ScientificCalc class is under development.
     """
 
+    # Number of rows of function buttons.
+    SCI_ROWS = 4
+
     def __init__(self):
         """
         Initialize the ScientificCalc class.
@@ -612,6 +941,8 @@ class ScientificCalc():
         Returns:
             None
         """
+        for btn_text in calc.sci_btn_texts:
+            calc.create_button(btn_text)
 
     def place_buttons(self, calc):
         """
@@ -625,32 +956,120 @@ class ScientificCalc():
             calc (Calculator): An instance of Calculator class.
 
         Note:
-            - This method utilizes the following locally declared temporary
-              variables:
-                - under_develop (tk.Label): Temporary tk.Label widget
-                  representing text that 'Scientific calculator is under
-                  development'. It is placed inside the frame widget of
-                  Calculator class.
+            - This method utilizes the following locally declared variables:
+                - btn_text (str): A string representing button's text from
+                  buttons_dict dictionary of Calculator class.
+                - btn (tk.Button): Button widget object.
+                - row (int): Grid row of the button.
             - These variables are used internally within the method and are
               not exposed to the method's caller.
 
-        Note:
-            - "As the ScientificCalc class is under development, a temporary
-              message 'Scientific calculator is under development' is
-              displayed on the screen when the user selects the Scientific
-              calculator option from the menu."
-
         Returns:
             None
         """
-        under_develop = tk.Label(master=calc.frame,
-                                 text='Scientific calculator\n'
-                                 + 'is under development.',
-                                 bg=calc.win_bg_color,
-                                 font=calc.btn_digit_font,
-                                 width=29, height=13)
-        under_develop.grid(row=1, column=2, padx=(4, 3), pady=(2, 1))
+        # The function buttons take the rows below the developer label.
+        for position, btn_text in enumerate(calc.sci_btn_texts):
+            calc.buttons_dict[btn_text].grid(row=1 + position // 4,
+                                             column=position % 4,
+                                             sticky=calc.stick,
+                                             pady=calc.btn_pady,
+                                             padx=calc.btn_padx)
+
+        # The buttons of the standard calculator are placed as by
+        # StandardCalc class, below the function buttons. Back button stays
+        # next to the developer label.
+        for btn_text, btn in calc.buttons_dict.items():
+            if btn_text in calc.sci_btn_texts:
+                continue
+            row = self.rows // 4
+            if row:
+                row += self.SCI_ROWS
+            btn.grid(row=row,
+                     column=self.cols % 4,
+                     sticky=calc.stick,
+                     pady=(calc.btn_back_pady if btn_text == 'Back'
+                           else calc.btn_pady),
+                     padx=calc.btn_padx)
+            self.rows += 1
+            self.cols += 1
+
 
+def parse_args(argv=None):
+    """
+    Parse the command line arguments.
+
+    argparse is only imported when there are arguments to parse, as
+    importing it takes longer than building the calculator window.
 
-calc = Calculator(StandardCalc)
-calc.window.mainloop()
+    Args:
+        argv (list, optional): Command line arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        argparse.Namespace | types.SimpleNamespace: The parsed arguments.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        from types import SimpleNamespace
+        return SimpleNamespace(profile=False, startup_time=False,
+                               backend=None, precision=None, history=None,
+                               no_history=False)
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Calculator application.')
+    parser.add_argument('--profile', action='store_true',
+                        help='record the latency of the button and key '
+                             'callbacks and print it on exit')
+    parser.add_argument('--startup-time', action='store_true',
+                        help='print the import and startup timing breakdown')
+    parser.add_argument('--backend', choices=('float', 'decimal', 'fraction'),
+                        help='numeric backend of the calculations (default: '
+                             'decimal)')
+    parser.add_argument('--precision', type=int, metavar='DIGITS',
+                        help='significant digits of the decimal calculations '
+                             '(default: 28); the slow operations of a high '
+                             'precision run in a worker process')
+    parser.add_argument('--history', metavar='PATH',
+                        help='history file of the calculations (default: '
+                             '~/.calc_history)')
+    parser.add_argument('--no-history', action='store_true',
+                        help='do not keep a history of the calculations')
+    args = parser.parse_args(argv)
+    if args.precision is not None and args.precision < 1:
+        parser.error('--precision must be at least 1')
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    profiler = None
+    if args.profile:
+        from calc_profiler import CallbackProfiler
+        profiler = CallbackProfiler()
+
+    history = None
+    if not args.no_history:
+        from calc_history import History, default_history_path
+        try:
+            history = History(args.history or default_history_path())
+        except (OSError, ValueError) as error:
+            print(f'History disabled: {error}', file=sys.stderr)
+
+    context = None
+    if args.precision is not None:
+        from calc_backends import make_context
+        context = make_context(precision=args.precision)
+
+    calc = Calculator(StandardCalc, profiler=profiler, backend=args.backend,
+                      history=history, context=context)
+    if args.startup_time:
+        calc.window.after_idle(calc.report_startup)
+    calc.window.mainloop()
+
+    if history is not None:
+        history.close()
+
+    if calc.profiler is not None:
+        calc.profiler.report()